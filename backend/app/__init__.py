@@ -1,6 +1,144 @@
-from flask import Flask
+import functools
+import inspect
+from flask import Flask, Response, g, request
 from flask_cors import CORS
 from app.routes.api import api_bp
+from app.utils import compression, metrics, profiling
+from app.utils.dymension_cli import STREAMABLE_COMMANDS
+from app.utils.json_utils import json_provider
+
+# Endpoints listed on the root page
+ENDPOINTS = [
+    {'path': '/api/ping', 'method': 'GET', 'description': 'Health check endpoint'},
+    {'path': '/api/dymension/command', 'method': 'POST', 'description': 'Execute Dymension CLI commands'},
+    {'path': '/api/dymension/stream', 'method': 'POST', 'description': 'Stream Dymension CLI command output as Server-Sent Events'},
+    {'path': '/api/dymension/batch', 'method': 'POST', 'description': 'Run many read-only Dymension queries in one request'},
+    {'path': '/api/dymension/help', 'method': 'GET', 'description': 'Get help for Dymension CLI commands'},
+    {'path': '/api/strategy/signals', 'method': 'GET', 'description': 'Momentum strategy signals as JSON or compact float32 columns'},
+    {'path': '/api/strategy/scan', 'method': 'GET', 'description': 'Symbols whose last bar is a moving average crossover'},
+    {'path': '/api/market/bars', 'method': 'GET', 'description': 'Price bars of a symbol since a timestamp, ingested incrementally'},
+    {'path': '/metrics', 'method': 'GET', 'description': 'Request latency and throughput metrics (Prometheus text format)'},
+]
+
+# Content type of the Prometheus text exposition format
+METRICS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Settings of both create_app and create_asgi_app, before test_config
+DEFAULT_CONFIG = {
+    'SECRET_KEY': 'dev',
+    'DEBUG': True,
+    'DYMENSION_BATCH_PARALLELISM': 8,
+    'DYMENSION_BATCH_MAX_ITEMS': 100,
+    # /api/dymension/stream runs CLI commands, so it is off unless enabled
+    # and only accepts commands starting with one of these prefixes
+    'DYMENSION_STREAM_ENABLED': False,
+    'DYMENSION_STREAM_COMMANDS': STREAMABLE_COMMANDS,
+    # Each scanned symbol may cost a download and a read of its bars
+    'STRATEGY_SCAN_MAX_SYMBOLS': 500,
+    # "auto" uses orjson when installed, "json" the standard library encoder
+    'JSON_ENCODER': 'auto',
+    # Responses smaller than this are sent uncompressed
+    'COMPRESS_MIN_SIZE': 1024,
+}
+
+# Request hooks of both apps; each factory registers them with its own request and g
+
+def request_route(request):
+    """Return the URL rule that matched a request, so metrics are labelled per route, not per URL."""
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+def start_request(request, g):
+    """Start timing a request, and let it opt into profiling with the X-Dymension-Profile header."""
+    g.metrics_start = metrics.request_started()
+    profiling.request_mode.set(profiling.mode_from_headers(request.headers))
+
+def record_request_metrics(request, g, response, streamed=False):
+    """Record the latency and status of a request.
+
+    A streamed body (the SSE stream of /api/dymension/stream) is only sent after
+    the request hooks ran. For it, nothing is recorded yet: the returned callback,
+    to be run when the body closes, records the request and takes it out of the
+    in-flight gauge, and close_request_metrics leaves the request alone.
+    """
+    finished = functools.partial(
+        metrics.request_finished, g.metrics_start, request_route(request), request.method, response.status_code)
+    if not streamed:
+        finished()
+        return None
+    g.metrics_streamed = True
+
+    def body_closed():
+        finished()
+        metrics.request_closed()
+    return body_closed
+
+def close_request_metrics(g):
+    """Count a request as finished in the in-flight gauge, unless its body is still streaming."""
+    if 'metrics_start' in g and not g.get('metrics_streamed'):
+        metrics.request_closed()
+
+def compression_encoding(request, response):
+    """Return the encoding to compress a response with, or None to send it as it is."""
+    if not compression.is_compressible(response):
+        return None
+    response.vary.add('Accept-Encoding')
+    return compression.negotiate(request.accept_encodings)
+
+def compress_body(config, response, data, encoding):
+    """Replace the body of a response by its encoded form, unless it is too small to be worth it."""
+    if len(data) >= config['COMPRESS_MIN_SIZE']:
+        compression.set_encoded_body(response, compression.compress(data, encoding), encoding)
+
+async def call_on_close(body, callback):
+    """Yield the chunks of a Quart response body, then run callback once the body is closed."""
+    try:
+        async with body as chunks:
+            async for chunk in chunks:
+                yield chunk
+    finally:
+        callback()
+
+def home_page(endpoints):
+    """Render the root page listing the available endpoints."""
+    # Create HTML response
+    html = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Dymension RollApp CLI Backend API</title>
+        <style>
+            body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+            h1 { color: #333; }
+            ul { list-style-type: none; padding: 0; }
+            li { margin-bottom: 10px; padding: 10px; background-color: #f4f4f4; border-radius: 5px; }
+            .method { display: inline-block; width: 60px; font-weight: bold; }
+            .path { color: #0066cc; font-family: monospace; }
+        </style>
+    </head>
+    <body>
+        <h1>Dymension RollApp CLI Backend API</h1>
+        <p>Welcome to the Dymension RollApp CLI Backend API. The following endpoints are available:</p>
+        <ul>
+    """
+
+    # Add each endpoint to the HTML
+    for endpoint in endpoints:
+        html += f"""
+            <li>
+                <span class="method">{endpoint['method']}</span>
+                <span class="path">{endpoint['path']}</span>
+                <p>{endpoint['description']}</p>
+            </li>
+        """
+
+    html += """
+        </ul>
+        <p>For more information, please refer to the documentation.</p>
+    </body>
+    </html>
+    """
+
+    return html
 
 def create_app(test_config=None):
     """Create and configure the Flask application instance"""
@@ -12,65 +150,111 @@ def create_app(test_config=None):
     CORS(app)
     
     # Configure settings
-    app.config.from_mapping(
-        SECRET_KEY='dev',
-        DEBUG=True
-    )
+    app.config.from_mapping(DEFAULT_CONFIG)
     
     if test_config is not None:
         app.config.from_mapping(test_config)
     
+    # Encode (and time) JSON responses with the configured encoder
+    app.json = json_provider(app)
+    
     # Register API blueprint
     app.register_blueprint(api_bp, url_prefix='/api')
     
+    # Record latency, status and in-flight count of every request
+    @app.before_request
+    def before_request():
+        start_request(request, g)
+    
+    @app.after_request
+    def after_request(response):
+        # Generated bodies, like the SSE stream; Flask also marks error pages rendered through WSGI as streamed
+        body_closed = record_request_metrics(request, g, response, inspect.isgenerator(response.response))
+        if body_closed is not None:
+            response.call_on_close(body_closed)
+        # Compress responses for clients that accept gzip (or brotli, when installed)
+        encoding = compression_encoding(request, response)
+        if encoding is not None and not (response.is_streamed or response.direct_passthrough):
+            compress_body(app.config, response, response.get_data(), encoding)
+        return response
+    
+    @app.teardown_request
+    def teardown_request(exc):
+        close_request_metrics(g)
+    
+    @app.route('/metrics')
+    def metrics_endpoint():
+        return Response(metrics.registry.render(), mimetype=METRICS_MIMETYPE)
+    
     # Define root route
     @app.route('/')
     def home():
-        # List of available endpoints for documentation
-        endpoints = [
-            {'path': '/api/ping', 'method': 'GET', 'description': 'Health check endpoint'},
-            {'path': '/api/dymension/command', 'method': 'POST', 'description': 'Execute Dymension CLI commands'},
-            {'path': '/api/dymension/help', 'method': 'GET', 'description': 'Get help for Dymension CLI commands'},
-        ]
-        
-        # Create HTML response
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Dymension RollApp CLI Backend API</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
-                h1 { color: #333; }
-                ul { list-style-type: none; padding: 0; }
-                li { margin-bottom: 10px; padding: 10px; background-color: #f4f4f4; border-radius: 5px; }
-                .method { display: inline-block; width: 60px; font-weight: bold; }
-                .path { color: #0066cc; font-family: monospace; }
-            </style>
-        </head>
-        <body>
-            <h1>Dymension RollApp CLI Backend API</h1>
-            <p>Welcome to the Dymension RollApp CLI Backend API. The following endpoints are available:</p>
-            <ul>
-        """
-        
-        # Add each endpoint to the HTML
-        for endpoint in endpoints:
-            html += f"""
-                <li>
-                    <span class="method">{endpoint['method']}</span>
-                    <span class="path">{endpoint['path']}</span>
-                    <p>{endpoint['description']}</p>
-                </li>
-            """
-        
-        html += """
-            </ul>
-            <p>For more information, please refer to the documentation.</p>
-        </body>
-        </html>
-        """
-        
-        return html
+        return home_page(ENDPOINTS)
     
-    return app
\ No newline at end of file
+    return app
+
+def create_asgi_app(test_config=None):
+    """Create the ASGI (Quart) variant of the application.
+
+    Serves the same API as create_app, but its handlers are coroutines that
+    await CLI subprocesses and Secret AI responses instead of holding a
+    worker thread. Run it with several workers, e.g.:
+
+        hypercorn asgi:app --workers 4 --bind 0.0.0.0:5000
+    """
+    from quart import Quart, Response as QuartResponse, g as quart_g, request as quart_request
+    from quart.wrappers.response import DataBody, IterableBody
+    from app.routes.asgi_api import asgi_api_bp
+
+    app = Quart(__name__, instance_relative_config=True)
+
+    # Streams last as long as the command; command_timeout bounds them instead
+    app.config.from_mapping(DEFAULT_CONFIG, RESPONSE_TIMEOUT=None)
+
+    if test_config is not None:
+        app.config.from_mapping(test_config)
+
+    app.json = json_provider(app)
+
+    # Same permissive CORS policy flask_cors applies to the WSGI app
+    @app.after_request
+    async def add_cors_headers(response):
+        response.headers.setdefault('Access-Control-Allow-Origin', '*')
+        response.headers.setdefault('Access-Control-Allow-Headers', 'Content-Type, If-None-Match')
+        response.headers.setdefault('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        return response
+
+    app.register_blueprint(asgi_api_bp, url_prefix='/api')
+
+    # The same hooks as create_app; coroutines, so they run in the request's context
+    @app.before_request
+    async def before_request():
+        start_request(quart_request, quart_g)
+
+    @app.after_request
+    async def after_request(response):
+        body_closed = record_request_metrics(
+            quart_request, quart_g, response, isinstance(response.response, IterableBody))
+        if body_closed is not None:
+            response.response = IterableBody(call_on_close(response.response, body_closed))
+        encoding = compression_encoding(quart_request, response)
+        # Only bodies held in memory; streamed and file bodies pass through
+        if encoding is not None and isinstance(response.response, DataBody):
+            compress_body(app.config, response, await response.get_data(), encoding)
+        return response
+
+    @app.teardown_request
+    async def teardown_request(exc):
+        close_request_metrics(quart_g)
+
+    @app.route('/metrics')
+    async def metrics_endpoint():
+        return QuartResponse(metrics.registry.render(), mimetype=METRICS_MIMETYPE)
+
+    @app.route('/')
+    async def home():
+        return home_page(ENDPOINTS + [
+            {'path': '/api/chat', 'method': 'POST', 'description': 'Chat with the Secret AI trading assistant'},
+        ])
+
+    return app
@@ -4,6 +4,7 @@ from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import MinMaxScaler
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 import math
+from app.utils.profiling import profiled
 
 class SKModel:
     def __init__(self, n_estimators=100, max_depth=10, random_state=42):
@@ -104,6 +105,7 @@ class SKModel:
         
         return df
 
+    @profiled("SKModel.train")
     def train(self, data):
         """Train the RandomForest model on price data.
         
@@ -0,0 +1,138 @@
+from quart import Blueprint, Response, current_app, jsonify, request
+import asyncio
+import traceback
+from datetime import datetime
+# Share the Dymension CLI handler (and its caches) with the WSGI routes
+from app.routes.api import dym_cli
+from app.routes.common import (
+    SSE_HEADERS, RequestError, batch_params, bars_body, build_help_responses, call_or_error, command_result,
+    help_response, scan_symbols_param, signals_response, since_param, sse_event, stream_args, symbol_param,
+    window_params
+)
+from app.utils.profiling import profiled
+from app.utils.scanner import scan_symbols
+from app.utils.trading_strategy import fetch_bars_since, fetch_stock_data, momentum_trading_strategy
+
+# Async counterpart of app.routes.api.api_bp, served by create_asgi_app. The
+# request handling lives in app.routes.common; these routes only await it.
+asgi_api_bp = Blueprint('api', __name__)
+
+# Created on first use: connecting to Secret AI needs credentials and network access
+_chat_agent = None
+
+def get_chat_agent():
+    """Return the shared SecretChatAgent, creating it on first use."""
+    global _chat_agent
+    if _chat_agent is None:
+        from app.utils.ai_utils import SecretChatAgent
+        _chat_agent = SecretChatAgent()
+    return _chat_agent
+
+asgi_api_bp.record_once(build_help_responses)
+
+@asgi_api_bp.route("/ping", methods=["GET"])
+async def ping():
+    """Health check endpoint"""
+    return jsonify({
+        "status": "ok",
+        "timestamp": datetime.now().isoformat(),
+        "version": "1.0.0",
+        "binaries": dym_cli.binaries.info()
+    })
+
+@asgi_api_bp.route("/dymension/command", methods=["POST"])
+@profiled("dymension_command")
+async def dymension_command():
+    """Execute Dymension CLI commands based on natural language description."""
+    return jsonify(command_result(dym_cli, request.is_json, await request.get_json(silent=True)))
+
+@asgi_api_bp.route("/dymension/stream", methods=["POST"])
+async def dymension_stream():
+    """Run an allowlisted dymd/roller command and stream its output as Server-Sent Events."""
+    args = stream_args(current_app.config, await request.get_json(silent=True))
+
+    async def generate():
+        async for event, payload in dym_cli.stream_command_async(args):
+            yield sse_event(event, payload).encode("utf-8")
+
+    return Response(generate(), mimetype="text/event-stream", headers=SSE_HEADERS)
+
+@asgi_api_bp.route("/dymension/batch", methods=["POST"])
+async def dymension_batch():
+    """Run a list of read-only Dymension queries concurrently."""
+    commands, parallelism = batch_params(current_app.config, await request.get_json(silent=True))
+    return jsonify({
+        "status": "success",
+        "results": await dym_cli.run_batch_async(commands, parallelism)
+    })
+
+@asgi_api_bp.route("/dymension/help", methods=["GET"])
+async def dymension_help():
+    """Provide help information for Dymension CLI commands, with ETag revalidation."""
+    response = help_response(current_app.extensions["dymension_help"], request.args, Response)
+    return await response.make_conditional(request)
+
+@asgi_api_bp.route("/strategy/signals", methods=["GET"])
+async def strategy_signals():
+    """Momentum strategy signals for a symbol, as float32 columns or columnar JSON."""
+    symbol = symbol_param(request.args)
+    data = await asyncio.to_thread(call_or_error, fetch_stock_data, symbol, request.args.get("timeframe", "1M"),
+                                   request.args.get("interval", "hour"))
+    signals = call_or_error(momentum_trading_strategy, data, **window_params(request.args))
+    return signals_response(symbol, signals, request.accept_mimetypes, Response, jsonify)
+
+@asgi_api_bp.route("/strategy/scan", methods=["GET"])
+async def strategy_scan():
+    """Symbols whose last bar is a momentum strategy crossover, scanned in one vectorized pass."""
+    symbols = scan_symbols_param(current_app.config, request.args)
+    return jsonify(await asyncio.to_thread(
+        call_or_error,
+        scan_symbols,
+        symbols,
+        request.args.get("timeframe", "1M"),
+        request.args.get("interval", "hour"),
+        **window_params(request.args)
+    ))
+
+@asgi_api_bp.route("/market/bars", methods=["GET"])
+async def market_bars():
+    """Stored bars of a symbol at or after the ``since`` timestamp, after ingesting new ones."""
+    symbol = symbol_param(request.args)
+    since = since_param(request.args)
+    bars = await asyncio.to_thread(call_or_error, fetch_bars_since, symbol, request.args.get("interval", "hour"), since)
+    return jsonify(bars_body(symbol, bars))
+
+@asgi_api_bp.route("/chat", methods=["POST"])
+async def chat():
+    """Answer a chat message with Secret AI without blocking other requests."""
+    data = await request.get_json(silent=True)
+    if not isinstance(data, dict) or not data.get("message"):
+        return jsonify({
+            "status": "error",
+            "error": "Missing 'message' parameter"
+        }), 400
+
+    try:
+        agent = await asyncio.to_thread(get_chat_agent)
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": f"Chat is unavailable: {str(e)}"
+        }), 503
+
+    result = await agent.get_response(data["message"], data.get("session_id", "default"))
+    return jsonify({"status": "success", **result})
+
+@asgi_api_bp.errorhandler(RequestError)
+async def handle_request_error(e):
+    """Answer a request that cannot be served with its JSON error body"""
+    return jsonify(e.body), e.status_code
+
+@asgi_api_bp.errorhandler(Exception)
+async def handle_exception(e):
+    """Global exception handler for API routes"""
+    return jsonify({
+        "status": "error",
+        "message": str(e),
+        "traceback": traceback.format_exc()
+    }), 500
@@ -0,0 +1,172 @@
+import json
+import traceback
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+import pandas as pd
+from app.utils.command_catalog import serialize_catalog
+from app.utils.dymension_cli import DymensionCLI, command_response, parse_stream_args
+from app.utils.json_utils import clean_for_json
+from app.utils.signal_format import SIGNALS_F32_MIMETYPE, encode_signals, prefers_f32
+
+# Request parsing and validation shared by the WSGI (api) and ASGI
+# (asgi_api) blueprints. Helpers take the parts of a request that were
+# already read (JSON body, query args, app config), so both frameworks call
+# them the same way, and raise RequestError for a request that cannot be
+# served; each blueprint turns it into a JSON error response.
+
+# Headers of Server-Sent Events responses
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+
+class RequestError(Exception):
+    """A request that cannot be served, with the JSON error body to answer it with."""
+
+    def __init__(self, error: str, status_code: int = 400, cli: bool = False):
+        """Initialize the error.
+
+        Args:
+            error: Error message
+            status_code: HTTP status code of the response
+            cli: Whether the body has the "output" field of CLI command results
+        """
+        super().__init__(error)
+        self.status_code = status_code
+        self.body = {"status": "error", "output": "", "error": error} if cli else {"status": "error", "error": error}
+
+def build_help_responses(state) -> None:
+    """Serialize the help catalog once per app, for the full list and each category."""
+    state.app.extensions["dymension_help"] = serialize_catalog(state.app.json.dumps)
+
+def command_result(dym_cli: DymensionCLI, is_json: bool, data) -> Dict:
+    """Translate and run the natural language command of a /dymension/command body."""
+    if not is_json:
+        raise RequestError("Request must be in JSON format", cli=True)
+    if not isinstance(data, dict) or "command" not in data:
+        raise RequestError("Missing 'command' parameter", cli=True)
+    try:
+        return command_response(dym_cli.parse_command(data["command"]))
+    except Exception as e:
+        traceback.print_exc()
+        raise RequestError(str(e), 500, cli=True)
+
+def stream_args(config: Mapping, data) -> List[str]:
+    """Return the arguments of the command a /dymension/stream body asks to run.
+
+    Raises:
+        RequestError: 403 if streaming is disabled, 400 if the command is
+            missing or not in DYMENSION_STREAM_COMMANDS
+    """
+    if not config["DYMENSION_STREAM_ENABLED"]:
+        raise RequestError("Command streaming is disabled", 403, cli=True)
+    command = (data or {}).get("command")
+    if not command:
+        raise RequestError("Missing 'command' parameter", cli=True)
+    try:
+        return parse_stream_args(command, config["DYMENSION_STREAM_COMMANDS"])
+    except ValueError as e:
+        raise RequestError(str(e), cli=True)
+
+def sse_event(event: str, payload) -> str:
+    """Format one stream_command event as a Server-Sent Event."""
+    data = json.dumps(payload) if event == "status" else payload
+    return f"event: {event}\ndata: {data}\n\n"
+
+def batch_params(config: Mapping, data) -> Tuple[list, int]:
+    """Return the (commands, parallelism) of a /dymension/batch body."""
+    if not isinstance(data, dict) or not isinstance(data.get("commands"), list):
+        raise RequestError("Request must be JSON with a 'commands' list", cli=True)
+
+    commands = data["commands"]
+    max_items = config["DYMENSION_BATCH_MAX_ITEMS"]
+    if len(commands) > max_items:
+        raise RequestError(f"Batch is limited to {max_items} commands", cli=True)
+
+    max_parallelism = config["DYMENSION_BATCH_PARALLELISM"]
+    try:
+        parallelism = min(int(data.get("parallelism", max_parallelism)), max_parallelism)
+    except (TypeError, ValueError):
+        parallelism = max_parallelism
+    return commands, parallelism
+
+def help_response(responses: Dict, args: Mapping, response_class):
+    """Return the help catalog response of the requested category, with a strong ETag.
+
+    Args:
+        responses: Serialized catalog per category, from serialize_catalog
+        args: Query arguments
+        response_class: Response class of the framework
+
+    Returns:
+        Response to make conditional on the request
+    """
+    category = args.get("category", "").lower()
+    if category not in responses:
+        raise RequestError(f"Unknown category: {args['category']}", 404)
+
+    body, etag = responses[category]
+    response = response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response
+
+def window_params(args: Mapping) -> Dict[str, int]:
+    """Return the short_window and long_window query arguments."""
+    return {
+        "short_window": args.get("short_window", 5, type=int),
+        "long_window": args.get("long_window", 20, type=int)
+    }
+
+def symbol_param(args: Mapping) -> str:
+    """Return the required symbol query argument."""
+    symbol = args.get("symbol")
+    if not symbol:
+        raise RequestError("Missing 'symbol' parameter")
+    return symbol
+
+def scan_symbols_param(config: Mapping, args: Mapping) -> List[str]:
+    """Return the comma-separated symbols to scan, at most STRATEGY_SCAN_MAX_SYMBOLS."""
+    symbols = [symbol.strip() for symbol in args.get("symbols", "").split(",") if symbol.strip()]
+    if not symbols:
+        raise RequestError("Missing 'symbols' parameter")
+
+    max_symbols = config["STRATEGY_SCAN_MAX_SYMBOLS"]
+    if len(symbols) > max_symbols:
+        raise RequestError(f"Scans are limited to {max_symbols} symbols")
+    return symbols
+
+def since_param(args: Mapping) -> Optional[pd.Timestamp]:
+    """Return the optional since query argument as a timestamp."""
+    try:
+        return pd.Timestamp(args["since"]) if args.get("since") else None
+    except ValueError:
+        raise RequestError(f"Invalid 'since' timestamp: {args['since']}")
+
+def call_or_error(func: Callable, *args, **kwargs):
+    """Call func, turning any exception into a 500 RequestError."""
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        raise RequestError(str(e), 500)
+
+def signals_response(symbol: str, signals: pd.DataFrame, accept_mimetypes, response_class, jsonify):
+    """Return signals as float32 columns if the client prefers them, as columnar JSON otherwise."""
+    if prefers_f32(accept_mimetypes):
+        response = response_class(encode_signals(signals), mimetype=SIGNALS_F32_MIMETYPE)
+    else:
+        response = jsonify({
+            "status": "success",
+            "symbol": symbol,
+            "signals": clean_for_json(signals)
+        })
+    response.vary.add("Accept")
+    return response
+
+def bars_body(symbol: str, bars: pd.DataFrame) -> Dict:
+    """Return the /market/bars response body."""
+    return {
+        "status": "success",
+        "symbol": symbol,
+        "bars": clean_for_json(bars)
+    }
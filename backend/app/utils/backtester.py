@@ -0,0 +1,148 @@
+from typing import Dict, Optional, Union
+import numpy as np
+import pandas as pd
+from app.utils.crossover_engine import moving_averages
+
+def price_returns(prices: np.ndarray) -> np.ndarray:
+    """Per-bar returns of prices along the last axis; 0 for the first bar and around missing prices."""
+    prices = np.asarray(prices, dtype=np.float64)
+    returns = np.zeros(prices.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(prices[..., 1:], prices[..., :-1], out=returns[..., 1:])
+    returns[..., 1:] -= 1.0
+    returns[~np.isfinite(returns)] = 0.0
+    return returns
+
+def strategy_returns(prices: np.ndarray, signals: np.ndarray) -> np.ndarray:
+    """Per-bar returns of holding the asset while the previous bar's signal is 1.
+
+    Args:
+        prices: Array of prices, broadcastable to signals
+        signals: Array of 0.0/1.0 signals, time on the last axis
+
+    Returns:
+        Array shaped like signals; the first bar's return is 0
+    """
+    returns = price_returns(prices)
+    held = np.zeros(np.broadcast_shapes(np.shape(signals), returns.shape))
+    np.multiply(signals[..., :-1], returns[..., 1:], out=held[..., 1:])
+    return held
+
+def sharpe_ratio(returns: np.ndarray, periods_per_year: int = 252) -> np.ndarray:
+    """Annualized Sharpe ratio (risk-free rate 0) along the last axis; 0 when returns do not vary."""
+    if returns.shape[-1] < 2:
+        return np.zeros(returns.shape[:-1])
+    std = returns.std(axis=-1, ddof=1)
+    ratio = np.divide(returns.mean(axis=-1), std, out=np.zeros_like(std), where=std > 0)
+    return ratio * np.sqrt(periods_per_year)
+
+def performance_stats(returns: np.ndarray, periods_per_year: int = 252) -> Dict[str, np.ndarray]:
+    """Total return, annualized Sharpe ratio and maximum drawdown along the last axis.
+
+    Args:
+        returns: Array of per-bar returns, time on the last axis
+        periods_per_year: Bars per year, e.g. 252 for daily stock bars
+
+    Returns:
+        Dict of arrays shaped like returns without its last axis. max_drawdown
+        is the largest peak-to-trough fall of the equity curve, as a negative
+        fraction.
+    """
+    equity = np.cumprod(1.0 + returns, axis=-1)
+    peaks = np.maximum.accumulate(np.maximum(equity, 1.0), axis=-1)
+    return {
+        "total_return": equity[..., -1] - 1.0,
+        "sharpe": sharpe_ratio(returns, periods_per_year),
+        "max_drawdown": (equity / peaks - 1.0).min(axis=-1, initial=0.0)
+    }
+
+def backtest(prices: np.ndarray, signals: np.ndarray, initial_capital: float = 10000.0,
+             commission: float = 0.0, slippage: float = 0.0, position_size: Union[float, np.ndarray] = 1.0,
+             target_volatility: Optional[float] = None, volatility_window: int = 20, max_leverage: float = 1.0,
+             periods_per_year: int = 252) -> Dict:
+    """Backtest long/flat signals, for one strategy or a batch of them at once.
+
+    A signal of 1 at a bar's close puts position_size of equity into the
+    asset at that close, held until the signal returns to 0. Every change of
+    exposure costs commission + slippage times the traded fraction of equity.
+    All bars, and every strategy of a batch, are computed in array
+    operations.
+
+    Args:
+        prices: Array of close prices, time on the last axis, broadcastable to signals
+            (e.g. shape (bars,) for signals of shape (strategies, bars))
+        signals: Array of 0.0/1.0 signals, e.g. CrossoverGrid.signals or momentum_trading_strategy's 'signal'
+        initial_capital: Starting equity
+        commission: Commission per trade, as a fraction of the traded value (0.001 = 10 bps)
+        slippage: Slippage per trade, as a fraction of the traded value
+        position_size: Fraction of equity invested while the signal is 1; a scalar
+            or an array broadcastable to signals without its last axis
+        target_volatility: If set, scale positions so the asset's recent annualized
+            volatility times the exposure matches it, up to max_leverage
+        volatility_window: Bars of returns used to estimate volatility
+        max_leverage: Largest exposure volatility targeting may take
+        periods_per_year: Bars per year, e.g. 252 for daily stock bars
+
+    Returns:
+        Dict with:
+            returns: Net per-bar returns, shaped like signals
+            equity: Equity curve, shaped like signals
+            exposure: Fraction of equity held after each bar's close
+            stats: Dict of arrays, one value per strategy: total_return,
+                annual_return, annual_volatility, sharpe, sortino,
+                max_drawdown, calmar, trades, exposure and costs
+    """
+    signals = np.nan_to_num(np.asarray(signals, dtype=np.float64))
+    returns = price_returns(prices)
+
+    exposure = signals * np.expand_dims(np.asarray(position_size, dtype=np.float64), -1)
+    if target_volatility:
+        variance = moving_averages(returns ** 2, [volatility_window])[0]
+        volatility = np.sqrt(variance * periods_per_year)
+        scale = np.divide(target_volatility, volatility, out=np.zeros(volatility.shape), where=volatility > 0)
+        exposure = exposure * np.minimum(scale, max_leverage)
+    exposure = np.broadcast_to(exposure, np.broadcast_shapes(exposure.shape, returns.shape))
+
+    # Exposure set at bar t's close earns bar t + 1's return; trades pay costs on the bar they happen
+    net = np.zeros(exposure.shape)
+    np.multiply(exposure[..., :-1], returns[..., 1:], out=net[..., 1:])
+    costs = np.abs(np.diff(exposure, axis=-1, prepend=0.0)) * (commission + slippage)
+    net -= costs
+    equity = initial_capital * np.cumprod(1.0 + net, axis=-1)
+
+    bars = net.shape[-1]
+    stats = performance_stats(net, periods_per_year)
+    downside = np.sqrt(np.mean(np.minimum(net, 0.0) ** 2, axis=-1))
+    drawdown = np.abs(stats["max_drawdown"])
+    annual_return = np.power(np.maximum(1.0 + stats["total_return"], 0.0), periods_per_year / max(bars, 1)) - 1.0
+    stats.update({
+        "annual_return": annual_return,
+        "annual_volatility": net.std(axis=-1, ddof=1) * np.sqrt(periods_per_year) if bars > 1 else np.zeros(net.shape[:-1]),
+        "sortino": np.divide(net.mean(axis=-1), downside, out=np.zeros(downside.shape), where=downside > 0)
+                   * np.sqrt(periods_per_year),
+        "calmar": np.divide(annual_return, drawdown, out=np.zeros(drawdown.shape), where=drawdown > 0),
+        "trades": np.count_nonzero(np.diff(signals, axis=-1, prepend=0.0), axis=-1),
+        "exposure": np.mean(exposure != 0, axis=-1),
+        "costs": costs.sum(axis=-1)
+    })
+    return {"returns": net, "equity": equity, "exposure": exposure, "stats": stats}
+
+def backtest_signals(signals: pd.DataFrame, **kwargs) -> Dict:
+    """Backtest the output of momentum_trading_strategy.
+
+    Args:
+        signals: DataFrame with 'price' and 'signal' columns
+        **kwargs: Options of backtest, e.g. commission=0.001
+
+    Returns:
+        Dict with:
+            curve: DataFrame of equity, returns and exposure per bar
+            stats: Dict of performance stats (see backtest)
+    """
+    result = backtest(signals['price'].to_numpy(), signals['signal'].to_numpy(), **kwargs)
+    curve = pd.DataFrame({
+        'equity': result['equity'],
+        'returns': result['returns'],
+        'exposure': result['exposure']
+    }, index=signals.index)
+    return {"curve": curve, "stats": {key: value.item() for key, value in result["stats"].items()}}
@@ -0,0 +1,128 @@
+import os
+import shutil
+import subprocess
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+def find_binary(binary_name: str) -> str:
+    """Find the full path to a binary, checking common installation locations."""
+    # First check if it's in PATH
+    path = shutil.which(binary_name)
+    if path:
+        return path
+
+    # Check common installation locations
+    common_locations = [
+        os.path.expanduser(f"~/.roller/bin/{binary_name}"),
+        os.path.expanduser(f"~/go/bin/{binary_name}"),
+        os.path.expanduser(f"~/dymension/bin/{binary_name}"),
+        f"/usr/local/bin/{binary_name}",
+        f"/usr/bin/{binary_name}"
+    ]
+
+    for location in common_locations:
+        if os.path.exists(location) and os.access(location, os.X_OK):
+            return location
+
+    # Return the binary name and let the OS try to find it
+    return binary_name
+
+def run_version(args: List[str]) -> Dict:
+    """Run a version command and return a run_command style result dict."""
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError) as e:
+        return {"status": "error", "output": "", "error": str(e)}
+    if result.returncode != 0:
+        return {
+            "status": "error",
+            "output": "",
+            "error": result.stderr or f"Command failed with exit code {result.returncode}"
+        }
+    return {"status": "success", "output": result.stdout.strip(), "error": ""}
+
+class BinaryRegistry:
+    """Resolved paths and versions of the CLI binaries.
+
+    Each binary is located and its version probed once. Later lookups only
+    stat the file: the version is probed again when the file's mtime changes,
+    and the path is resolved again when the file disappears or was never
+    found. Looking up info never starts a process otherwise.
+    """
+
+    def __init__(self, names: Sequence[str] = ("dymd", "roller"),
+                 run: Optional[Callable[[List[str]], Dict]] = None):
+        """Resolve every binary and record its version.
+
+        Args:
+            names: Binary names to manage
+            run: Function running a command and returning a result dict,
+                used to probe "<path> version"
+        """
+        self._run = run or run_version
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        for name in names:
+            self._entries[name] = self._probe(name, find_binary(name))
+
+    def _probe(self, name: str, path: str) -> Dict:
+        """Record the path, mtime and version of a binary."""
+        mtime = self._mtime(path)
+        return {
+            "path": path,
+            "found": mtime is not None,
+            "mtime": mtime,
+            "version": self._run([path, "version"]) if mtime is not None else {
+                "status": "error",
+                "output": "",
+                "error": f"{name} binary not found"
+            }
+        }
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[float]:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _current(self, name: str) -> Dict:
+        """Return the entry for a binary, revalidating it if the file changed."""
+        with self._lock:
+            entry = self._entries[name]
+            mtime = self._mtime(entry["path"])
+            if mtime is None:
+                # Missing or never found: look for it again, which needs no process
+                path = find_binary(name)
+                if path != entry["path"] or entry["found"]:
+                    entry = self._entries[name] = self._probe(name, path)
+            elif mtime != entry["mtime"]:
+                entry = self._entries[name] = self._probe(name, entry["path"])
+            return entry
+
+    def path(self, name: str) -> str:
+        """Return the resolved path of a binary (its bare name if not found)."""
+        return self._current(name)["path"]
+
+    def mtime(self, name: str) -> Optional[float]:
+        """Return the modification time of a binary (None if not found)."""
+        return self._current(name)["mtime"]
+
+    def version(self, name: str) -> Dict:
+        """Return the recorded "<binary> version" result for a binary."""
+        return dict(self._current(name)["version"])
+
+    def info(self) -> Dict[str, Dict]:
+        """Return path, mtime and version output of every binary."""
+        info = {}
+        for name in self._entries:
+            entry = self._current(name)
+            version = entry["version"]
+            info[name] = {
+                "path": entry["path"],
+                "found": entry["found"],
+                "mtime": entry["mtime"],
+                "version": version["output"] if version["status"] == "success" else None,
+                "error": version.get("error", "")
+            }
+        return info
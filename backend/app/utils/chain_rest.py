@@ -0,0 +1,111 @@
+from typing import Dict, List, Optional
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
+
+# dymd query commands answered by the node's REST (gRPC gateway) API, as
+# (subcommand words, number of positional arguments, path template)
+REST_QUERY_ROUTES = [
+    (("query", "bank", "balances"), 1, "/cosmos/bank/v1beta1/balances/{0}"),
+    (("query", "rollapp", "rollapp-list"), 0, "/dymensionxyz/dymension/rollapp/rollapp"),
+    (("query", "rollapp", "rollapp"), 1, "/dymensionxyz/dymension/rollapp/rollapp/{0}"),
+    (("query", "sequencer", "sequencers"), 1, "/dymensionxyz/dymension/sequencer/sequencers_by_rollapp/{0}"),
+]
+
+def rest_path_for(args: List[str]) -> Optional[str]:
+    """Return the REST path answering a dymd query, or None if it has no REST equivalent.
+
+    Only the output format flag is understood; commands with any other flag
+    (--node, --height, ...) must go through the binary.
+    """
+    if not args or args[0] != "dymd":
+        return None
+
+    positional = []
+    words = iter(args[1:])
+    for word in words:
+        if word in ("--output", "-o"):
+            next(words, None)
+        elif word.startswith("-"):
+            return None
+        else:
+            positional.append(word)
+
+    for prefix, arg_count, template in REST_QUERY_ROUTES:
+        if tuple(positional[:len(prefix)]) == prefix and len(positional) == len(prefix) + arg_count:
+            params = [quote(arg, safe="") for arg in positional[len(prefix):]]
+            return template.format(*params)
+    return None
+
+class ChainRestClient:
+    """Answers read-only dymd queries through the node's REST API.
+
+    Requests go through one pooled session, so the connection to the node is
+    kept alive between queries instead of starting a dymd process each time.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10.0, pool_size: int = 16):
+        """Initialize the client.
+
+        Args:
+            base_url: REST API address of the node, e.g. http://localhost:1317
+            timeout: Seconds to wait for each request
+            pool_size: Maximum number of kept-alive connections
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def supports(self, args: List[str]) -> bool:
+        """Return True if the command can be answered over REST."""
+        return rest_path_for(args) is not None
+
+    def query(self, args: List[str], parse_json: bool = False) -> Optional[Dict]:
+        """Answer a dymd query over REST.
+
+        Args:
+            args: dymd command arguments
+            parse_json: Whether to return the parsed JSON body as output
+
+        Returns:
+            Dict with status, output and error fields, like run_command,
+            or None if the command has no REST equivalent
+
+        Raises:
+            requests.RequestException: If the node could not be reached
+        """
+        path = rest_path_for(args)
+        if path is None:
+            return None
+
+        response = self.session.get(self.base_url + path, timeout=self.timeout)
+
+        if not response.ok:
+            try:
+                message = response.json().get("message") or response.text
+            except ValueError:
+                message = response.text
+            return {
+                "status": "error",
+                "output": "",
+                "error": message or f"Request failed with status {response.status_code}"
+            }
+
+        if not parse_json:
+            return {"status": "success", "output": response.text.strip(), "error": ""}
+
+        try:
+            return {"status": "success", "output": response.json(), "error": ""}
+        except ValueError as e:
+            return {
+                "status": "error",
+                "output": response.text,
+                "error": f"Failed to parse JSON output: {str(e)}"
+            }
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
@@ -4,7 +4,9 @@ import base64
 from io import BytesIO
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
+from app.utils.profiling import profiled
 
+@profiled("plot_to_base64")
 def plot_to_base64(signals, symbol):
     """Convert plot to base64 string for embedding in HTML."""
     plt.figure(figsize=(12, 6))
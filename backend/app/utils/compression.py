@@ -0,0 +1,53 @@
+import gzip
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip is offered without it
+    brotli = None
+
+# Content types worth compressing; images and event streams are left alone
+COMPRESSIBLE_MIMETYPES = frozenset([
+    "application/json",
+    "application/javascript",
+    "text/css",
+    "text/html",
+    "text/plain",
+])
+
+# Cheap settings suited to responses compressed on every request
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+def available_encodings():
+    """Return the content codings this server can produce, preferred first."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a response body with the given content coding."""
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+def is_compressible(response) -> bool:
+    """Return whether a response's content type and status allow compressing it."""
+    return (
+        response.mimetype in COMPRESSIBLE_MIMETYPES
+        and 200 <= response.status_code < 300
+        and response.status_code not in (204, 206)
+        and "Content-Encoding" not in response.headers
+    )
+
+def negotiate(accept_encodings) -> Optional[str]:
+    """Pick the content coding to use from the request's Accept-Encoding header."""
+    return accept_encodings.best_match(available_encodings())
+
+def set_encoded_body(response, body: bytes, encoding: str) -> None:
+    """Replace the body with its compressed form and update the representation headers."""
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Content-Length"] = str(len(body))
+    # The compressed bytes are a different representation of the same resource
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
@@ -0,0 +1,108 @@
+from typing import Iterable, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+def moving_averages(prices: np.ndarray, windows: Sequence[int]) -> np.ndarray:
+    """Simple moving averages of prices for many windows from one cumulative sum.
+
+    Matches ``Series.rolling(window).mean()``: the first window - 1 values,
+    and every average whose window contains a NaN price, are NaN, and the
+    average of a window of equal prices is exactly that price.
+
+    Args:
+        prices: Array of prices, time on the last axis
+        windows: Window lengths in bars
+
+    Returns:
+        Array of shape (len(windows), *prices.shape)
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    missing = np.isnan(prices)
+    shape = prices.shape[:-1] + (1,)
+
+    # Prefix sums with a leading zero: the sum of bars [i - w, i) is sums[i] - sums[i - w]
+    sums = np.concatenate([np.zeros(shape), np.cumsum(np.where(missing, 0.0, prices), axis=-1)], axis=-1)
+    gaps = None
+    if missing.any():
+        gaps = np.concatenate([np.zeros(shape, dtype=np.int64), np.cumsum(missing, axis=-1)], axis=-1)
+
+    # Length of the run of equal prices ending at each bar
+    positions = np.arange(prices.shape[-1])
+    changes = np.ones(prices.shape, dtype=bool)
+    np.not_equal(prices[..., 1:], prices[..., :-1], out=changes[..., 1:])
+    runs = positions + 1 - np.maximum.accumulate(np.where(changes, positions, 0), axis=-1)
+
+    averages = np.full((len(windows),) + prices.shape, np.nan)
+    for row, window in enumerate(windows):
+        if window > prices.shape[-1]:
+            continue
+        out = averages[row, ..., window - 1:]
+        np.subtract(sums[..., window:], sums[..., :-window], out=out)
+        out /= window
+        # The average of equal prices is that price exactly, as in pandas, not
+        # a difference of prefix sums that may be off by a rounding error
+        np.copyto(out, prices[..., window - 1:], where=runs[..., window - 1:] >= window)
+        if gaps is not None:
+            out[gaps[..., window:] != gaps[..., :-window]] = np.nan
+    return averages
+
+class CrossoverGrid:
+    """Moving average crossover signals for many (short, long) window pairs at once.
+
+    Every distinct window is averaged once, and the signals and positions of
+    all pairs are computed together as (pairs x time) arrays, with the values
+    momentum_trading_strategy produces for each pair. Averages of flat prices
+    are exact; elsewhere they may differ from pandas' by a rounding error, so
+    a signal can only differ where the two averages are equal to within one.
+    Accessors return views into these arrays, not copies.
+
+    Example:
+        grid = CrossoverGrid(data['Close'], [(5, 20), (10, 50), (20, 100), (50, 200)])
+        grid.signals       # (4, len(data)) array of 0.0/1.0
+        grid.positions     # (4, len(data)) array of -1.0/0.0/1.0, NaN first
+        grid.frame(5, 20)  # DataFrame like momentum_trading_strategy(data, 5, 20)
+    """
+
+    def __init__(self, prices, pairs: Iterable[Tuple[int, int]]):
+        self.index = prices.index if isinstance(prices, pd.Series) else None
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.pairs = [(int(short), int(long)) for short, long in pairs]
+        self.windows = sorted({window for pair in self.pairs for window in pair})
+        self.averages = moving_averages(self.prices, self.windows)
+
+        rows = {window: row for row, window in enumerate(self.windows)}
+        self._rows = {pair: i for i, pair in enumerate(self.pairs)}
+        self._short_rows = np.array([rows[short] for short, _ in self.pairs], dtype=np.intp)
+        self._long_rows = np.array([rows[long] for _, long in self.pairs], dtype=np.intp)
+
+        # signals and positions share one buffer: values[0] and values[1]
+        length = self.prices.shape[-1]
+        self.values = np.empty((2, len(self.pairs), length))
+        self.signals, self.positions = self.values[0], self.values[1]
+        np.greater(self.averages[self._short_rows], self.averages[self._long_rows], out=self.signals)
+        # momentum_trading_strategy only signals from bar short_window on
+        shorts = np.array([short for short, _ in self.pairs])
+        self.signals[np.arange(length) < shorts[:, None]] = 0.0
+        self.positions[:, :1] = np.nan
+        np.subtract(self.signals[:, 1:], self.signals[:, :-1], out=self.positions[:, 1:])
+
+    def row(self, short_window: int, long_window: int) -> int:
+        """Return the row of a window pair in signals and positions."""
+        return self._rows[(short_window, long_window)]
+
+    def short_mavg(self, short_window: int, long_window: int) -> np.ndarray:
+        return self.averages[self._short_rows[self.row(short_window, long_window)]]
+
+    def long_mavg(self, short_window: int, long_window: int) -> np.ndarray:
+        return self.averages[self._long_rows[self.row(short_window, long_window)]]
+
+    def frame(self, short_window: int, long_window: int) -> pd.DataFrame:
+        """Return one pair's signals in the layout of momentum_trading_strategy."""
+        row = self.row(short_window, long_window)
+        return pd.DataFrame({
+            'price': self.prices,
+            'short_mavg': self.short_mavg(short_window, long_window),
+            'long_mavg': self.long_mavg(short_window, long_window),
+            'signal': self.signals[row],
+            'positions': self.positions[row]
+        }, index=self.index)
@@ -1,124 +1,603 @@
+import asyncio
 import subprocess
 import json
 import os
+import queue
 import re
-import shutil
-from typing import Dict, List, Optional, Tuple, Union
+import shlex
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import requests
+from app.utils.binary_registry import BinaryRegistry
+from app.utils.chain_rest import ChainRestClient
+from app.utils.command_catalog import HELP_COMMANDS
+from app.utils.intent_suggester import IntentSuggester
+from app.utils.metrics import span
+from app.utils.query_cache import QueryResultCache
+
+# Natural language intents, in priority order: when several patterns occur in
+# a command, the earliest entry wins. Every match of an intent's pattern must
+# contain at least one of its keywords. Each intent is handled by the
+# DymensionCLI._translate_<intent> method.
+INTENTS: List[Tuple[str, Tuple[str, ...], str]] = [
+    # Installation commands
+    ("install_all", ("install",), r"install (?:all|everything|full|complete)"),
+    ("install_essentials", ("install",), r"install (?:essential|essentials|dependencies)"),
+    ("install_go", ("install",), r"install (?:go|golang)"),
+    ("install_roller", ("install",), r"install (?:roller|roller cli)"),
+    ("install_dymd", ("install",), r"install (?:dym|dymd|dymension)"),
+    # Version check
+    ("version", ("version",), r"(?:get|show|check) (?:roller|dymd)? ?version"),
+    # Wallet management
+    ("create_wallet", ("wallet",), r"create (?:a )?(?:new )?wallet"),
+    ("recover_wallet", ("wallet",), r"recover (?:a )?wallet"),
+    ("list_wallets", ("wallet",), r"list (?:all )?wallets"),
+    # Balance and transfers
+    ("balance", ("balance",), r"(?:check|get|show) (?:the )?balance"),
+    ("transfer", ("transfer", "send"), r"(?:transfer|send) (?:tokens|funds|money)"),
+    # RollApp operations
+    ("create_rollapp", ("rollapp",), r"(?:create|init) (?:a )?(?:new )?rollapp"),
+    ("help", ("command", "help"), r"(?:get|show|list) (?:all )?commands|help|command list"),
+    ("register_rollapp", ("rollapp",), r"register (?:a )?rollapp"),
+    ("start_rollapp", ("rollapp",), r"start (?:a )?rollapp"),
+    ("stop_rollapp", ("rollapp",), r"stop (?:a )?rollapp"),
+    ("status", ("status",), r"(?:get|show|check) status"),
+    ("add_relayer", ("relayer",), r"add (?:a )?relayer"),
+    ("register_sequencer", ("sequencer",), r"register (?:a )?sequencer"),
+]
+
+# Compiled once at import: the intent patterns, a map from each keyword to the
+# intents that need it, and one alternation that finds every keyword present
+# in a command in a single scan. Commands containing no keyword never run an
+# intent pattern at all.
+def _build_keyword_index() -> Dict[str, List[int]]:
+    """Map each intent keyword to the INTENTS positions that require it."""
+    index: Dict[str, List[int]] = {}
+    for position, (_, keywords, _) in enumerate(INTENTS):
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(position)
+    return index
+
+_INTENT_PATTERNS = [(name, re.compile(pattern)) for name, _, pattern in INTENTS]
+_KEYWORD_INTENTS = _build_keyword_index()
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _KEYWORD_INTENTS) + "))"
+)
+
+
+def match_intent(command_text: str) -> Optional[str]:
+    """Return the name of the highest priority intent matching the command.
+
+    Args:
+        command_text: Lower-cased natural language command
+
+    Returns:
+        Intent name from INTENTS, or None if nothing matches
+    """
+    candidates = set()
+    for keyword in _KEYWORD_PATTERN.findall(command_text):
+        candidates.update(_KEYWORD_INTENTS[keyword])
+
+    for index in sorted(candidates):
+        name, pattern = _INTENT_PATTERNS[index]
+        if pattern.search(command_text):
+            return name
+    return None
+
+# Argument extractors shared by the intent handlers
+_WALLET_NAME_ARG = re.compile(r"(?:named|called|name) ['\"]*(\w+)['\"]*")
+_BALANCE_ADDRESS_ARG = re.compile(r"(?:for|of) (?:address )?['\"]*([a-zA-Z0-9]+)['\"]*")
+_TRANSFER_FROM_ARG = re.compile(r"from ['\"]*(\w+)['\"]*")
+_TRANSFER_TO_ARG = re.compile(r"to ['\"]*([a-zA-Z0-9]+)['\"]*")
+_AMOUNT_ARG = re.compile(r"([0-9]+(?:\.[0-9]+)?)[\s]*([a-zA-Z]+)")
+_CHAIN_ID_ARG = re.compile(r"chain(?:-| )id ['\"]*([a-zA-Z0-9_-]+)['\"]*")
+_ROLLAPP_NAME_ARG = re.compile(r"(?:named|called|name) ['\"]*([a-zA-Z0-9_-]+)['\"]*")
+_DENOM_ARG = re.compile(r"(?:token|denom) ['\"]*([a-zA-Z0-9]+)['\"]*")
+_ROLLAPP_ID_ARG = re.compile(r"(?:named|called|name|id) ['\"]*([a-zA-Z0-9_-]+)['\"]*")
+_FROM_WALLET_ARG = re.compile(r"(?:from|with) (?:wallet )?['\"]*(\w+)['\"]*")
+_STATUS_ROLLAPP_ARG = re.compile(r"(?:for|of) (?:rollapp )?['\"]*([a-zA-Z0-9_-]+)['\"]*")
+_TARGET_ROLLAPP_ARG = re.compile(r"(?:for|to) (?:rollapp )?['\"]*([a-zA-Z0-9_-]+)['\"]*")
+_RELAYER_WALLET_ARG = re.compile(r"(?:wallet|address) ['\"]*([a-zA-Z0-9]+)['\"]*")
+
+# Suggestions for unrecognized commands are the closest help catalog examples
+_SUGGESTER = IntentSuggester([command["example"] for command in HELP_COMMANDS])
+
+# Returned when no intent matches and no example is close enough
+FALLBACK_SUGGESTIONS = [
+    "Install Roller CLI",
+    "Create a new wallet named mywallet",
+    "Create a new rollapp named myrollapp token mydenom",
+    "Register rollapp myrollapp from mywallet",
+    "Start rollapp myrollapp",
+    "Check status of rollapp myrollapp",
+    "Help"
+]
+
+
+class TranslationCache:
+    """Bounded LRU cache for natural language command translations.
+
+    Only translations are stored here: they are pure functions of the command
+    text, so serving them again is safe. Nothing that runs a binary is cached.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of translations to keep
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(command_text: str) -> str:
+        """Normalize command text so trivially different phrasings share a key."""
+        return " ".join(command_text.lower().split())
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached result for key, or None on a miss."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(result)
+
+    def put(self, key: str, result: Dict) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = dict(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
 
 class DymensionCLI:
     """Wrapper for Dymension CLI commands"""
     
-    def __init__(self):
-        """Initialize the DymensionCLI handler."""
-        # Find paths to binaries
-        self.dymd_path = self._find_binary('dymd')
-        self.roller_path = self._find_binary('roller')
-        
-    def _find_binary(self, binary_name: str) -> str:
-        """Find the full path to a binary, checking common installation locations."""
-        # First check if it's in PATH
-        path = shutil.which(binary_name)
-        if path:
-            return path
-            
-        # Check common installation locations
-        common_locations = [
-            os.path.expanduser(f"~/.roller/bin/{binary_name}"),
-            os.path.expanduser(f"~/go/bin/{binary_name}"),
-            os.path.expanduser(f"~/dymension/bin/{binary_name}"),
-            f"/usr/local/bin/{binary_name}",
-            f"/usr/bin/{binary_name}"
-        ]
+    def __init__(self,
+                 translation_cache_size: int = 256,
+                 command_timeout: Optional[float] = 120.0,
+                 max_concurrent_commands: int = 8,
+                 cache_queries: bool = True,
+                 rest_url: Optional[str] = None):
+        """Initialize the DymensionCLI handler.
+
+        Args:
+            translation_cache_size: Number of parsed commands to keep in the LRU cache
+            command_timeout: Default seconds before a command is killed (None for no limit)
+            max_concurrent_commands: Maximum child processes run_command_async runs at once
+            cache_queries: Whether to cache results of read-only commands in query_cache
+            rest_url: Node REST API used to answer supported queries without starting
+                dymd (defaults to the DYMENSION_REST_URL environment variable)
+        """
+        # Paths to binaries, resolved again when a binary is installed, moved or upgraded
+        self.binaries = BinaryRegistry(ALLOWED_BINARIES)
+        self.translation_cache = TranslationCache(translation_cache_size)
+        self.command_timeout = command_timeout
+        self.max_concurrent_commands = max_concurrent_commands
+        self._async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self.query_cache = QueryResultCache() if cache_queries else None
+        rest_url = rest_url or os.environ.get("DYMENSION_REST_URL")
+        self.rest_client = ChainRestClient(rest_url) if rest_url else None
         
-        for location in common_locations:
-            if os.path.exists(location) and os.access(location, os.X_OK):
-                return location
-                
-        # Return the binary name and let the OS try to find it
-        return binary_name
-    
-    def run_command(self, args: List[str], parse_json: bool = False) -> Dict:
+    def _resolve_args(self, args: List[str]) -> List[str]:
+        """Return a copy of args with the binary replaced by its current full path if available."""
+        cmd = list(args)
+        if cmd and cmd[0] in ALLOWED_BINARIES:
+            cmd[0] = self.binaries.path(cmd[0])
+        return cmd
+
+    def _build_result(self, returncode: int, stdout: str, stderr: str, parse_json: bool) -> Dict:
+        """Build the command result dict from a finished process."""
+        if returncode != 0:
+            return {
+                "status": "error",
+                "output": "",
+                "error": stderr or f"Command failed with exit code {returncode}"
+            }
+
+        output = stdout.strip()
+
+        if parse_json and output:
+            try:
+                parsed_output = json.loads(output)
+                return {
+                    "status": "success",
+                    "output": parsed_output,
+                    "error": ""
+                }
+            except json.JSONDecodeError as e:
+                return {
+                    "status": "error",
+                    "output": output,
+                    "error": f"Failed to parse JSON output: {str(e)}"
+                }
+
+        return {
+            "status": "success",
+            "output": output,
+            "error": ""
+        }
+
+    def _missing_binary_result(self, args: List[str], e: FileNotFoundError) -> Dict:
+        """Build the error result for a binary that could not be found."""
+        binary = args[0] if args else "unknown"
+        installation_instructions = ""
+        if binary == "dymd" or binary == self.binaries.path("dymd"):
+            installation_instructions = "\nTo install dymd: git clone https://github.com/dymensionxyz/dymension.git && cd dymension && git checkout v1.0.2-beta && make install"
+        elif binary == "roller" or binary == self.binaries.path("roller"):
+            installation_instructions = "\nTo install roller: curl https://raw.githubusercontent.com/dymensionxyz/roller/main/install.sh | bash"
+
+        return {
+            "status": "error",
+            "output": f"Error: {str(e)}{installation_instructions}",
+            "error": str(e)
+        }
+
+    def _timeout_result(self, timeout: float) -> Dict:
+        """Build the error result for a command that exceeded its timeout."""
+        return {
+            "status": "error",
+            "output": "",
+            "error": f"Command timed out after {timeout} seconds"
+        }
+
+    def _after_command(self, args: List[str]) -> None:
+        """Invalidation hook run after every uncached command.
+
+        A transaction may change any chain state, so all cached query results
+        are dropped, whether or not the transaction succeeded.
+        """
+        if self.query_cache is not None and is_transaction(args):
+            self.query_cache.invalidate()
+
+    def run_command(self, args: List[str], parse_json: bool = False, timeout: Optional[float] = None) -> Dict:
         """Run a dymd command with the given arguments.
-        
+
+        Read-only commands are answered from query_cache while fresh, and
+        concurrent identical ones share a single process.
+
         Args:
             args: List of command arguments
             parse_json: Whether to parse the output as JSON
-            
+            timeout: Seconds before the command is killed (defaults to command_timeout)
+
         Returns:
             Dict containing command result with status, output, and error fields
         """
+        if is_read_only(args):
+            if self.query_cache is None:
+                return self._run_query(args, parse_json, timeout)
+            return self.query_cache.get_or_run(
+                self._query_key(args, parse_json),
+                self.query_cache.ttl_for(args),
+                lambda: self._run_query(args, parse_json, timeout)
+            )
+        result = self._run_command(args, parse_json, timeout)
+        self._after_command(args)
+        return result
+
+    def _query_key(self, args: List[str], parse_json: bool) -> Tuple:
+        """Return the query_cache key of a read-only command.
+
+        Version output is cached for good, so it is also keyed by the
+        binary's mtime: upgrading the binary makes it a new query.
+        """
+        if args[1] == "version":
+            return (tuple(args), parse_json, self.binaries.mtime(args[0]))
+        return (tuple(args), parse_json)
+
+    def _run_query(self, args: List[str], parse_json: bool, timeout: Optional[float]) -> Dict:
+        """Run a read-only command, through the node's REST API when it can answer it."""
+        if self.rest_client is not None and self.rest_client.supports(args):
+            try:
+                return self.rest_client.query(args, parse_json)
+            except requests.RequestException as e:
+                print(f"REST query failed, falling back to the binary: {str(e)}")
+        return self._run_command(args, parse_json, timeout)
+
+    def _run_command(self, args: List[str], parse_json: bool, timeout: Optional[float]) -> Dict:
+        """Execute a command with subprocess.run, bypassing the query cache."""
+        timeout = self.command_timeout if timeout is None else timeout
         try:
-            # Replace first element with full path if available
-            if args and (args[0] == 'dymd' and self.dymd_path):
-                args[0] = self.dymd_path
-            elif args and (args[0] == 'roller' and self.roller_path):
-                args[0] = self.roller_path
-                
-            cmd = args
+            cmd = self._resolve_args(args)
             print(f"Executing command: {' '.join(cmd)}")
-            
-            result = subprocess.run(
+
+            with span("run_command"):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+
+            return self._build_result(result.returncode, result.stdout, result.stderr, parse_json)
+
+        except subprocess.TimeoutExpired:
+            return self._timeout_result(timeout)
+        except FileNotFoundError as e:
+            return self._missing_binary_result(args, e)
+        except Exception as e:
+            return {
+                "status": "error",
+                "output": "",
+                "error": str(e)
+            }
+
+    def stream_command(self, args: List[str], timeout: Optional[float] = None) -> Iterator[Tuple[str, Union[str, Dict]]]:
+        """Run a command and yield its output line by line as it is produced.
+
+        Args:
+            args: List of command arguments
+            timeout: Seconds before the command is killed (defaults to command_timeout)
+
+        Yields:
+            ("stdout", line) and ("stderr", line) tuples while the command runs,
+            then a single ("status", result) tuple where result has status,
+            returncode and error fields
+        """
+        timeout = self.command_timeout if timeout is None else timeout
+        cmd = self._resolve_args(args)
+        print(f"Streaming command: {' '.join(cmd)}")
+
+        try:
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1
             )
-            
-            if result.returncode != 0:
-                return {
-                    "status": "error",
-                    "output": "",
-                    "error": result.stderr or f"Command failed with exit code {result.returncode}"
-                }
-            
-            output = result.stdout.strip()
-            
-            if parse_json and output:
+        except FileNotFoundError as e:
+            result = self._missing_binary_result(args, e)
+            yield "status", {"status": "error", "returncode": None, "error": result["output"]}
+            return
+
+        # One reader thread per pipe so neither can fill up and block the child
+        lines: "queue.Queue[Tuple[str, Optional[str]]]" = queue.Queue()
+
+        def read_pipe(name, pipe):
+            for line in pipe:
+                lines.put((name, line.rstrip("\r\n")))
+            pipe.close()
+            lines.put((name, None))
+
+        for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr)):
+            threading.Thread(target=read_pipe, args=(name, pipe), daemon=True).start()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        open_pipes = 2
+        try:
+            while open_pipes:
+                wait = None if deadline is None else deadline - time.monotonic()
+                if wait is not None and wait <= 0:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
                 try:
-                    parsed_output = json.loads(output)
-                    return {
-                        "status": "success",
-                        "output": parsed_output,
-                        "error": ""
-                    }
-                except json.JSONDecodeError as e:
-                    return {
-                        "status": "error",
-                        "output": output,
-                        "error": f"Failed to parse JSON output: {str(e)}"
-                    }
-            
-            return {
-                "status": "success",
-                "output": output,
-                "error": ""
+                    name, line = lines.get(timeout=wait)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    open_pipes -= 1
+                else:
+                    yield name, line
+
+            returncode = process.wait()
+            yield "status", {
+                "status": "success" if returncode == 0 else "error",
+                "returncode": returncode,
+                "error": "" if returncode == 0 else f"Command failed with exit code {returncode}"
             }
-            
+        except subprocess.TimeoutExpired:
+            yield "status", {
+                "status": "error",
+                "returncode": None,
+                "error": self._timeout_result(timeout)["error"]
+            }
+        finally:
+            # Also reached when the client disconnects and the generator is closed
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            self._after_command(args)
+
+    async def stream_command_async(self, args: List[str], timeout: Optional[float] = None) -> AsyncIterator[Tuple[str, Union[str, Dict]]]:
+        """Awaitable version of stream_command, built on asyncio subprocesses.
+
+        Args:
+            args: List of command arguments
+            timeout: Seconds before the command is killed (defaults to command_timeout)
+
+        Yields:
+            The same ("stdout"/"stderr", line) and final ("status", result) tuples as stream_command
+        """
+        timeout = self.command_timeout if timeout is None else timeout
+        cmd = self._resolve_args(args)
+        print(f"Streaming command: {' '.join(cmd)}")
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
         except FileNotFoundError as e:
-            binary = args[0] if args else "unknown"
-            installation_instructions = ""
-            if binary == "dymd" or binary == self.dymd_path:
-                installation_instructions = "\nTo install dymd: git clone https://github.com/dymensionxyz/dymension.git && cd dymension && git checkout v1.0.2-beta && make install"
-            elif binary == "roller" or binary == self.roller_path:
-                installation_instructions = "\nTo install roller: curl https://raw.githubusercontent.com/dymensionxyz/roller/main/install.sh | bash"
-            
-            return {
+            result = self._missing_binary_result(args, e)
+            yield "status", {"status": "error", "returncode": None, "error": result["output"]}
+            return
+
+        lines: "asyncio.Queue[Tuple[str, Optional[str]]]" = asyncio.Queue()
+
+        async def read_pipe(name, pipe):
+            async for line in pipe:
+                await lines.put((name, line.decode(errors="replace").rstrip("\r\n")))
+            await lines.put((name, None))
+
+        readers = [
+            asyncio.ensure_future(read_pipe("stdout", process.stdout)),
+            asyncio.ensure_future(read_pipe("stderr", process.stderr))
+        ]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        open_pipes = 2
+        try:
+            while open_pipes:
+                wait = None if deadline is None else deadline - time.monotonic()
+                if wait is not None and wait <= 0:
+                    raise asyncio.TimeoutError()
+                name, line = await asyncio.wait_for(lines.get(), wait)
+                if line is None:
+                    open_pipes -= 1
+                else:
+                    yield name, line
+
+            returncode = await process.wait()
+            yield "status", {
+                "status": "success" if returncode == 0 else "error",
+                "returncode": returncode,
+                "error": "" if returncode == 0 else f"Command failed with exit code {returncode}"
+            }
+        except asyncio.TimeoutError:
+            yield "status", {
                 "status": "error",
-                "output": f"Error: {str(e)}{installation_instructions}",
-                "error": str(e)
+                "returncode": None,
+                "error": self._timeout_result(timeout)["error"]
             }
+        finally:
+            # Also reached when the client disconnects and the generator is closed
+            for reader in readers:
+                reader.cancel()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            self._after_command(args)
+
+    def _process_slots(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent child processes on the running loop.
+
+        asyncio primitives are tied to a single event loop, so one semaphore is
+        kept per loop.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_concurrent_commands)
+            self._async_slots[loop] = slots
+        return slots
+
+    async def run_command_async(self, args: List[str], parse_json: bool = False, timeout: Optional[float] = None) -> Dict:
+        """Run a dymd command without blocking the event loop.
+
+        At most max_concurrent_commands child processes run at once; further
+        calls wait for a free slot. The child is killed if the command times
+        out or the awaiting task is cancelled.
+
+        Args:
+            args: List of command arguments
+            parse_json: Whether to parse the output as JSON
+            timeout: Seconds before the command is killed (defaults to command_timeout)
+
+        Returns:
+            Dict containing command result with status, output, and error fields
+        """
+        if is_read_only(args):
+            if self.query_cache is None:
+                return await self._run_query_async(args, parse_json, timeout)
+            return await self.query_cache.get_or_run_async(
+                self._query_key(args, parse_json),
+                self.query_cache.ttl_for(args),
+                lambda: self._run_query_async(args, parse_json, timeout)
+            )
+        result = await self._run_command_async(args, parse_json, timeout)
+        self._after_command(args)
+        return result
+
+    async def _run_query_async(self, args: List[str], parse_json: bool, timeout: Optional[float]) -> Dict:
+        """Awaitable version of _run_query; REST requests run in a worker thread."""
+        if self.rest_client is not None and self.rest_client.supports(args):
+            try:
+                return await asyncio.to_thread(self.rest_client.query, args, parse_json)
+            except requests.RequestException as e:
+                print(f"REST query failed, falling back to the binary: {str(e)}")
+        return await self._run_command_async(args, parse_json, timeout)
+
+    async def _run_command_async(self, args: List[str], parse_json: bool, timeout: Optional[float]) -> Dict:
+        """Execute a command with asyncio.create_subprocess_exec, bypassing the query cache."""
+        timeout = self.command_timeout if timeout is None else timeout
+        try:
+            cmd = self._resolve_args(args)
+            async with self._process_slots():
+                print(f"Executing command: {' '.join(cmd)}")
+
+                with span("run_command_async"):
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    try:
+                        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                    except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                        if process.returncode is None:
+                            process.kill()
+                            await process.wait()
+                        if isinstance(e, asyncio.CancelledError):
+                            raise
+                        return self._timeout_result(timeout)
+
+            return self._build_result(
+                process.returncode,
+                stdout.decode(errors="replace"),
+                stderr.decode(errors="replace"),
+                parse_json
+            )
+
+        except FileNotFoundError as e:
+            return self._missing_binary_result(args, e)
         except Exception as e:
             return {
                 "status": "error",
                 "output": "",
                 "error": str(e)
             }
-    
+
     def get_binary_version(self, binary: str = "roller") -> Dict:
-        """Get the version of the specified binary."""
-        if binary == "roller":
-            return self.run_command([binary, "version"])
-        elif binary == "dymd":
-            return self.run_command([binary, "version"])
+        """Get the version of the specified binary.
+
+        Versions are recorded by the binary registry and only probed again
+        when the binary file changes.
+        """
+        if binary in ("roller", "dymd"):
+            return self.binaries.version(binary)
         else:
             return {
                 "status": "error",
@@ -166,7 +645,7 @@ class DymensionCLI:
         Returns:
             Dict with balance info
         """
-        return self.run_command(["query", "bank", "balances", address, "--output", "json"], parse_json=True)
+        return self.run_command(self._balance_args(address), parse_json=True)
     
     def transfer_tokens(self, from_wallet: str, to_address: str, amount: str, chain_id: str) -> Dict:
         """Transfer tokens between accounts.
@@ -255,18 +734,11 @@ class DymensionCLI:
         Returns:
             Dict with RollApp info
         """
-        return self.run_command([
-            "query", "rollapp", "rollapp", 
-            rollapp_id,
-            "--output", "json"
-        ], parse_json=True)
+        return self.run_command(self._rollapp_args(rollapp_id), parse_json=True)
     
     def list_rollapp(self) -> Dict:
         """List all RollApps."""
-        return self.run_command([
-            "query", "rollapp", "rollapp-list",
-            "--output", "json"
-        ], parse_json=True)
+        return self.run_command(self._rollapp_list_args(), parse_json=True)
     
     def query_sequencers(self, rollapp_id: str) -> Dict:
         """Query sequencers for a RollApp.
@@ -277,11 +749,127 @@ class DymensionCLI:
         Returns:
             Dict with sequencer info
         """
-        return self.run_command([
-            "query", "sequencer", "sequencers", 
-            rollapp_id,
-            "--output", "json"
-        ], parse_json=True)
+        return self.run_command(self._sequencers_args(rollapp_id), parse_json=True)
+
+    # Awaitable versions of the read-only queries
+
+    async def get_balance_async(self, address: str) -> Dict:
+        """Get account balance without blocking the event loop."""
+        return await self.run_command_async(self._balance_args(address), parse_json=True)
+
+    async def query_rollapp_async(self, rollapp_id: str) -> Dict:
+        """Query RollApp information without blocking the event loop."""
+        return await self.run_command_async(self._rollapp_args(rollapp_id), parse_json=True)
+
+    async def list_rollapp_async(self) -> Dict:
+        """List all RollApps without blocking the event loop."""
+        return await self.run_command_async(self._rollapp_list_args(), parse_json=True)
+
+    async def query_sequencers_async(self, rollapp_id: str) -> Dict:
+        """Query sequencers for a RollApp without blocking the event loop."""
+        return await self.run_command_async(self._sequencers_args(rollapp_id), parse_json=True)
+
+    # Argument lists shared by the sync and async query wrappers
+
+    @staticmethod
+    def _balance_args(address: str) -> List[str]:
+        return ["dymd", "query", "bank", "balances", address, "--output", "json"]
+
+    @staticmethod
+    def _rollapp_args(rollapp_id: str) -> List[str]:
+        return ["dymd", "query", "rollapp", "rollapp", rollapp_id, "--output", "json"]
+
+    @staticmethod
+    def _rollapp_list_args() -> List[str]:
+        return ["dymd", "query", "rollapp", "rollapp-list", "--output", "json"]
+
+    @staticmethod
+    def _sequencers_args(rollapp_id: str) -> List[str]:
+        return ["dymd", "query", "sequencer", "sequencers", rollapp_id, "--output", "json"]
+
+    # Batch execution
+
+    def batch_item_args(self, item: Union[str, List[str], Dict]) -> List[str]:
+        """Resolve one batch item to a read-only argument list.
+
+        Args:
+            item: A command line string or argument list, {"command": ...}, or
+                a named query such as {"query": "get_balance", "params": {"address": "dym1..."}}
+
+        Returns:
+            List of command arguments
+
+        Raises:
+            ValueError: If the item is malformed or is not a read-only command
+        """
+        if not isinstance(item, (str, list, dict)):
+            raise ValueError(f"Batch items must be commands or objects, not {type(item).__name__}")
+        if isinstance(item, dict) and "query" in item:
+            builder = BATCH_QUERIES.get(item["query"]) if isinstance(item["query"], str) else None
+            if builder is None:
+                raise ValueError(f"Unknown query: {item['query']}. Available: {', '.join(BATCH_QUERIES)}")
+            try:
+                args = getattr(self, builder)(**item.get("params", {}))
+            except TypeError as e:
+                raise ValueError(f"Invalid params for {item['query']}: {str(e)}")
+        else:
+            command = item.get("command") if isinstance(item, dict) else item
+            if not command:
+                raise ValueError("Missing 'command' or 'query' in batch item")
+            if not isinstance(command, (str, list)):
+                raise ValueError("'command' must be a command line or a list of arguments")
+            args = parse_cli_args(command)
+
+        if not is_read_only(args):
+            raise ValueError("Only read-only (query/version) commands can be batched")
+        return args
+
+    async def run_batch_async(self, items: List[Union[str, List[str], Dict]], parallelism: int = 8) -> List[Dict]:
+        """Run read-only batch items concurrently.
+
+        Args:
+            items: Batch items accepted by batch_item_args
+            parallelism: Maximum number of items running at once
+
+        Returns:
+            One result dict per item, in the same order as items
+        """
+        limit = asyncio.Semaphore(max(1, parallelism))
+
+        async def run_item(item):
+            try:
+                args = self.batch_item_args(item)
+            except ValueError as e:
+                return {"status": "error", "output": "", "error": str(e)}
+            async with limit:
+                return await self.run_command_async(args, parse_json="json" in args)
+
+        return await asyncio.gather(*(run_item(item) for item in items))
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the event loop synchronous callers share, started on first use.
+
+        The process slots and the query cache's async single-flight are kept
+        per event loop, so running each call with asyncio.run (a new loop per
+        request under WSGI) would bound and deduplicate commands only within
+        one request.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="dymension-cli-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def run_batch(self, items: List[Union[str, List[str], Dict]], parallelism: int = 8) -> List[Dict]:
+        """Synchronous entry point for run_batch_async.
+
+        Every call runs on one background event loop, so max_concurrent_commands
+        and the deduplication of identical queries apply across all requests
+        of the process.
+        """
+        future = asyncio.run_coroutine_threadsafe(self.run_batch_async(items, parallelism), self._background_loop())
+        return future.result()
     
     def claim_settlement(self, 
                         settlement_id: str, 
@@ -420,369 +1008,359 @@ class DymensionCLI:
             
     def translate_to_cli_command(self, command_text: str) -> Dict:
         """Translate natural language intent to actual CLI commands to run.
-        
+
+        The intent is resolved by ``match_intent`` against the precompiled
+        ``INTENTS`` table, and its ``_translate_<intent>`` method builds the
+        response.
+
         Args:
             command_text: Natural language description of what the user wants to do
-            
+
         Returns:
             Dict with suggested command and explanation
         """
-        command_text = command_text.lower()
-        
-        # Installation commands
-        if re.search(r"install (?:all|everything|full|complete)", command_text):
+        with span("translate_to_cli_command"):
+            command_text = command_text.lower()
+
+            intent = match_intent(command_text)
+            if intent is None:
+                # Return help if command isn't recognized
+                return {
+                    "status": "error",
+                    "error": "Command not recognized. Please try a different command format.",
+                    "suggestions": _SUGGESTER.suggest(command_text) or list(FALLBACK_SUGGESTIONS)
+                }
+
+            return getattr(self, f"_translate_{intent}")(command_text)
+
+    # Intent handlers, one per entry in INTENTS
+
+    def _translate_install_all(self, command_text: str) -> Dict:
+        return {
+            "status": "success",
+            "command": [
+                "# Install essential dependencies",
+                "sudo apt install -y build-essential clang curl aria2 wget tar jq libssl-dev pkg-config make",
+                "",
+                "# Install Go",
+                "cd $HOME",
+                "wget \"https://golang.org/dl/go1.23.0.linux-amd64.tar.gz\"",
+                "sudo rm -rf /usr/local/go",
+                "sudo tar -C /usr/local -xzf \"go1.23.0.linux-amd64.tar.gz\"",
+                "rm \"go1.23.0.linux-amd64.tar.gz\"",
+                "echo 'export PATH=$PATH:/usr/local/go/bin:$HOME/go/bin' >> ~/.profile",
+                "source ~/.profile",
+                "",
+                "# Install Roller CLI",
+                "curl https://raw.githubusercontent.com/dymensionxyz/roller/main/install.sh | bash"
+            ],
+            "explanation": "These commands will install all prerequisites for Dymension development, including system dependencies, Go programming language, and the Roller CLI."
+        }
+
+    def _translate_install_essentials(self, command_text: str) -> Dict:
+        return {
+            "status": "success",
+            "command": [
+                "sudo apt install -y build-essential clang curl aria2 wget tar jq libssl-dev pkg-config make"
+            ],
+            "explanation": "This command installs the basic system dependencies required for Dymension development."
+        }
+
+    def _translate_install_go(self, command_text: str) -> Dict:
+        return {
+            "status": "success",
+            "command": [
+                "cd $HOME",
+                "wget \"https://golang.org/dl/go1.23.0.linux-amd64.tar.gz\"",
+                "sudo rm -rf /usr/local/go",
+                "sudo tar -C /usr/local -xzf \"go1.23.0.linux-amd64.tar.gz\"",
+                "rm \"go1.23.0.linux-amd64.tar.gz\"",
+                "echo 'export PATH=$PATH:/usr/local/go/bin:$HOME/go/bin' >> ~/.profile",
+                "source ~/.profile"
+            ],
+            "explanation": "These commands download and install Go 1.23.0, which is required for compiling and running Dymension and Roller."
+        }
+
+    def _translate_install_roller(self, command_text: str) -> Dict:
+        return {
+            "status": "success",
+            "command": [
+                "curl https://raw.githubusercontent.com/dymensionxyz/roller/main/install.sh | bash"
+            ],
+            "explanation": "This command installs the Roller CLI, which is used for managing Dymension RollApps."
+        }
+
+    def _translate_install_dymd(self, command_text: str) -> Dict:
+        return {
+            "status": "success",
+            "command": [
+                "git clone https://github.com/dymensionxyz/dymension.git",
+                "cd dymension",
+                "git checkout v1.0.2-beta",
+                "make install",
+                "dymd version  # Verify installation"
+            ],
+            "explanation": "These commands clone the Dymension repository, checkout the testnet version, and install the dymd binary."
+        }
+
+    def _translate_version(self, command_text: str) -> Dict:
+        if "dymd" in command_text:
             return {
                 "status": "success",
-                "command": [
-                    "# Install essential dependencies",
-                    "sudo apt install -y build-essential clang curl aria2 wget tar jq libssl-dev pkg-config make",
-                    "",
-                    "# Install Go",
-                    "cd $HOME",
-                    "wget \"https://golang.org/dl/go1.23.0.linux-amd64.tar.gz\"",
-                    "sudo rm -rf /usr/local/go",
-                    "sudo tar -C /usr/local -xzf \"go1.23.0.linux-amd64.tar.gz\"",
-                    "rm \"go1.23.0.linux-amd64.tar.gz\"",
-                    "echo 'export PATH=$PATH:/usr/local/go/bin:$HOME/go/bin' >> ~/.profile",
-                    "source ~/.profile",
-                    "",
-                    "# Install Roller CLI",
-                    "curl https://raw.githubusercontent.com/dymensionxyz/roller/main/install.sh | bash"
-                ],
-                "explanation": "These commands will install all prerequisites for Dymension development, including system dependencies, Go programming language, and the Roller CLI."
+                "command": ["dymd version"],
+                "explanation": "This command shows the installed version of the Dymension binary."
             }
-            
-        elif re.search(r"install (?:essential|essentials|dependencies)", command_text):
+        return {
+            "status": "success",
+            "command": ["roller version"],
+            "explanation": "This command shows the installed version of the Roller CLI."
+        }
+
+    def _translate_create_wallet(self, command_text: str) -> Dict:
+        match = _WALLET_NAME_ARG.search(command_text)
+        if match:
+            wallet_name = match.group(1)
             return {
                 "status": "success",
-                "command": [
-                    "sudo apt install -y build-essential clang curl aria2 wget tar jq libssl-dev pkg-config make"
-                ],
-                "explanation": "This command installs the basic system dependencies required for Dymension development."
+                "command": [f"dymd keys add {wallet_name}"],
+                "explanation": f"This command creates a new wallet named '{wallet_name}'. Make sure to save the mnemonic phrase that will be displayed."
             }
-            
-        elif re.search(r"install (?:go|golang)", command_text):
+        return {
+            "status": "error",
+            "error": "Please specify a wallet name",
+            "suggestion": "Try: Create a new wallet named mywallet"
+        }
+
+    def _translate_recover_wallet(self, command_text: str) -> Dict:
+        match = _WALLET_NAME_ARG.search(command_text)
+        if match:
+            wallet_name = match.group(1)
             return {
                 "status": "success",
-                "command": [
-                    "cd $HOME",
-                    "wget \"https://golang.org/dl/go1.23.0.linux-amd64.tar.gz\"",
-                    "sudo rm -rf /usr/local/go",
-                    "sudo tar -C /usr/local -xzf \"go1.23.0.linux-amd64.tar.gz\"",
-                    "rm \"go1.23.0.linux-amd64.tar.gz\"",
-                    "echo 'export PATH=$PATH:/usr/local/go/bin:$HOME/go/bin' >> ~/.profile",
-                    "source ~/.profile"
-                ],
-                "explanation": "These commands download and install Go 1.23.0, which is required for compiling and running Dymension and Roller."
+                "command": [f"dymd keys add {wallet_name} --recover"],
+                "explanation": f"This command allows you to recover wallet '{wallet_name}' using a mnemonic phrase. You will be prompted to enter your mnemonic."
             }
-            
-        elif re.search(r"install (?:roller|roller cli)", command_text):
+        return {
+            "status": "error",
+            "error": "Please specify a wallet name",
+            "suggestion": "Try: Recover wallet named mywallet"
+        }
+
+    def _translate_list_wallets(self, command_text: str) -> Dict:
+        return {
+            "status": "success",
+            "command": ["dymd keys list"],
+            "explanation": "This command lists all the wallets in your local keystore."
+        }
+
+    def _translate_balance(self, command_text: str) -> Dict:
+        match = _BALANCE_ADDRESS_ARG.search(command_text)
+        if match:
+            address = match.group(1)
             return {
                 "status": "success",
-                "command": [
-                    "curl https://raw.githubusercontent.com/dymensionxyz/roller/main/install.sh | bash"
-                ],
-                "explanation": "This command installs the Roller CLI, which is used for managing Dymension RollApps."
+                "command": [f"dymd query bank balances {address}"],
+                "explanation": f"This command shows the token balances for address '{address}'."
             }
-            
-        elif re.search(r"install (?:dym|dymd|dymension)", command_text):
+        return {
+            "status": "error",
+            "error": "Please specify an address",
+            "suggestion": "Try: Check balance for address dym12345..."
+        }
+
+    def _translate_transfer(self, command_text: str) -> Dict:
+        from_match = _TRANSFER_FROM_ARG.search(command_text)
+        to_match = _TRANSFER_TO_ARG.search(command_text)
+        amount_match = _AMOUNT_ARG.search(command_text)
+        chain_match = _CHAIN_ID_ARG.search(command_text)
+
+        if from_match and to_match and amount_match:
+            from_wallet = from_match.group(1)
+            to_address = to_match.group(1)
+            amount = amount_match.group(1) + amount_match.group(2)
+            chain_id = chain_match.group(1) if chain_match else "dymension_1100-1"
+
             return {
                 "status": "success",
-                "command": [
-                    "git clone https://github.com/dymensionxyz/dymension.git",
-                    "cd dymension",
-                    "git checkout v1.0.2-beta",
-                    "make install",
-                    "dymd version  # Verify installation"
-                ],
-                "explanation": "These commands clone the Dymension repository, checkout the testnet version, and install the dymd binary."
+                "command": [f"dymd tx bank send {from_wallet} {to_address} {amount} --chain-id {chain_id} --gas auto -y"],
+                "explanation": f"This command transfers {amount} from wallet '{from_wallet}' to address '{to_address}'."
             }
-        
-        # Version check
-        elif re.search(r"(?:get|show|check) (?:roller|dymd)? ?version", command_text):
-            if "dymd" in command_text:
-                return {
-                    "status": "success",
-                    "command": ["dymd version"],
-                    "explanation": "This command shows the installed version of the Dymension binary."
-                }
-            else:
-                return {
-                    "status": "success",
-                    "command": ["roller version"],
-                    "explanation": "This command shows the installed version of the Roller CLI."
-                }
-        
-        # Wallet management
-        elif re.search(r"create (?:a )?(?:new )?wallet", command_text):
-            match = re.search(r"(?:named|called|name) ['\"]*(\w+)['\"]*", command_text)
-            if match:
-                wallet_name = match.group(1)
-                return {
-                    "status": "success",
-                    "command": [f"dymd keys add {wallet_name}"],
-                    "explanation": f"This command creates a new wallet named '{wallet_name}'. Make sure to save the mnemonic phrase that will be displayed."
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": "Please specify a wallet name",
-                    "suggestion": "Try: Create a new wallet named mywallet"
-                }
-        
-        elif re.search(r"recover (?:a )?wallet", command_text):
-            match = re.search(r"(?:named|called|name) ['\"]*(\w+)['\"]*", command_text)
-            if match:
-                wallet_name = match.group(1)
-                return {
-                    "status": "success",
-                    "command": [f"dymd keys add {wallet_name} --recover"],
-                    "explanation": f"This command allows you to recover wallet '{wallet_name}' using a mnemonic phrase. You will be prompted to enter your mnemonic."
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": "Please specify a wallet name",
-                    "suggestion": "Try: Recover wallet named mywallet"
-                }
-        
-        elif re.search(r"list (?:all )?wallets", command_text):
+
+        missing = []
+        if not from_match:
+            missing.append("sender wallet name")
+        if not to_match:
+            missing.append("recipient address")
+        if not amount_match:
+            missing.append("amount and denomination")
+
+        return {
+            "status": "error",
+            "error": f"Missing parameters: {', '.join(missing)}",
+            "suggestion": "Try: Transfer 10adym from mywallet to dym12345... chain-id dymension_1100-1"
+        }
+
+    def _translate_create_rollapp(self, command_text: str) -> Dict:
+        match_name = _ROLLAPP_NAME_ARG.search(command_text)
+        match_denom = _DENOM_ARG.search(command_text)
+
+        if match_name and match_denom:
+            rollapp_name = match_name.group(1)
+            token_denom = match_denom.group(1)
+            evm_flag = "--evm" if "evm" in command_text else ""
+
             return {
                 "status": "success",
-                "command": ["dymd keys list"],
-                "explanation": "This command lists all the wallets in your local keystore."
+                "command": [f"roller create {rollapp_name} {token_denom} {evm_flag}"],
+                "explanation": f"This command initializes a new RollApp named '{rollapp_name}' with token denomination '{token_denom}'{' using EVM' if evm_flag else ''}."
             }
-        
-        # Balance and transfers
-        elif re.search(r"(?:check|get|show) (?:the )?balance", command_text):
-            match = re.search(r"(?:for|of) (?:address )?['\"]*([a-zA-Z0-9]+)['\"]*", command_text)
-            if match:
-                address = match.group(1)
-                return {
-                    "status": "success",
-                    "command": [f"dymd query bank balances {address}"],
-                    "explanation": f"This command shows the token balances for address '{address}'."
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": "Please specify an address",
-                    "suggestion": "Try: Check balance for address dym12345..."
-                }
-        
-        elif re.search(r"(?:transfer|send) (?:tokens|funds|money)", command_text):
-            from_match = re.search(r"from ['\"]*(\w+)['\"]*", command_text)
-            to_match = re.search(r"to ['\"]*([a-zA-Z0-9]+)['\"]*", command_text)
-            amount_match = re.search(r"([0-9]+(?:\.[0-9]+)?)[\s]*([a-zA-Z]+)", command_text)
-            chain_match = re.search(r"chain(?:-| )id ['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            
-            if from_match and to_match and amount_match:
-                from_wallet = from_match.group(1)
-                to_address = to_match.group(1)
-                amount = amount_match.group(1) + amount_match.group(2)
-                chain_id = chain_match.group(1) if chain_match else "dymension_1100-1"
-                
-                return {
-                    "status": "success",
-                    "command": [f"dymd tx bank send {from_wallet} {to_address} {amount} --chain-id {chain_id} --gas auto -y"],
-                    "explanation": f"This command transfers {amount} from wallet '{from_wallet}' to address '{to_address}'."
-                }
-            else:
-                missing = []
-                if not from_match:
-                    missing.append("sender wallet name")
-                if not to_match:
-                    missing.append("recipient address")
-                if not amount_match:
-                    missing.append("amount and denomination")
-                
-                return {
-                    "status": "error", 
-                    "error": f"Missing parameters: {', '.join(missing)}", 
-                    "suggestion": "Try: Transfer 10adym from mywallet to dym12345... chain-id dymension_1100-1"
-                }
-        
-        # RollApp operations
-        elif re.search(r"(?:create|init) (?:a )?(?:new )?rollapp", command_text):
-            match_name = re.search(r"(?:named|called|name) ['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            match_denom = re.search(r"(?:token|denom) ['\"]*([a-zA-Z0-9]+)['\"]*", command_text)
-            
-            if match_name and match_denom:
-                rollapp_name = match_name.group(1)
-                token_denom = match_denom.group(1)
-                evm_flag = "--evm" if "evm" in command_text else ""
-                
-                return {
-                    "status": "success",
-                    "command": [f"roller create {rollapp_name} {token_denom} {evm_flag}"],
-                    "explanation": f"This command initializes a new RollApp named '{rollapp_name}' with token denomination '{token_denom}'{' using EVM' if evm_flag else ''}."
-                }
-            else:
-                missing = []
-                if not match_name:
-                    missing.append("RollApp name")
-                if not match_denom:
-                    missing.append("token denomination")
-                
-                return {
-                    "status": "error", 
-                    "error": f"Missing parameters: {', '.join(missing)}", 
-                    "suggestion": "Try: Create a new rollapp named myrollapp token mydenom"
-                }
-                
-        elif re.search(r"(?:get|show|list) (?:all )?commands", command_text) or re.search(r"(?:help|command list)", command_text):
+
+        missing = []
+        if not match_name:
+            missing.append("RollApp name")
+        if not match_denom:
+            missing.append("token denomination")
+
+        return {
+            "status": "error",
+            "error": f"Missing parameters: {', '.join(missing)}",
+            "suggestion": "Try: Create a new rollapp named myrollapp token mydenom"
+        }
+
+    def _translate_help(self, command_text: str) -> Dict:
+        return {
+            "status": "success",
+            "command": ["roller --help", "dymd --help"],
+            "explanation": "These commands show the available commands for Roller and Dymension CLIs."
+        }
+
+    def _translate_register_rollapp(self, command_text: str) -> Dict:
+        rollapp_match = _ROLLAPP_ID_ARG.search(command_text)
+        from_match = _FROM_WALLET_ARG.search(command_text)
+
+        if rollapp_match and from_match:
+            rollapp_id = rollapp_match.group(1)
+            from_wallet = from_match.group(1)
+
             return {
                 "status": "success",
-                "command": ["roller --help", "dymd --help"],
-                "explanation": "These commands show the available commands for Roller and Dymension CLIs."
+                "command": [f"roller register {rollapp_id} --from {from_wallet}"],
+                "explanation": f"This command registers the RollApp '{rollapp_id}' on the Dymension hub using wallet '{from_wallet}'."
             }
-            
-        elif re.search(r"register (?:a )?rollapp", command_text):
-            rollapp_match = re.search(r"(?:named|called|name|id) ['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            from_match = re.search(r"(?:from|with) (?:wallet )?['\"]*(\w+)['\"]*", command_text)
-            
-            if rollapp_match and from_match:
-                rollapp_id = rollapp_match.group(1)
-                from_wallet = from_match.group(1)
-                
-                return {
-                    "status": "success",
-                    "command": [f"roller register {rollapp_id} --from {from_wallet}"],
-                    "explanation": f"This command registers the RollApp '{rollapp_id}' on the Dymension hub using wallet '{from_wallet}'."
-                }
-            else:
-                missing = []
-                if not rollapp_match:
-                    missing.append("RollApp ID")
-                if not from_match:
-                    missing.append("wallet name")
-                
-                return {
-                    "status": "error", 
-                    "error": f"Missing parameters: {', '.join(missing)}", 
-                    "suggestion": "Try: Register rollapp myrollapp from mywallet"
-                }
-                
-        elif re.search(r"start (?:a )?rollapp", command_text):
-            rollapp_match = re.search(r"(?:named|called|name|id) ['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            
-            if rollapp_match:
-                rollapp_id = rollapp_match.group(1)
-                
-                return {
-                    "status": "success",
-                    "command": [f"roller start {rollapp_id}"],
-                    "explanation": f"This command starts the RollApp '{rollapp_id}'."
-                }
-            else:
-                return {
-                    "status": "error", 
-                    "error": "Missing RollApp ID", 
-                    "suggestion": "Try: Start rollapp myrollapp"
-                }
-                
-        elif re.search(r"stop (?:a )?rollapp", command_text):
-            rollapp_match = re.search(r"(?:named|called|name|id) ['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            
-            if rollapp_match:
-                rollapp_id = rollapp_match.group(1)
-                
-                return {
-                    "status": "success",
-                    "command": [f"roller stop {rollapp_id}"],
-                    "explanation": f"This command stops the RollApp '{rollapp_id}'."
-                }
-            else:
-                return {
-                    "status": "error", 
-                    "error": "Missing RollApp ID", 
-                    "suggestion": "Try: Stop rollapp myrollapp"
-                }
-                
-        elif re.search(r"(?:get|show|check) status", command_text):
-            rollapp_match = re.search(r"(?:for|of) (?:rollapp )?['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            
-            if rollapp_match:
-                rollapp_id = rollapp_match.group(1)
-                return {
-                    "status": "success",
-                    "command": [f"roller status {rollapp_id}"],
-                    "explanation": f"This command shows the status of RollApp '{rollapp_id}'."
-                }
-            else:
-                return {
-                    "status": "success",
-                    "command": ["roller status"],
-                    "explanation": "This command shows the status of your RollApp."
-                }
-                
-        elif re.search(r"add (?:a )?relayer", command_text):
-            rollapp_match = re.search(r"(?:for|to) (?:rollapp )?['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            wallet_match = re.search(r"(?:wallet|address) ['\"]*([a-zA-Z0-9]+)['\"]*", command_text)
-            
-            if rollapp_match and wallet_match:
-                rollapp_id = rollapp_match.group(1)
-                wallet = wallet_match.group(1)
-                
-                return {
-                    "status": "success",
-                    "command": [f"roller relayer whitelist {rollapp_id} --add {wallet}"],
-                    "explanation": f"This command adds wallet '{wallet}' as a whitelisted relayer for RollApp '{rollapp_id}'."
-                }
-            else:
-                missing = []
-                if not rollapp_match:
-                    missing.append("RollApp ID")
-                if not wallet_match:
-                    missing.append("wallet address")
-                
-                return {
-                    "status": "error", 
-                    "error": f"Missing parameters: {', '.join(missing)}", 
-                    "suggestion": "Try: Add relayer dym123... to rollapp myrollapp"
-                }
-                
-        elif re.search(r"register (?:a )?sequencer", command_text):
-            rollapp_match = re.search(r"(?:for|to) (?:rollapp )?['\"]*([a-zA-Z0-9_-]+)['\"]*", command_text)
-            from_match = re.search(r"(?:from|with) (?:wallet )?['\"]*(\w+)['\"]*", command_text)
-            
-            if rollapp_match and from_match:
-                rollapp_id = rollapp_match.group(1)
-                from_wallet = from_match.group(1)
-                
-                return {
-                    "status": "success",
-                    "command": [f"roller sequencer register {rollapp_id} --from {from_wallet}"],
-                    "explanation": f"This command registers a sequencer for RollApp '{rollapp_id}' using wallet '{from_wallet}'."
-                }
-            else:
-                missing = []
-                if not rollapp_match:
-                    missing.append("RollApp ID")
-                if not from_match:
-                    missing.append("wallet name")
-                
-                return {
-                    "status": "error", 
-                    "error": f"Missing parameters: {', '.join(missing)}", 
-                    "suggestion": "Try: Register sequencer for rollapp myrollapp from mywallet"
-                }
-        
-        else:
-            # Return help if command isn't recognized
+
+        missing = []
+        if not rollapp_match:
+            missing.append("RollApp ID")
+        if not from_match:
+            missing.append("wallet name")
+
+        return {
+            "status": "error",
+            "error": f"Missing parameters: {', '.join(missing)}",
+            "suggestion": "Try: Register rollapp myrollapp from mywallet"
+        }
+
+    def _translate_start_rollapp(self, command_text: str) -> Dict:
+        rollapp_match = _ROLLAPP_ID_ARG.search(command_text)
+
+        if rollapp_match:
+            rollapp_id = rollapp_match.group(1)
+
             return {
-                "status": "error",
-                "error": "Command not recognized. Please try a different command format.",
-                "suggestions": [
-                    "Install Roller CLI",
-                    "Create a new wallet named mywallet", 
-                    "Create a new rollapp named myrollapp token mydenom",
-                    "Register rollapp myrollapp from mywallet",
-                    "Start rollapp myrollapp",
-                    "Check status of rollapp myrollapp",
-                    "Help"
-                ]
+                "status": "success",
+                "command": [f"roller start {rollapp_id}"],
+                "explanation": f"This command starts the RollApp '{rollapp_id}'."
             }
+        return {
+            "status": "error",
+            "error": "Missing RollApp ID",
+            "suggestion": "Try: Start rollapp myrollapp"
+        }
+
+    def _translate_stop_rollapp(self, command_text: str) -> Dict:
+        rollapp_match = _ROLLAPP_ID_ARG.search(command_text)
+
+        if rollapp_match:
+            rollapp_id = rollapp_match.group(1)
+
+            return {
+                "status": "success",
+                "command": [f"roller stop {rollapp_id}"],
+                "explanation": f"This command stops the RollApp '{rollapp_id}'."
+            }
+        return {
+            "status": "error",
+            "error": "Missing RollApp ID",
+            "suggestion": "Try: Stop rollapp myrollapp"
+        }
+
+    def _translate_status(self, command_text: str) -> Dict:
+        rollapp_match = _STATUS_ROLLAPP_ARG.search(command_text)
+
+        if rollapp_match:
+            rollapp_id = rollapp_match.group(1)
+            return {
+                "status": "success",
+                "command": [f"roller status {rollapp_id}"],
+                "explanation": f"This command shows the status of RollApp '{rollapp_id}'."
+            }
+        return {
+            "status": "success",
+            "command": ["roller status"],
+            "explanation": "This command shows the status of your RollApp."
+        }
+
+    def _translate_add_relayer(self, command_text: str) -> Dict:
+        rollapp_match = _TARGET_ROLLAPP_ARG.search(command_text)
+        wallet_match = _RELAYER_WALLET_ARG.search(command_text)
+
+        if rollapp_match and wallet_match:
+            rollapp_id = rollapp_match.group(1)
+            wallet = wallet_match.group(1)
+
+            return {
+                "status": "success",
+                "command": [f"roller relayer whitelist {rollapp_id} --add {wallet}"],
+                "explanation": f"This command adds wallet '{wallet}' as a whitelisted relayer for RollApp '{rollapp_id}'."
+            }
+
+        missing = []
+        if not rollapp_match:
+            missing.append("RollApp ID")
+        if not wallet_match:
+            missing.append("wallet address")
+
+        return {
+            "status": "error",
+            "error": f"Missing parameters: {', '.join(missing)}",
+            "suggestion": "Try: Add relayer dym123... to rollapp myrollapp"
+        }
+
+    def _translate_register_sequencer(self, command_text: str) -> Dict:
+        rollapp_match = _TARGET_ROLLAPP_ARG.search(command_text)
+        from_match = _FROM_WALLET_ARG.search(command_text)
+
+        if rollapp_match and from_match:
+            rollapp_id = rollapp_match.group(1)
+            from_wallet = from_match.group(1)
+
+            return {
+                "status": "success",
+                "command": [f"roller sequencer register {rollapp_id} --from {from_wallet}"],
+                "explanation": f"This command registers a sequencer for RollApp '{rollapp_id}' using wallet '{from_wallet}'."
+            }
+
+        missing = []
+        if not rollapp_match:
+            missing.append("RollApp ID")
+        if not from_match:
+            missing.append("wallet name")
+
+        return {
+            "status": "error",
+            "error": f"Missing parameters: {', '.join(missing)}",
+            "suggestion": "Try: Register sequencer for rollapp myrollapp from mywallet"
+        }
 
     def parse_command(self, command_text: str) -> Dict:
         """Parse a command string provided by the user and return appropriate CLI commands.
@@ -793,6 +1371,16 @@ class DymensionCLI:
         Returns:
             Dict with command result
         """
+        # Translation has no side effects, so repeated commands are served from the cache
+        key = TranslationCache.normalize(command_text)
+        result = self.translation_cache.get(key)
+        if result is None:
+            result = self._parse_command(key)
+            self.translation_cache.put(key, result)
+        return result
+
+    def _parse_command(self, command_text: str) -> Dict:
+        """Translate a normalized command and build the parse_command result."""
         # Instead of trying to execute the command, translate it to CLI commands
         translation = self.translate_to_cli_command(command_text)
         
@@ -823,6 +1411,74 @@ class DymensionCLI:
                 "suggestion": translation.get('suggestion', '')
             }
 
+# Binaries that may be run directly through the API
+ALLOWED_BINARIES = ("dymd", "roller")
+
+def parse_cli_args(command: Union[str, List[str]]) -> List[str]:
+    """Split a dymd/roller command line into an argument list.
+
+    Args:
+        command: Command line string or argument list
+
+    Returns:
+        List of command arguments
+
+    Raises:
+        ValueError: If the command is empty or does not start with an allowed binary
+    """
+    args = shlex.split(command) if isinstance(command, str) else [str(arg) for arg in command]
+    if not args:
+        raise ValueError("Command is empty")
+    if args[0] not in ALLOWED_BINARIES:
+        raise ValueError(f"Only {', '.join(ALLOWED_BINARIES)} commands can be run")
+    return args
+
+# Long-running commands the stream endpoint may run, as leading arguments.
+# Anything else (key management, transactions, ...) is never streamed.
+STREAMABLE_COMMANDS = (
+    ("roller", "rollapp", "start"),
+    ("roller", "relayer", "start"),
+    ("roller", "da-light-client", "start"),
+)
+
+def parse_stream_args(command: Union[str, List[str]],
+                      allowed: Sequence[Sequence[str]] = STREAMABLE_COMMANDS) -> List[str]:
+    """Split a command for the stream endpoint and check it against an allowlist.
+
+    Args:
+        command: Command line string or argument list
+        allowed: Accepted leading arguments, e.g. ("roller", "rollapp", "start")
+
+    Returns:
+        List of command arguments
+
+    Raises:
+        ValueError: If the command does not start with one of the allowed prefixes
+    """
+    args = parse_cli_args(command)
+    if not any(tuple(args[:len(prefix)]) == tuple(prefix) for prefix in allowed):
+        raise ValueError("Only these commands can be streamed: " + ", ".join(" ".join(prefix) for prefix in allowed))
+    return args
+
+# Second argument of commands that only read chain or binary state
+READ_ONLY_SUBCOMMANDS = ("query", "q", "version")
+
+# Named queries accepted by the batch endpoint, mapped to their argument builders
+BATCH_QUERIES = {
+    "get_balance": "_balance_args",
+    "query_rollapp": "_rollapp_args",
+    "list_rollapp": "_rollapp_list_args",
+    "query_sequencers": "_sequencers_args",
+}
+
+def is_read_only(args: List[str]) -> bool:
+    """Return True if args is a dymd/roller command that does not change any state."""
+    return len(args) > 1 and args[0] in ALLOWED_BINARIES and args[1] in READ_ONLY_SUBCOMMANDS
+
+def is_transaction(args: List[str]) -> bool:
+    """Return True if args broadcasts a transaction (with or without the binary name)."""
+    return "tx" in args[:2]
+
 # Helper function to format output
 def format_output(result: Dict) -> str:
     """Format command result for display.
@@ -839,4 +1495,34 @@ def format_output(result: Dict) -> str:
     if isinstance(result["output"], dict):
         return json.dumps(result["output"], indent=2)
     
-    return result["output"] 
\ No newline at end of file
+    return result["output"] 
+
+def command_response(result: Dict) -> Dict:
+    """Build the API response for a command result, carrying each payload once.
+
+    Structured output stays a JSON value instead of also being sent as a
+    pretty-printed copy; clients format it for display. ``raw_output`` is
+    only included when ``output`` does not already contain it, e.g. the
+    suggestions for an unrecognized command.
+
+    Args:
+        result: Command execution result
+
+    Returns:
+        Dictionary with status, output, error and optionally raw_output
+    """
+    if result["status"] == "error":
+        output = format_output(result)
+        raw_output = result.get("output")
+    else:
+        output = result["output"]
+        raw_output = result.get("raw_output")
+
+    response = {
+        "status": result["status"],
+        "output": output,
+        "error": result["error"]
+    }
+    if raw_output and not (isinstance(output, str) and raw_output in output):
+        response["raw_output"] = raw_output
+    return response
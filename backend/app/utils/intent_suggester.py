@@ -0,0 +1,100 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Words too common in commands to say anything about the intent
+STOP_WORDS = frozenset([
+    "a", "an", "and", "by", "for", "from", "in", "is", "it", "me", "my",
+    "of", "on", "please", "the", "to", "using", "what", "with"
+])
+
+def char_ngrams(text: str, n: int = 3) -> Counter:
+    """Count the character n-grams of each word, padded with spaces at both ends."""
+    grams = Counter()
+    for word in _WORD.findall(text.lower()):
+        if word in STOP_WORDS:
+            continue
+        padded = f" {word} "
+        for i in range(max(1, len(padded) - n + 1)):
+            grams[padded[i:i + n]] += 1
+    return grams
+
+class IntentSuggester:
+    """Finds the phrases closest to a mistyped command.
+
+    Every phrase becomes an L2-normalized TF-IDF vector over character
+    trigrams, stored as an inverted index (n-gram -> [(phrase, weight)]).
+    Scoring a query is one sparse dot product: only the postings of the
+    query's own n-grams are visited. Character n-grams make the match
+    tolerant to typos and inflections.
+    """
+
+    def __init__(self, phrases: Sequence[str], n: int = 3):
+        """Build the index.
+
+        Args:
+            phrases: Phrases to suggest
+            n: Character n-gram length
+        """
+        self.phrases = list(phrases)
+        self.n = n
+
+        counts = [char_ngrams(phrase, n) for phrase in self.phrases]
+        document_frequency = Counter(gram for grams in counts for gram in grams)
+        total = len(self.phrases)
+        self.idf: Dict[str, float] = {
+            gram: math.log((1 + total) / (1 + df)) + 1.0
+            for gram, df in document_frequency.items()
+        }
+        # The idf of an n-gram no phrase contains
+        self.unknown_idf = math.log(1 + total) + 1.0
+
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        for index, grams in enumerate(counts):
+            for gram, weight in self._normalized(grams).items():
+                self.postings.setdefault(gram, []).append((index, weight))
+
+    def _normalized(self, grams: Counter) -> Dict[str, float]:
+        """Return the unit-length TF-IDF vector of n-gram counts, restricted to known n-grams.
+
+        Unknown n-grams count towards the norm with the largest idf, so text
+        that is mostly unknown to the index gets a short vector over the
+        known ones and low scores.
+        """
+        weights = {}
+        norm = 0.0
+        for gram, count in grams.items():
+            weight = count * self.idf.get(gram, self.unknown_idf)
+            norm += weight * weight
+            if gram in self.idf:
+                weights[gram] = weight
+        norm = math.sqrt(norm)
+        if not norm:
+            return {}
+        return {gram: weight / norm for gram, weight in weights.items()}
+
+    def scores(self, text: str) -> Dict[int, float]:
+        """Return the cosine similarity of text to every phrase sharing an n-gram with it."""
+        scores: Dict[int, float] = {}
+        for gram, query_weight in self._normalized(char_ngrams(text, self.n)).items():
+            for index, weight in self.postings[gram]:
+                scores[index] = scores.get(index, 0.0) + query_weight * weight
+        return scores
+
+    def suggest(self, text: str, k: int = 5, min_score: float = 0.25) -> List[str]:
+        """Return up to k phrases most similar to text, best first.
+
+        Args:
+            text: Command that could not be matched
+            k: Maximum number of suggestions
+            min_score: Minimum cosine similarity for a phrase to be suggested
+
+        Returns:
+            List of phrases
+        """
+        best = heapq.nlargest(k, self.scores(text).items(), key=lambda item: item[1])
+        return [self.phrases[index] for index, score in best if score >= min_score]
@@ -0,0 +1,614 @@
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+try:
+    import fcntl
+except ImportError:  # optional: without it (on Windows) updates are only serialized within a process
+    fcntl = None
+
+# Downloads bars for [start, end) in the yf.download layout:
+# downloader(symbols, start, end, interval) -> DataFrame
+# One symbol (a str) gives flat OHLCV columns; a list of symbols gives
+# (field, symbol) MultiIndex columns, as split by split_by_symbol.
+Downloader = Callable[[Union[str, Sequence[str]], str, str, str], pd.DataFrame]
+
+def yfinance_download(symbols: Union[str, Sequence[str]], start: str, end: str, interval: str) -> pd.DataFrame:
+    """Download bars from Yahoo Finance.
+
+    Args:
+        symbols: Ticker symbol, or a list of symbols to download in one request
+        start: First date to download, e.g. '2024-01-01'
+        end: Date to stop before
+        interval: yfinance interval string, e.g. '1h', '1d'
+
+    Returns:
+        DataFrame of OHLCV bars indexed by timestamp, with (field, symbol)
+        columns when a list of symbols was given
+    """
+    data = yf.download(symbols, start=start, end=end, interval=interval, progress=False)
+    if isinstance(symbols, str) and isinstance(data.columns, pd.MultiIndex):
+        data.columns = data.columns.get_level_values(0)
+    return data
+
+def split_by_symbol(data: pd.DataFrame, symbols: Sequence[str]) -> Dict[str, pd.DataFrame]:
+    """Split a multi-symbol download into one OHLCV frame per symbol.
+
+    Columns are selected with DataFrame.xs, which under copy-on-write shares
+    the downloaded data instead of copying it. Rows are only filtered (and
+    copied) for symbols that have no bar at some timestamps of the batch,
+    e.g. when symbols trade on different calendars.
+
+    Args:
+        data: Download with (field, symbol) MultiIndex columns
+        symbols: Symbols that were requested
+
+    Returns:
+        Dictionary mapping each symbol found in data to its frame
+    """
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: data} if len(symbols) == 1 and not data.empty else {}
+
+    level = data.columns.names.index("Ticker") if "Ticker" in data.columns.names else 1
+    available = set(data.columns.get_level_values(level))
+    frames = {}
+    for symbol in symbols:
+        if symbol not in available:
+            continue
+        frame = data.xs(symbol, axis=1, level=level)
+        has_bar = frame.notna().any(axis=1).to_numpy()
+        if not has_bar.all():
+            frame = frame[has_bar]
+        if len(frame):
+            frames[symbol] = frame
+    return frames
+
+def _to_ns(index: pd.DatetimeIndex, tz: Optional[str]) -> np.ndarray:
+    """Convert a DatetimeIndex to int64 nanoseconds (UTC when tz-aware)."""
+    index = pd.DatetimeIndex(index)
+    if tz is not None:
+        index = index.tz_convert("UTC") if index.tz is not None else index.tz_localize(tz).tz_convert("UTC")
+    elif index.tz is not None:
+        index = index.tz_localize(None)
+    return index.as_unit("ns").asi8
+
+def _bound_ns(bound, tz: Optional[str]) -> int:
+    """Convert a date or timestamp bound to int64 nanoseconds in the store's time zone."""
+    timestamp = pd.Timestamp(bound)
+    if tz is not None:
+        timestamp = timestamp.tz_localize(tz) if timestamp.tz is None else timestamp
+    elif timestamp.tz is not None:
+        timestamp = timestamp.tz_localize(None)
+    return timestamp.as_unit("ns").value
+
+class SeriesLock:
+    """Reentrant lock serializing the updates of one series across threads and processes.
+
+    A threading.RLock serializes the threads of this process. While a thread
+    holds it, the process also holds an exclusive flock on the series' lock
+    file, so the workers of a multi-process server (and other processes
+    sharing the store) update a series one at a time too.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        self._lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                except BaseException:
+                    os.close(fd)
+                    raise
+            except BaseException:
+                self._lock.release()
+                raise
+            self._fd = fd
+        self._depth += 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fd, self._fd = self._fd, None
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        self._lock.release()
+
+    def __enter__(self) -> "SeriesLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+class MarketDataStore:
+    """On-disk columnar store of OHLCV bars, one directory per (interval, symbol).
+
+    Each directory holds one raw NumPy file per column plus the timestamp
+    column (int64 nanoseconds), and a meta.json with the row count, dtypes,
+    time zone and the date range that has been downloaded. Reads memory-map
+    the files and slice the requested range with a binary search.
+
+    Writes go to a new generation of files, then meta.json is replaced
+    atomically, so concurrent readers always see a complete generation. The
+    previous generation stays on disk until the next write, and a reader
+    that still finds its generation removed rereads meta.json. Updates of a
+    series are serialized across threads and processes by lock().
+    """
+
+    def __init__(self, root: str):
+        """Open (or create on first write) a store.
+
+        Args:
+            root: Directory holding the store
+        """
+        self.root = root
+        self._locks: Dict[Tuple[str, str], SeriesLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _directory(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, interval, symbol.upper().replace(os.sep, "_"))
+
+    def lock(self, symbol: str, interval: str) -> SeriesLock:
+        """Return the lock serializing updates of one (symbol, interval) series."""
+        key = (symbol.upper(), interval)
+        with self._locks_guard:
+            if key not in self._locks:
+                self._locks[key] = SeriesLock(os.path.join(self._directory(symbol, interval), ".lock"))
+            return self._locks[key]
+
+    def info(self, symbol: str, interval: str) -> Optional[Dict]:
+        """Return the metadata of a stored series, or None if it is not stored."""
+        try:
+            with open(os.path.join(self._directory(symbol, interval), "meta.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _path(self, directory: str, meta: Dict, column: Union[int, str]) -> str:
+        return os.path.join(directory, f"{meta['generation']}-{column}.bin")
+
+    def read(self, symbol: str, interval: str, start=None, end=None) -> Optional[pd.DataFrame]:
+        """Read the bars of a series in [start, end).
+
+        Args:
+            symbol: Ticker symbol
+            interval: yfinance interval string
+            start: First timestamp or date to include (default: first stored bar)
+            end: Timestamp or date to stop before (default: after the last stored bar)
+
+        Returns:
+            DataFrame indexed by timestamp, or None if the series is not stored
+        """
+        directory = self._directory(symbol, interval)
+        meta = self.info(symbol, interval)
+        while meta is not None:
+            try:
+                return self._read_generation(directory, meta, start, end)
+            except FileNotFoundError:
+                # Two writes happened since meta.json was read: read the current generation
+                current = self.info(symbol, interval)
+                if current is None or current["generation"] == meta["generation"]:
+                    raise
+                meta = current
+        return None
+
+    def _read_generation(self, directory: str, meta: Dict, start, end) -> pd.DataFrame:
+        tz, rows = meta["tz"], meta["rows"]
+
+        if rows:
+            index = np.memmap(self._path(directory, meta, "index"), dtype=np.int64, mode="r", shape=(rows,))
+            lo = int(np.searchsorted(index, _bound_ns(start, tz), "left")) if start is not None else 0
+            hi = int(np.searchsorted(index, _bound_ns(end, tz), "left")) if end is not None else rows
+            hi = max(lo, hi)
+            timestamps = np.array(index[lo:hi])
+        else:
+            lo = hi = 0
+            timestamps = np.empty(0, dtype=np.int64)
+
+        columns = {}
+        for position, (name, dtype) in enumerate(meta["columns"]):
+            if hi > lo:
+                values = np.memmap(self._path(directory, meta, position), dtype=dtype, mode="r", shape=(rows,))
+                columns[name] = np.array(values[lo:hi])
+            else:
+                columns[name] = np.empty(0, dtype=dtype)
+
+        index = pd.DatetimeIndex(timestamps.view("datetime64[ns]"), name=meta["index_name"])
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz)
+        return pd.DataFrame(columns, index=index)
+
+    def write(self, symbol: str, interval: str, frame: pd.DataFrame,
+              covered_from: Optional[str] = None, covered_until: Optional[str] = None) -> Dict:
+        """Replace a stored series.
+
+        Args:
+            symbol: Ticker symbol
+            interval: yfinance interval string
+            frame: Bars indexed by timestamp, with numeric columns
+            covered_from: First date the bars were downloaded for (default: first bar)
+            covered_until: Date the download stopped before (default: the day after the last bar)
+
+        Returns:
+            The new metadata
+        """
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        for name in frame.columns:
+            if frame[name].dtype.kind not in "biuf":
+                raise ValueError(f"Column {name!r} is not numeric")
+
+        index = pd.DatetimeIndex(frame.index)
+        tz = str(index.tz) if index.tz is not None else None
+        dates = index.tz_localize(None) if tz is not None else index
+
+        timestamps = _to_ns(index, tz)
+
+        with self.lock(symbol, interval):
+            directory = self._directory(symbol, interval)
+            os.makedirs(directory, exist_ok=True)
+            previous = self.info(symbol, interval)
+            meta = {
+                "generation": previous["generation"] + 1 if previous else 1,
+                "rows": len(frame),
+                "last": int(timestamps[-1]) if len(frame) else None,
+                "tz": tz,
+                "index_name": index.name,
+                "columns": [[str(name), frame[name].dtype.str] for name in frame.columns],
+                "covered_from": covered_from or (dates[0].strftime("%Y-%m-%d") if len(frame) else None),
+                "covered_until": covered_until or (
+                    (dates[-1] + pd.Timedelta(days=1)).strftime("%Y-%m-%d") if len(frame) else None)
+            }
+
+            timestamps.tofile(self._path(directory, meta, "index"))
+            for position, name in enumerate(frame.columns):
+                np.ascontiguousarray(frame[name].to_numpy()).tofile(self._path(directory, meta, position))
+
+            self._write_meta(directory, meta)
+            self._remove_old_generations(directory, meta["generation"])
+            return meta
+
+    def merge(self, symbol: str, interval: str, frame: pd.DataFrame, covered_until: str) -> Dict:
+        """Add newly downloaded bars to a stored series; new bars replace stored ones at the same timestamp."""
+        with self.lock(symbol, interval):
+            meta = self.info(symbol, interval)
+            stored = self.read(symbol, interval)
+            if stored is not None and len(stored):
+                if len(frame):
+                    if stored.index.tz is not None:
+                        frame = frame.tz_convert(stored.index.tz) if frame.index.tz is not None \
+                            else frame.tz_localize(stored.index.tz)
+                    frame = pd.concat([stored, frame[stored.columns.intersection(frame.columns)]])
+                else:
+                    frame = stored
+            return self.write(symbol, interval, frame,
+                              covered_from=meta["covered_from"] if meta else None, covered_until=covered_until)
+
+    def append(self, symbol: str, interval: str, frame: pd.DataFrame, covered_until: Optional[str] = None) -> Dict:
+        """Append newly downloaded bars to a stored series.
+
+        Stored bars from the first new timestamp on are replaced by the new
+        ones, which deduplicates re-downloaded overlap and updates revised bars
+        (such as a still-forming last bar). Bars after the last stored one are
+        written in place past the rows readers use. Stored rows are never
+        overwritten, since readers may be reading them: when bars are revised,
+        the rows before them are copied to a new generation with the new bars.
+        Falls back to merge when the bars reach back before the first stored
+        bar or do not fit the stored columns.
+
+        Args:
+            symbol: Ticker symbol
+            interval: yfinance interval string
+            frame: Bars indexed by timestamp
+            covered_until: Date the download stopped before, if later than the stored one
+
+        Returns:
+            The new metadata
+        """
+        with self.lock(symbol, interval):
+            meta = self.info(symbol, interval)
+            if meta is None or not meta["rows"]:
+                return self.write(symbol, interval, frame,
+                                  covered_from=meta["covered_from"] if meta else None, covered_until=covered_until)
+
+            meta = dict(meta)
+            if covered_until is not None and (meta["covered_until"] is None or covered_until > meta["covered_until"]):
+                meta["covered_until"] = covered_until
+            directory = self._directory(symbol, interval)
+            if frame is None or frame.empty:
+                self._write_meta(directory, meta)
+                return meta
+
+            frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+            names = [name for name, _ in meta["columns"]]
+            timestamps = _to_ns(frame.index, meta["tz"])
+            stored_index = np.memmap(self._path(directory, meta, "index"), dtype=np.int64, mode="r",
+                                     shape=(meta["rows"],))
+            if (set(map(str, frame.columns)) != set(names) or timestamps[0] < stored_index[0]
+                    or not all(np.can_cast(frame[name].dtype, dtype, "same_kind") for name, dtype in meta["columns"])):
+                return self.merge(symbol, interval, frame, covered_until=meta["covered_until"])
+            position = int(np.searchsorted(stored_index, timestamps[0], "left"))
+            del stored_index
+
+            previous = dict(meta)
+            if position < meta["rows"]:
+                meta["generation"] += 1
+            columns = [("index", timestamps)] + [
+                (column, frame[name].to_numpy().astype(dtype, copy=False))
+                for column, (name, dtype) in enumerate(meta["columns"])]
+            for column, values in columns:
+                path = self._path(directory, meta, column)
+                if meta["generation"] != previous["generation"]:
+                    shutil.copyfile(self._path(directory, previous, column), path)
+                self._write_rows(path, position, values)
+
+            meta["rows"] = position + len(frame)
+            meta["last"] = int(timestamps[-1])
+            self._write_meta(directory, meta)
+            self._remove_old_generations(directory, meta["generation"])
+            return meta
+
+    def _write_rows(self, path: str, position: int, values: np.ndarray) -> None:
+        # Rows past meta["rows"] are ignored by readers, so stale bytes there are harmless
+        with open(path, "r+b") as f:
+            f.seek(position * values.dtype.itemsize)
+            f.write(np.ascontiguousarray(values).tobytes())
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[pd.Timestamp]:
+        """Return the timestamp of the last stored bar, or None if there is none."""
+        meta = self.info(symbol, interval)
+        if meta is None or not meta["rows"]:
+            return None
+        last = meta.get("last")
+        if last is None:
+            # Stored before the last timestamp was tracked in meta.json
+            directory = self._directory(symbol, interval)
+            last = int(np.memmap(self._path(directory, meta, "index"), dtype=np.int64, mode="r",
+                                 shape=(meta["rows"],))[-1])
+        timestamp = pd.Timestamp(last, unit="ns")
+        return timestamp.tz_localize("UTC").tz_convert(meta["tz"]) if meta["tz"] else timestamp
+
+    def _write_meta(self, directory: str, meta: Dict) -> None:
+        path = os.path.join(directory, "meta.json")
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(meta, f)
+        os.replace(temporary, path)
+
+    def _remove_old_generations(self, directory: str, generation: int) -> None:
+        # The previous generation is kept for readers that read meta.json before it was replaced
+        for name in os.listdir(directory):
+            if name.endswith(".bin") and int(name.split("-", 1)[0]) < generation - 1:
+                os.remove(os.path.join(directory, name))
+
+    def import_csv(self, symbol: str, interval: str, path: str) -> Dict:
+        """Store bars from a CSV file with a timestamp index column, e.g. one written by DataFrame.to_csv."""
+        frame = pd.read_csv(path, index_col=0)
+        try:
+            index = pd.to_datetime(frame.index)
+        except (TypeError, ValueError):
+            # Offsets change with daylight saving time
+            index = pd.to_datetime(frame.index, utc=True)
+        # Fixed UTC offsets parsed from text are stored as UTC
+        frame.index = index.tz_convert("UTC") if index.tz is not None else index
+        return self.write(symbol, interval, frame)
+
+    def seed(self, directory: str) -> List[Tuple[str, str]]:
+        """Import every <interval>/<SYMBOL>.csv under directory whose series is not stored yet.
+
+        Lets the store work offline, and tests run without downloading.
+
+        Returns:
+            The (symbol, interval) pairs imported
+        """
+        imported = []
+        if not os.path.isdir(directory):
+            return imported
+        for interval in sorted(os.listdir(directory)):
+            interval_dir = os.path.join(directory, interval)
+            if not os.path.isdir(interval_dir):
+                continue
+            for filename in sorted(os.listdir(interval_dir)):
+                symbol, extension = os.path.splitext(filename)
+                if extension == ".csv" and self.info(symbol, interval) is None:
+                    self.import_csv(symbol, interval, os.path.join(interval_dir, filename))
+                    imported.append((symbol.upper(), interval))
+        return imported
+
+def ingest(store: MarketDataStore, downloader: Downloader, symbol: str, interval: str,
+           end: Optional[str] = None) -> int:
+    """Download the bars after the last stored one and append them to the store.
+
+    The download starts on the day of the last stored bar, so that bar is
+    fetched again and replaced if it was revised; the rest of the overlap is
+    deduplicated by MarketDataStore.append.
+
+    Args:
+        store: Market data store holding the series
+        downloader: Function that downloads bars
+        symbol: Ticker symbol
+        interval: yfinance interval string
+        end: Date to stop before (default: include today's bars)
+
+    Returns:
+        Number of bars added
+
+    Raises:
+        ValueError: If the series has no stored bars to continue from
+    """
+    today = pd.Timestamp.now().normalize()
+    end = end or (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    with store.lock(symbol, interval):
+        last = store.last_timestamp(symbol, interval)
+        if last is None:
+            raise ValueError(f"No stored {interval} bars for {symbol} to continue from")
+        rows = store.info(symbol, interval)["rows"]
+        data = downloader(symbol, last.strftime("%Y-%m-%d"), end, interval)
+        # Days before today are complete; today's bars may still change
+        covered_until = min(end, today.strftime("%Y-%m-%d"))
+        meta = store.append(symbol, interval, data if data is not None else pd.DataFrame(), covered_until=covered_until)
+        return meta["rows"] - rows
+
+def _plan_download(store: MarketDataStore, symbol: str, interval: str,
+                   start: str, end: str) -> Optional[Tuple[str, str, bool]]:
+    """Return the (start, end, replace) download that [start, end) still needs, or None.
+
+    A series that was never stored, or that must now reach back before its
+    first downloaded date, is downloaded for the whole range and replaced.
+    Otherwise only the bars from the day of the last stored bar are appended.
+    """
+    meta = store.info(symbol, interval)
+    if meta is None or not meta["rows"] or start < meta["covered_from"]:
+        return start, end, True
+    if end > meta["covered_until"]:
+        return store.last_timestamp(symbol, interval).strftime("%Y-%m-%d"), end, False
+    return None
+
+def _store_download(store: MarketDataStore, symbol: str, interval: str,
+                    plan: Tuple[str, str, bool], data: Optional[pd.DataFrame]) -> None:
+    """Write or append the bars downloaded for a plan made by _plan_download."""
+    start, end, replace = plan
+    if replace:
+        if data is not None and not data.empty:
+            store.write(symbol, interval, data, covered_from=start, covered_until=end)
+    else:
+        # Days before today are complete; today's bars may still change
+        today = pd.Timestamp.now().strftime("%Y-%m-%d")
+        store.append(symbol, interval, data if data is not None else pd.DataFrame(), covered_until=min(end, today))
+
+def load_bars(store: MarketDataStore, downloader: Downloader, symbol: str, interval: str,
+              start: str, end: str) -> Optional[pd.DataFrame]:
+    """Return the bars of [start, end) from the store, downloading only what it lacks.
+
+    A series that was never stored, or that must now reach back before its
+    first downloaded date, is downloaded for the whole range. Otherwise new
+    bars are ingested incrementally. If a download fails, stored bars are
+    served instead, so the store also works offline.
+
+    Args:
+        store: Market data store
+        downloader: Function that downloads bars
+        symbol: Ticker symbol
+        interval: yfinance interval string
+        start: First date, e.g. '2024-01-01'
+        end: Date to stop before
+
+    Returns:
+        DataFrame of bars, or None if there is no data
+    """
+    with store.lock(symbol, interval):
+        plan = _plan_download(store, symbol, interval, start, end)
+        if plan is not None:
+            try:
+                _store_download(store, symbol, interval, plan, downloader(symbol, plan[0], plan[1], interval))
+            except Exception as e:
+                if store.info(symbol, interval) is None:
+                    raise
+                print(f"Warning: could not update {symbol} {interval} bars, serving stored data: {str(e)}")
+
+    return store.read(symbol, interval, start=start, end=end)
+
+def load_many(store: MarketDataStore, downloader: Downloader, symbols: Sequence[str], interval: str,
+              start: str, end: str, batch_size: int = 50, max_workers: int = 4) -> Dict[str, pd.DataFrame]:
+    """Return the bars of [start, end) for many symbols, downloading what the store lacks in batches.
+
+    Symbols needing the same download range are requested together, up to
+    batch_size per downloader call, with at most max_workers calls in flight.
+    Each batch is split per symbol and stored as load_bars would. Symbols
+    whose download fails are served from the store when possible.
+
+    Args:
+        store: Market data store
+        downloader: Function that downloads bars (called with a list of symbols)
+        symbols: Ticker symbols
+        interval: yfinance interval string
+        start: First date, e.g. '2024-01-01'
+        end: Date to stop before
+        batch_size: Maximum number of symbols per download
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        Dictionary mapping each symbol with data to its bars
+    """
+    groups: Dict[Tuple[str, str, bool], List[str]] = {}
+    for symbol in dict.fromkeys(symbols):
+        plan = _plan_download(store, symbol, interval, start, end)
+        if plan is not None:
+            groups.setdefault(plan, []).append(symbol)
+    batches = [(plan, group[i:i + batch_size])
+               for plan, group in groups.items() for i in range(0, len(group), batch_size)]
+
+    def download(batch):
+        plan, batch_symbols = batch
+        return split_by_symbol(downloader(list(batch_symbols), plan[0], plan[1], interval), batch_symbols)
+
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = {executor.submit(download, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                plan, batch_symbols = futures[future]
+                try:
+                    frames = future.result()
+                except Exception as e:
+                    print(f"Warning: could not download {interval} bars for {', '.join(batch_symbols)}: {str(e)}")
+                    continue
+                for symbol in batch_symbols:
+                    with store.lock(symbol, interval):
+                        _store_download(store, symbol, interval, plan, frames.get(symbol))
+
+    results = {}
+    for symbol in dict.fromkeys(symbols):
+        data = store.read(symbol, interval, start=start, end=end)
+        if data is not None and len(data):
+            results[symbol] = data
+    return results
+
+def bars_since(store: MarketDataStore, downloader: Downloader, symbol: str, interval: str,
+               since=None) -> Optional[pd.DataFrame]:
+    """Ingest new bars, then return the stored bars at or after since.
+
+    The bar at ``since`` itself is included, so a consumer polling with the
+    timestamp of the last bar it has also receives revisions of that bar.
+
+    Args:
+        store: Market data store
+        downloader: Function that downloads bars
+        symbol: Ticker symbol
+        interval: yfinance interval string
+        since: Timestamp or date (default: all stored bars)
+
+    Returns:
+        DataFrame of bars, or None if the series is not stored
+    """
+    try:
+        ingest(store, downloader, symbol, interval)
+    except Exception as e:
+        print(f"Warning: could not ingest {symbol} {interval} bars, serving stored data: {str(e)}")
+    return store.read(symbol, interval, start=since)
+
+_default_store = None
+_default_store_guard = threading.Lock()
+
+def default_store() -> MarketDataStore:
+    """Return the process-wide store in MARKET_DATA_DIR, seeded from MARKET_DATA_SEED_DIR if set."""
+    global _default_store
+    with _default_store_guard:
+        if _default_store is None:
+            _default_store = MarketDataStore(os.environ.get("MARKET_DATA_DIR", "market_data"))
+            seed_directory = os.environ.get("MARKET_DATA_SEED_DIR")
+            if seed_directory:
+                _default_store.seed(seed_directory)
+        return _default_store
@@ -0,0 +1,163 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond translations to long CLI runs
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render a Prometheus label set, e.g. {route="/api/ping",method="GET"}."""
+    parts = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{name}="{escaped}"')
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    """Base for metrics keyed by a tuple of label values."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in values]
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed, cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum, count]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return entry[2] if entry else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = [(labels, list(entry[0]), entry[1], entry[2]) for labels, entry in self._values.items()]
+        lines = []
+        for labels, counts, total, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+class MetricsRegistry:
+    """Collection of metrics rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Process-wide registry served on /metrics
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    "dymension_http_request_duration_seconds", "Time spent handling HTTP requests.", ("route", "method")))
+REQUESTS_TOTAL = registry.register(Counter(
+    "dymension_http_requests_total", "HTTP requests handled, by status code.", ("route", "method", "status")))
+REQUESTS_IN_FLIGHT = registry.register(Gauge(
+    "dymension_http_requests_in_flight", "HTTP requests currently being handled."))
+SPAN_LATENCY = registry.register(Histogram(
+    "dymension_span_duration_seconds", "Time spent in instrumented steps of request handling.", ("span",)))
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Record the wall time of the enclosed block in SPAN_LATENCY."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        SPAN_LATENCY.observe(time.perf_counter() - start, name)
+
+def request_started() -> float:
+    """Mark a request as in flight and return its start time."""
+    REQUESTS_IN_FLIGHT.inc()
+    return time.perf_counter()
+
+def request_finished(start: float, route: str, method: str, status: int) -> None:
+    """Record the latency and status of a request started with request_started."""
+    REQUEST_LATENCY.observe(time.perf_counter() - start, route, method)
+    REQUESTS_TOTAL.inc(route, method, str(status))
+
+def request_closed() -> None:
+    """Remove a request from the in-flight count, whether or not it produced a response."""
+    REQUESTS_IN_FLIGHT.dec()
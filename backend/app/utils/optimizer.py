@@ -0,0 +1,140 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from app.utils.backtester import performance_stats, sharpe_ratio, strategy_returns
+from app.utils.crossover_engine import CrossoverGrid
+
+# Below this many pair x bar values a grid is evaluated in-process; starting
+# worker processes would take longer than the work itself
+PARALLEL_MIN_SIZE = 20_000_000
+
+def window_grid(short_windows: Sequence[int], long_windows: Sequence[int]) -> List[Tuple[int, int]]:
+    """Return every (short, long) window pair with short < long."""
+    return [(short, long) for short in short_windows for long in long_windows if short < long]
+
+def walk_forward_folds(bars: int, train_bars: int, test_bars: int) -> List[Tuple[int, int, int]]:
+    """Return rolling (train_start, test_start, test_end) bar positions.
+
+    Each fold trains on train_bars bars and tests on the following test_bars
+    bars; the next fold starts test_bars later. The last test period may be
+    shorter.
+    """
+    return [(start, start + train_bars, min(start + train_bars + test_bars, bars))
+            for start in range(0, bars - train_bars, test_bars)]
+
+def _evaluate(prices: np.ndarray, pairs: List[Tuple[int, int]], folds: List[Tuple[int, int, int]],
+              periods_per_year: int) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Full-period stats of each pair and its Sharpe ratio in each fold's training period."""
+    returns = strategy_returns(prices, CrossoverGrid(prices, pairs).signals)
+    train_sharpe = np.array([sharpe_ratio(returns[:, start:test_start], periods_per_year)
+                             for start, test_start, _ in folds]).reshape(len(folds), len(pairs))
+    return performance_stats(returns, periods_per_year), train_sharpe
+
+def _evaluate_shared(name: str, length: int, pairs: List[Tuple[int, int]], folds: List[Tuple[int, int, int]],
+                     periods_per_year: int) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Run _evaluate in a worker process on prices held in shared memory."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return _evaluate(np.ndarray((length,), dtype=np.float64, buffer=shm.buf), pairs, folds, periods_per_year)
+    finally:
+        shm.close()
+
+def _evaluate_parallel(prices: np.ndarray, pairs: List[Tuple[int, int]], folds: List[Tuple[int, int, int]],
+                       periods_per_year: int, max_workers: int) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Split pairs into one chunk per worker; workers read prices from shared memory instead of a pickled copy."""
+    shm = shared_memory.SharedMemory(create=True, size=max(prices.nbytes, 1))
+    try:
+        np.ndarray(prices.shape, dtype=np.float64, buffer=shm.buf)[:] = prices
+        chunks = [list(chunk) for chunk in np.array_split(np.array(pairs), max_workers) if len(chunk)]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            results = list(pool.map(_evaluate_shared, [shm.name] * len(chunks), [len(prices)] * len(chunks),
+                                    [[tuple(pair) for pair in chunk] for chunk in chunks],
+                                    [folds] * len(chunks), [periods_per_year] * len(chunks)))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    stats = {key: np.concatenate([result[0][key] for result in results]) for key in results[0][0]}
+    return stats, np.concatenate([result[1] for result in results], axis=1)
+
+def optimize_windows(data: pd.DataFrame, short_windows: Sequence[int], long_windows: Sequence[int],
+                     train_bars: Optional[int] = None, test_bars: Optional[int] = None,
+                     periods_per_year: int = 252, max_workers: Optional[int] = None) -> Dict:
+    """Grid search and walk-forward evaluation of momentum_trading_strategy window pairs.
+
+    Every (short, long) pair of the grid is backtested over the whole series
+    (long while its signal is 1, no costs). Walk-forward evaluation then
+    picks, in each fold, the pair with the best Sharpe ratio over the
+    training period and records how it did over the following test period,
+    which gives an out-of-sample estimate of the tuning itself.
+
+    Large grids are split across a process pool, with the prices in shared
+    memory; smaller ones run in-process, which is faster.
+
+    Args:
+        data: DataFrame with a 'Close' column, e.g. from fetch_stock_data
+        short_windows: Short moving average windows to try
+        long_windows: Long moving average windows to try
+        train_bars: Bars per training period (default: half the series)
+        test_bars: Bars per test period (default: a quarter of the rest)
+        periods_per_year: Bars per year, used to annualize the Sharpe ratio
+        max_workers: Worker processes (default: CPU count for large grids; 1 runs in-process)
+
+    Returns:
+        Dict with:
+            results: DataFrame indexed by (short_window, long_window) with
+                total_return, sharpe and max_drawdown, best Sharpe first
+            best: The (short_window, long_window) pair with the best Sharpe ratio
+            walk_forward: DataFrame with one row per fold: its periods, chosen
+                pair, training Sharpe ratio and test stats
+            walk_forward_stats: Stats of the concatenated test periods
+    """
+    prices = np.ascontiguousarray(data['Close'], dtype=np.float64)
+    pairs = window_grid(short_windows, long_windows)
+    if not pairs:
+        raise ValueError("The window grid has no pair with short_window < long_window")
+
+    train_bars = train_bars or len(prices) // 2
+    test_bars = test_bars or max((len(prices) - train_bars) // 4, 1)
+    folds = walk_forward_folds(len(prices), train_bars, test_bars)
+
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) if len(pairs) * len(prices) >= PARALLEL_MIN_SIZE else 1
+    if max_workers > 1 and len(pairs) > 1:
+        stats, train_sharpe = _evaluate_parallel(prices, pairs, folds, periods_per_year, max_workers)
+    else:
+        stats, train_sharpe = _evaluate(prices, pairs, folds, periods_per_year)
+
+    results = pd.DataFrame(stats, index=pd.MultiIndex.from_tuples(pairs, names=['short_window', 'long_window']))
+
+    # Rerun only the pairs chosen per fold over their test periods
+    chosen = [pairs[i] for i in np.argmax(train_sharpe, axis=1)] if folds else []
+    grid = CrossoverGrid(prices, chosen)
+    returns = strategy_returns(prices, grid.signals)
+    test_returns = [returns[grid.row(*pair), test_start:test_end]
+                    for pair, (_, test_start, test_end) in zip(chosen, folds)]
+    fold_stats = [performance_stats(fold_returns, periods_per_year) for fold_returns in test_returns]
+    index = data.index
+    walk_forward = pd.DataFrame({
+        'train_start': [index[start] for start, _, _ in folds],
+        'test_start': [index[test_start] for _, test_start, _ in folds],
+        'test_end': [index[test_end - 1] for _, _, test_end in folds],
+        'short_window': [pair[0] for pair in chosen],
+        'long_window': [pair[1] for pair in chosen],
+        'train_sharpe': [train_sharpe[fold].max() for fold in range(len(folds))],
+        'test_return': [float(s['total_return']) for s in fold_stats],
+        'test_sharpe': [float(s['sharpe']) for s in fold_stats],
+        'test_max_drawdown': [float(s['max_drawdown']) for s in fold_stats]
+    })
+    out_of_sample = np.concatenate(test_returns) if test_returns else np.zeros(1)
+
+    return {
+        'results': results.sort_values('sharpe', ascending=False),
+        'best': tuple(int(window) for window in results['sharpe'].idxmax()),
+        'walk_forward': walk_forward,
+        'walk_forward_stats': {key: float(value) for key, value in
+                               performance_stats(out_of_sample, periods_per_year).items()}
+    }
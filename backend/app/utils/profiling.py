@@ -0,0 +1,197 @@
+import cProfile
+import functools
+import inspect
+import itertools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+
+# Profile every call of a profiled function: "sample" or "cprofile"
+PROFILE_ENV = "DYMENSION_PROFILE"
+# Set to "1" to let clients profile a single request with PROFILE_HEADER
+PROFILE_HEADER_ENV = "DYMENSION_PROFILE_HEADER"
+# Directory the collapsed-stack files are written to
+PROFILE_DIR_ENV = "DYMENSION_PROFILE_DIR"
+
+PROFILE_HEADER = "X-Dymension-Profile"
+PROFILE_MODES = ("sample", "cprofile")
+
+# Mode requested for the current request through PROFILE_HEADER
+request_mode: ContextVar[Optional[str]] = ContextVar("dymension_profile_request_mode", default=None)
+# Set while a profile is being captured, so nested profiled calls are part of the outer one
+_capturing: ContextVar[bool] = ContextVar("dymension_profile_capturing", default=False)
+# Numbers the profiles of this process, so profiles written within a second get distinct files
+_profile_numbers = itertools.count(1)
+
+def _frame_label(filename: str, name: str) -> str:
+    """Name a frame as it appears in collapsed stacks, e.g. sk_models.py:train."""
+    if filename == "~":  # built-in functions in pstats
+        return name
+    return f"{os.path.basename(filename)}:{name}"
+
+def mode_from_headers(headers) -> Optional[str]:
+    """Return the profiling mode a request asks for, if the header toggle is enabled."""
+    if os.environ.get(PROFILE_HEADER_ENV) != "1":
+        return None
+    mode = headers.get(PROFILE_HEADER, "").strip().lower()
+    return mode if mode in PROFILE_MODES else None
+
+def active_mode() -> Optional[str]:
+    """Return the profiling mode for the current call, or None when profiling is off."""
+    mode = request_mode.get() or os.environ.get(PROFILE_ENV, "").strip().lower()
+    return mode if mode in PROFILE_MODES else None
+
+class StackSampler:
+    """Samples the call stack of one thread at a fixed interval.
+
+    Each sample is stored as a collapsed stack ("outer;inner;leaf") so the
+    counts can be fed straight into flamegraph.pl or speedscope.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.001):
+        """Prepare a sampler.
+
+        Args:
+            thread_id: Thread to sample, defaults to the calling thread
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code.co_filename, frame.f_code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+def pstats_to_collapsed(stats: pstats.Stats, max_depth: int = 64, max_nodes: int = 100_000) -> Counter:
+    """Convert cProfile statistics to collapsed stacks weighted in microseconds.
+
+    cProfile only records caller -> callee edges, so full stacks are rebuilt
+    by walking the call graph from its roots and splitting each function's
+    time between its callers in proportion to their cumulative time. A
+    callee already on the current stack is not entered again, so recursion
+    is folded into its outermost call, and the walk stops after max_nodes
+    stacks so a densely connected graph cannot make it run for long.
+    """
+    callees: Dict[Tuple, Dict[Tuple, float]] = {}
+    roots = []
+    for func, (_, calls, _, _, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+        # Calls not made by a profiled caller entered the profiled code, even
+        # when the function also has profiled callers (the profiled code is
+        # part of a cycle)
+        if sum(edge[1] for caller, edge in callers.items() if caller in stats.stats) < calls:
+            roots.append(func)
+
+    collapsed: Counter = Counter()
+    budget = [max_nodes]
+
+    def walk(func, stack, on_stack, seconds):
+        budget[0] -= 1
+        _, _, self_time, total_time, _ = stats.stats[func]
+        stack = stack + [_frame_label(func[0], func[2])]
+        on_stack = on_stack | {func}
+        scale = seconds / total_time if total_time else 0.0
+        weight = int(round(self_time * scale * 1e6))
+        if weight:
+            collapsed[";".join(stack)] += weight
+        if len(stack) >= max_depth:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            if budget[0] <= 0:
+                return
+            # Branches below a microsecond would not show up in the output
+            if callee not in on_stack and edge_time * scale >= 5e-7:
+                walk(callee, stack, on_stack, edge_time * scale)
+
+    for root in roots:
+        walk(root, [], frozenset(), stats.stats[root][3])
+    return collapsed
+
+def write_collapsed(samples: Counter, name: str) -> str:
+    """Write collapsed stacks to a new file in the profile directory and return its path."""
+    directory = os.environ.get(PROFILE_DIR_ENV, "profiles")
+    os.makedirs(directory, exist_ok=True)
+    filename = (f"{name.replace('/', '_')}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+                f"-{next(_profile_numbers)}.collapsed")
+    path = os.path.join(directory, filename)
+    with open(path, "x") as f:
+        for stack, count in samples.most_common():
+            f.write(f"{stack} {count}\n")
+    return path
+
+@contextmanager
+def profile(name: str, mode: Optional[str] = None) -> Iterator[None]:
+    """Profile the enclosed block and write its collapsed stacks, if profiling is on.
+
+    Args:
+        name: Prefix of the output file
+        mode: "sample" or "cprofile"; defaults to the mode of the current request or PROFILE_ENV
+    """
+    mode = mode or active_mode()
+    if mode is None or _capturing.get():
+        yield
+        return
+
+    token = _capturing.set(True)
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ allows one cProfile at a time; sample concurrent requests instead
+            mode = "sample"
+    if mode == "sample":
+        profiler = StackSampler().start()
+    try:
+        yield
+    finally:
+        _capturing.reset(token)
+        if mode == "cprofile":
+            profiler.disable()
+            samples = pstats_to_collapsed(pstats.Stats(profiler))
+        else:
+            samples = profiler.stop()
+        path = write_collapsed(samples, name)
+        print(f"Wrote {mode} profile of {name} to {path}")
+
+def profiled(name: str):
+    """Decorator that profiles each call of a function (or coroutine function) while profiling is on."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with profile(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,178 @@
+import asyncio
+import math
+import threading
+import time
+import weakref
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+# Seconds a read-only result stays fresh, by leading subcommand words (the
+# binary name is skipped). The longest matching prefix wins. DymensionCLI
+# keys version results by the binary's mtime, so an upgrade is a cache miss.
+DEFAULT_QUERY_TTLS: Dict[Tuple[str, ...], float] = {
+    ("version",): math.inf,
+    ("query", "rollapp"): 10.0,
+    ("query", "sequencer"): 10.0,
+    ("query", "bank"): 2.0,
+}
+
+class _Flight:
+    """A command currently being run on behalf of every caller asking for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict] = None
+        self.error: Optional[BaseException] = None
+
+class QueryResultCache:
+    """TTL cache for the results of read-only CLI commands.
+
+    Concurrent requests for the same key share a single execution
+    (single-flight), both for threads and for tasks on an event loop. Only
+    successful results are stored. invalidate() drops everything and also
+    prevents results from commands still in flight from being stored.
+    """
+
+    def __init__(self, ttls: Optional[Dict[Tuple[str, ...], float]] = None, default_ttl: float = 2.0):
+        """Initialize the cache.
+
+        Args:
+            ttls: Seconds to keep results, by leading subcommand words
+            default_ttl: Seconds to keep results of commands not listed in ttls
+        """
+        self.ttls = DEFAULT_QUERY_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, Tuple[float, Dict]] = {}
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._async_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = weakref.WeakKeyDictionary()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, args: Sequence[str]) -> float:
+        """Return the TTL for a command, matching its subcommand words against ttls."""
+        words = tuple(args[1:])
+        for length in range(len(words), 0, -1):
+            ttl = self.ttls.get(words[:length])
+            if ttl is not None:
+                return ttl
+        return self.default_ttl
+
+    def _lookup(self, key: Hashable) -> Optional[Dict]:
+        """Return a copy of a fresh entry and count the hit or miss. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, result = entry
+            if time.monotonic() < expires:
+                self.hits += 1
+                return dict(result)
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def _store(self, key: Hashable, result: Dict, ttl: float, generation: int) -> None:
+        """Keep a successful result unless the cache was invalidated meanwhile. Caller holds the lock."""
+        if ttl > 0 and generation == self._generation and result.get("status") == "success":
+            self._entries[key] = (time.monotonic() + ttl, dict(result))
+
+    def put(self, key: Hashable, result: Dict, ttl: float) -> None:
+        """Store a result under a key of its own, e.g. one it turned out to answer as well."""
+        with self._lock:
+            self._store(key, result, ttl, self._generation)
+
+    def get_or_run(self, key: Hashable, ttl: float, run: Callable[[], Dict]) -> Dict:
+        """Return the cached result for key, or call run() once for all concurrent callers.
+
+        Args:
+            key: Cache key, e.g. the command's argument tuple
+            ttl: Seconds to keep the result
+            run: Function executing the command
+
+        Returns:
+            Command result dict
+        """
+        with self._lock:
+            result = self._lookup(key)
+            if result is not None:
+                return result
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                generation = self._generation
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return dict(flight.result)
+
+        try:
+            flight.result = run()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if flight.result is not None:
+                    self._store(key, flight.result, ttl, generation)
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    async def get_or_run_async(self, key: Hashable, ttl: float, run: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Awaitable version of get_or_run; callers on the same event loop share one run."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            result = self._lookup(key)
+            if result is not None:
+                return result
+            inflight = self._async_inflight.setdefault(loop, {})
+            future = inflight.get(key)
+            leader = future is None
+            if leader:
+                future = inflight[key] = loop.create_future()
+                generation = self._generation
+
+        if not leader:
+            try:
+                return dict(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                # The leader was cancelled rather than this caller: run again
+                if future.cancelled():
+                    return await self.get_or_run_async(key, ttl, run)
+                raise
+
+        try:
+            result = await run()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when no follower is waiting for it
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    self._store(key, future.result(), ttl, generation)
+                inflight.pop(key, None)
+
+    def invalidate(self) -> None:
+        """Drop every cached result, e.g. after a transaction changed chain state."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def info(self) -> Dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "in_flight": len(self._inflight) + sum(len(flights) for flights in self._async_inflight.values())
+            }
@@ -0,0 +1,152 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pandas as pd
+from app.utils.market_data import Downloader, MarketDataStore, load_bars
+
+# pandas rules for intervals derived from finer bars; bins are labelled by
+# their start, like the bars Yahoo Finance returns
+RESAMPLE_RULES = {
+    "1d": "1D",
+    "1wk": "W-MON",
+    "1mo": "MS",
+}
+
+# Stored intervals each derived interval can be built from, finest first.
+# Daily bars are the base that is downloaded when nothing finer is stored.
+BASE_INTERVALS = {
+    "1d": ("1h",),
+    "1wk": ("1h", "1d"),
+    "1mo": ("1h", "1d"),
+}
+
+# How each OHLCV column is aggregated; other columns keep their last value
+OHLCV_AGGREGATIONS = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+}
+
+def resample_bars(bars: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Aggregate bars into coarser OHLCV bars.
+
+    Args:
+        bars: Bars indexed by timestamp
+        interval: Target yfinance interval, one of RESAMPLE_RULES
+
+    Returns:
+        DataFrame with one row per bin that contains at least one bar
+    """
+    aggregations = {column: OHLCV_AGGREGATIONS.get(column, "last") for column in bars.columns}
+    resampled = bars.resample(RESAMPLE_RULES[interval], label="left", closed="left").agg(aggregations)
+    if "Close" in resampled.columns:
+        resampled = resampled[resampled["Close"].notna()]
+    return resampled
+
+class ResampleCache:
+    """LRU cache of resampled series, keyed by the version of the stored base series.
+
+    A stored series changes version whenever it is rewritten or appended to
+    (its generation, row count or last timestamp change), so a cached result
+    is never served for data that has changed since.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, Tuple[Tuple, pd.DataFrame]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, store: MarketDataStore, symbol: str, base: str, interval: str) -> Optional[pd.DataFrame]:
+        """Return the full stored base series resampled to interval, or None if it is not stored."""
+        meta = store.info(symbol, base)
+        if meta is None:
+            return None
+        key = (store.root, symbol.upper(), base, interval)
+        version = (meta["generation"], meta["rows"], meta.get("last"))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        resampled = resample_bars(store.read(symbol, base), interval)
+        with self._lock:
+            self._entries[key] = (version, resampled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return resampled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> Dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+# Process-wide cache used by load_resampled
+resample_cache = ResampleCache()
+
+def _covers(meta: Optional[Dict], start: str, end: str) -> bool:
+    return bool(meta and meta["rows"] and meta["covered_from"] <= start and meta["covered_until"] >= end)
+
+def read_resampled(store: MarketDataStore, symbol: str, base: str, interval: str,
+                   start: str, end: str, cache: ResampleCache = None) -> Optional[pd.DataFrame]:
+    """Return the [start, end) bins of a stored base series resampled to interval.
+
+    Args:
+        store: Market data store
+        symbol: Ticker symbol
+        base: Stored yfinance interval to resample
+        interval: Target yfinance interval, one of RESAMPLE_RULES
+        start: First date, e.g. '2024-01-01'
+        end: Date to stop before
+        cache: Cache of resampled series (default: resample_cache)
+
+    Returns:
+        DataFrame of bins starting in [start, end), or None if the base series is not stored
+    """
+    bars = (cache or resample_cache).get(store, symbol, base, interval)
+    if bars is None:
+        return None
+    bounds = [pd.Timestamp(start), pd.Timestamp(end)]
+    if bars.index.tz is not None:
+        bounds = [bound.tz_localize(bars.index.tz) for bound in bounds]
+    return bars[(bars.index >= bounds[0]) & (bars.index < bounds[1])]
+
+def load_resampled(store: MarketDataStore, downloader: Downloader, symbol: str, interval: str,
+                   start: str, end: str, cache: ResampleCache = None) -> Optional[pd.DataFrame]:
+    """Return [start, end) bars of a derived interval, built from finer stored bars when possible.
+
+    The finest stored base series that covers the window is resampled, so
+    switching a chart between intervals needs no download. Otherwise daily
+    bars are loaded (downloading what the store lacks) and, for weekly and
+    monthly bars, resampled.
+
+    Args:
+        store: Market data store
+        downloader: Function that downloads bars
+        symbol: Ticker symbol
+        interval: Target yfinance interval, one of RESAMPLE_RULES
+        start: First date, e.g. '2024-01-01'
+        end: Date to stop before
+        cache: Cache of resampled series (default: resample_cache)
+
+    Returns:
+        DataFrame of bars, or None if there is no data
+    """
+    for base in BASE_INTERVALS[interval]:
+        if _covers(store.info(symbol, base), start, end):
+            return read_resampled(store, symbol, base, interval, start, end, cache=cache)
+
+    daily = load_bars(store, downloader, symbol, "1d", start, end)
+    if daily is None or interval == "1d":
+        return daily
+    return read_resampled(store, symbol, "1d", interval, start, end, cache=cache)
@@ -0,0 +1,196 @@
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from app.utils.market_data import MarketDataStore, default_store
+from app.utils.query_cache import QueryResultCache
+from app.utils.resampling import RESAMPLE_RULES
+from app.utils.trading_strategy import INTERVALS, fetch_many, yahoo_symbol
+
+# Length of a bar per stored yfinance interval, in seconds (weekly and
+# monthly bars are resampled from stored daily bars)
+BAR_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '1h': 3600,
+    '1d': 86400
+}
+
+# Scan results per (symbols, timeframe, interval, windows, last stored bars);
+# concurrent identical scans share one run
+scan_cache = QueryResultCache()
+
+def align_closes(frames: Dict[str, pd.DataFrame]) -> Tuple[List[str], pd.DatetimeIndex, np.ndarray]:
+    """Align the close prices of many symbols on the union of their timestamps.
+
+    Args:
+        frames: Bars per symbol, e.g. from fetch_many
+
+    Returns:
+        (symbols, index, closes) where closes has shape (symbols, timestamps)
+        and is NaN where a symbol has no bar
+    """
+    symbols = list(frames)
+    if not symbols:
+        return [], pd.DatetimeIndex([]), np.empty((0, 0))
+    closes = pd.concat({symbol: frames[symbol]['Close'] for symbol in symbols}, axis=1).sort_index()
+    return symbols, closes.index, np.ascontiguousarray(closes.to_numpy(dtype=np.float64).T)
+
+def last_two_means(tail: np.ndarray, window: int) -> np.ndarray:
+    """Means of the windows ending at the last two columns of each row.
+
+    Each window is summed on its own rather than as a difference of prefix
+    sums, and a window of equal prices has that price as its mean, as in
+    pandas, so flat or stale prices give exactly equal averages.
+
+    Args:
+        tail: Array of shape (symbols, bars), at least window + 1 bars
+        window: Window length in bars
+
+    Returns:
+        Array of shape (symbols, 2), NaN where a window contains a NaN
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(tail, window, axis=1)[:, -2:]
+    means = windows.sum(axis=2) / window
+    flat = windows.max(axis=2) == windows.min(axis=2)
+    return np.where(flat, windows[..., -1], means)
+
+def last_bar_crossovers(closes: np.ndarray, short_window: int, long_window: int) -> Dict[str, np.ndarray]:
+    """Crossover state of every row's last bar, in one vectorized pass.
+
+    Each row is evaluated on its own bars, skipping its NaNs, with the rule of
+    momentum_trading_strategy: the signal is 1 from bar short_window on while
+    the short moving average is above the long one, and positions is the
+    change of signal.
+
+    Args:
+        closes: Array of shape (symbols, timestamps)
+        short_window: Short moving average window
+        long_window: Long moving average window
+
+    Returns:
+        Dict of arrays with one value per row: last (column of the last bar,
+        -1 if none), short_mavg, long_mavg, signal and positions (NaN with
+        fewer than two bars)
+    """
+    valid = ~np.isnan(closes)
+    counts = valid.sum(axis=1)
+    last = np.where(counts > 0, closes.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1), -1)
+
+    # Move each row's bars to its end, in order, so the last columns hold every symbol's latest bars
+    bars = max(short_window, long_window) + 1
+    order = np.argsort(valid, axis=1, kind='stable')
+    tail = np.take_along_axis(closes, order[:, -bars:], axis=1)
+    if tail.shape[1] < bars:
+        tail = np.concatenate([np.full((len(tail), bars - tail.shape[1]), np.nan), tail], axis=1)
+    averages = np.stack([last_two_means(tail, short_window), last_two_means(tail, long_window)])
+
+    with np.errstate(invalid='ignore'):
+        above = averages[0] > averages[1]
+    # Position of the last two bars in each symbol's own series
+    positions_in_series = counts[:, None] + np.array([-2, -1])
+    signals = (above & (positions_in_series >= short_window)).astype(np.float64)
+    positions = np.where(counts >= 2, signals[:, 1] - signals[:, 0], np.nan)
+    return {
+        'last': last,
+        'short_mavg': averages[0, :, -1],
+        'long_mavg': averages[1, :, -1],
+        'signal': signals[:, 1],
+        'positions': positions
+    }
+
+def scan_crossovers(frames: Dict[str, pd.DataFrame], short_window: int = 5, long_window: int = 20) -> Dict:
+    """Find the symbols whose last bar is a moving average crossover.
+
+    Args:
+        frames: Bars per symbol, e.g. from fetch_many
+        short_window: Short moving average window
+        long_window: Long moving average window
+
+    Returns:
+        Dict with status, bar (the latest timestamp of any symbol), scanned
+        (number of symbols with data) and matches: one dict per crossover
+        with symbol, timestamp, price, short_mavg, long_mavg and positions
+        (1.0 for a buy signal, -1.0 for a sell signal)
+    """
+    symbols, index, closes = align_closes(frames)
+    state = last_bar_crossovers(closes, short_window, long_window) if symbols else None
+    matches = []
+    if state is not None:
+        for row in np.flatnonzero(np.abs(state['positions']) == 1.0):
+            column = state['last'][row]
+            matches.append({
+                'symbol': symbols[row],
+                'timestamp': index[column].isoformat(),
+                'price': float(closes[row, column]),
+                'short_mavg': float(state['short_mavg'][row]),
+                'long_mavg': float(state['long_mavg'][row]),
+                'positions': float(state['positions'][row])
+            })
+    return {
+        'status': 'success',
+        'bar': index[-1].isoformat() if len(index) else None,
+        'scanned': len(symbols),
+        'matches': matches
+    }
+
+def stored_bars(store: MarketDataStore, symbols: Sequence[str], interval: str) -> Tuple[Optional[int], ...]:
+    """Return the timestamp (int64 nanoseconds) of the last stored bar of each symbol, None if none."""
+    metas = [store.info(symbol, interval) for symbol in symbols]
+    return tuple(meta.get('last') if meta else None for meta in metas)
+
+def seconds_to_next_bar(lasts: Sequence[Optional[int]], interval: str) -> float:
+    """Return the seconds until a bar after the latest of lasts is due.
+
+    While that bar is overdue (the market is closed, or no symbol has been
+    stored yet), one bar length is returned instead, so scans check for new
+    bars once per bar.
+    """
+    bar_seconds = BAR_SECONDS[interval]
+    known = [last for last in lasts if last is not None]
+    remaining = max(known) / 1e9 + bar_seconds - time.time() if known else 0.0
+    return remaining if remaining > 0 else bar_seconds
+
+def scan_symbols(symbols: Sequence[str], timeframe: str = '1M', interval: str = 'hour',
+                 short_window: int = 5, long_window: int = 20, store: MarketDataStore = None,
+                 downloader=None, cache: QueryResultCache = None) -> Dict:
+    """Scan many symbols for a crossover on their last bar.
+
+    Bars are loaded with fetch_many (batched downloads of what the store
+    lacks) and scanned with scan_crossovers. The result is cached by the
+    timestamps of the last stored bars until the bar after them is due, so
+    repeated scans within a bar only read the symbols' metadata.
+
+    Args:
+        symbols: Stock symbols, e.g. ['AAPL', 'MSFT', 'BTC']
+        timeframe: Time period, e.g. '1M', '3M', '1Y'
+        interval: Data frequency - 'hour', 'day', '15min', etc.
+        short_window: Short moving average window
+        long_window: Long moving average window
+        store: Bar store (default: market_data.default_store())
+        downloader: Function downloading missing bars for a list of symbols (default: Yahoo Finance)
+        cache: Result cache (default: scan_cache)
+
+    Returns:
+        Scan result dict (see scan_crossovers), plus missing: the symbols without data
+    """
+    store = store or default_store()
+    cache = cache or scan_cache
+    yf_interval = INTERVALS.get(interval, '1h')
+    base = '1d' if yf_interval in RESAMPLE_RULES else yf_interval
+    yahoo_symbols = [yahoo_symbol(symbol) for symbol in symbols]
+    scan = (tuple(symbols), timeframe, interval, short_window, long_window)
+
+    def run():
+        frames = fetch_many(symbols, timeframe, interval, store=store, downloader=downloader)
+        result = scan_crossovers(frames, short_window, long_window)
+        result['missing'] = [symbol for symbol in symbols if symbol not in frames]
+        # Also the result for the bars stored now, e.g. after downloading a new bar
+        lasts = stored_bars(store, yahoo_symbols, base)
+        cache.put(scan + (lasts,), result, seconds_to_next_bar(lasts, base))
+        return result
+
+    lasts = stored_bars(store, yahoo_symbols, base)
+    return cache.get_or_run(scan + (lasts,), seconds_to_next_bar(lasts, base), run)
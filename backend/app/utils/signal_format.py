@@ -0,0 +1,82 @@
+import json
+import struct
+import numpy as np
+import pandas as pd
+
+# Compact binary format for strategy signals, negotiated with the Accept header
+SIGNALS_F32_MIMETYPE = "application/x-float32-columns"
+
+_MAGIC = b"F32C"
+_PREFIX = struct.Struct("<4sI")
+
+def encode_signals(frame: pd.DataFrame) -> bytes:
+    """Encode a DataFrame of numeric signals as little-endian typed arrays.
+
+    Layout, with every array aligned so browsers can view it without copying
+    (``new Float64Array(buffer, offset, rows)``):
+
+        4 bytes   magic "F32C"
+        4 bytes   uint32 length of the JSON header
+        header    {"rows", "columns", "index"} padded with spaces to 8 bytes
+        float64   index: milliseconds since the epoch (UTC) for a DatetimeIndex
+        float32   one array per column, in header order; NaN stays NaN
+
+    At 8 + 4 bytes per value this is 4-5x smaller than the JSON form.
+
+    Args:
+        frame: DataFrame with a DatetimeIndex (or numeric index) and numeric columns
+
+    Returns:
+        Encoded bytes
+    """
+    index = frame.index
+    if isinstance(index, pd.DatetimeIndex):
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+        index_values = index.values.astype("datetime64[ms]").astype(np.float64)
+        index_values[np.isnat(index.values)] = np.nan
+        index_kind = "datetime_ms"
+    else:
+        index_values = np.asarray(index, dtype=np.float64)
+        index_kind = "float64"
+
+    header = json.dumps({
+        "rows": len(frame),
+        "columns": [str(column) for column in frame.columns],
+        "index": index_kind
+    }).encode("utf-8")
+    header += b" " * (-(_PREFIX.size + len(header)) % 8)
+
+    columns = np.asarray(frame.to_numpy(dtype=np.float32, na_value=np.nan).T, order="C")
+    return b"".join([
+        _PREFIX.pack(_MAGIC, len(header)),
+        header,
+        index_values.astype("<f8").tobytes(),
+        columns.astype("<f4", copy=False).tobytes()
+    ])
+
+def decode_signals(body: bytes) -> pd.DataFrame:
+    """Decode bytes produced by encode_signals back into a DataFrame (float32 columns).
+
+    Raises:
+        ValueError: If the body is not in the float32 columns format
+    """
+    magic, header_length = _PREFIX.unpack_from(body)
+    if magic != _MAGIC:
+        raise ValueError("Not a float32 columns payload")
+    header = json.loads(body[_PREFIX.size:_PREFIX.size + header_length])
+    rows, columns = header["rows"], header["columns"]
+
+    offset = _PREFIX.size + header_length
+    index_values = np.frombuffer(body, dtype="<f8", count=rows, offset=offset)
+    values = np.frombuffer(body, dtype="<f4", count=rows * len(columns), offset=offset + 8 * rows)
+
+    if header["index"] == "datetime_ms":
+        index = pd.to_datetime(index_values, unit="ms")
+    else:
+        index = pd.Index(index_values)
+    return pd.DataFrame(values.reshape(len(columns), rows).T, index=index, columns=columns)
+
+def prefers_f32(accept_mimetypes) -> bool:
+    """Return whether a request's Accept header prefers the float32 format over JSON."""
+    return accept_mimetypes.best_match(["application/json", SIGNALS_F32_MIMETYPE]) == SIGNALS_F32_MIMETYPE
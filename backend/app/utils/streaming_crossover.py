@@ -0,0 +1,183 @@
+import math
+from collections import deque
+from typing import Dict, List, Optional
+import pandas as pd
+
+class RollingMean:
+    """Running mean of the last window values, updated in O(1) per value.
+
+    Replicates the arithmetic of pandas' ``rolling(window).mean()`` (roll_mean
+    in pandas/_libs/window/aggregations.pyx) step by step: Kahan-compensated
+    sums with separate compensations for added and removed values, the
+    run-of-equal-values shortcut and the sign clamps. Its values are therefore
+    bit-for-bit equal to pandas', not just close.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque()
+        self.nobs = 0
+        self.neg_ct = 0
+        self.sum_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.num_consecutive_same_value = 0
+        self.prev_value = math.nan
+
+    def state(self) -> tuple:
+        """Return the scalar state, for restore()."""
+        return (self.nobs, self.neg_ct, self.sum_x, self.compensation_add, self.compensation_remove,
+                self.num_consecutive_same_value, self.prev_value)
+
+    def restore(self, state: tuple, evicted: Optional[float]) -> None:
+        """Undo the last update, given the state before it and the value it evicted."""
+        (self.nobs, self.neg_ct, self.sum_x, self.compensation_add, self.compensation_remove,
+         self.num_consecutive_same_value, self.prev_value) = state
+        self.values.pop()
+        if evicted is not None:
+            self.values.appendleft(evicted)
+
+    def _add(self, val: float) -> None:
+        if val == val:
+            self.nobs += 1
+            y = val - self.compensation_add
+            t = self.sum_x + y
+            self.compensation_add = t - self.sum_x - y
+            self.sum_x = t
+            if math.copysign(1.0, val) < 0:
+                self.neg_ct += 1
+            if val == self.prev_value:
+                self.num_consecutive_same_value += 1
+            else:
+                self.num_consecutive_same_value = 1
+            self.prev_value = val
+
+    def _remove(self, val: float) -> None:
+        if val == val:
+            self.nobs -= 1
+            y = -val - self.compensation_remove
+            t = self.sum_x + y
+            self.compensation_remove = t - self.sum_x - y
+            self.sum_x = t
+            if math.copysign(1.0, val) < 0:
+                self.neg_ct -= 1
+
+    def update(self, val: float) -> Optional[float]:
+        """Add a value; return the value that left the window, if any."""
+        evicted = None
+        if self.window == 1 and self.values:
+            # pandas restarts from empty sums when consecutive windows do not overlap
+            evicted = self.values.popleft()
+            self.nobs = self.neg_ct = 0
+            self.sum_x = self.compensation_add = self.compensation_remove = 0.0
+            self.num_consecutive_same_value = 0
+            self.prev_value = val
+        elif len(self.values) == self.window:
+            evicted = self.values.popleft()
+            self._remove(evicted)
+        elif not self.values:
+            self.prev_value = val
+        self.values.append(val)
+        self._add(val)
+        return evicted
+
+    @property
+    def mean(self) -> float:
+        if self.nobs < self.window or self.nobs == 0:
+            return math.nan
+        result = self.sum_x / self.nobs
+        if self.num_consecutive_same_value >= self.nobs:
+            result = self.prev_value
+        elif self.neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self.neg_ct == self.nobs and result > 0:
+            result = 0.0
+        return result
+
+class StreamingCrossover:
+    """Moving average crossover signals updated one bar at a time.
+
+    Each bar costs O(1) whatever the length of the history, and every bar's
+    values equal the matching row of momentum_trading_strategy run over all
+    bars so far, so live polling of 1m/5m bars does not recompute rolling
+    means over the whole history.
+
+    Sending a bar with the same timestamp as the last one replaces it, since
+    a bar that is still forming is sent again (with the bars since a
+    timestamp, see fetch_bars_since) until it closes.
+
+    Example:
+        stream = StreamingCrossover(5, 20)
+        stream.consume(history)                # warm up from past bars
+        event = stream.update(timestamp, close)
+        if event:
+            print(event['positions'])          # 1.0 buy, -1.0 sell
+    """
+
+    def __init__(self, short_window: int = 5, long_window: int = 20):
+        self.short_window = short_window
+        self.long_window = long_window
+        self.short = RollingMean(short_window)
+        self.long = RollingMean(long_window)
+        self.bars = 0
+        self.last: Optional[Dict] = None
+        self._undo = None
+
+    def update(self, timestamp, price: float) -> Optional[Dict]:
+        """Add a bar, or replace the last one if timestamp is the same.
+
+        Args:
+            timestamp: Bar timestamp
+            price: Close price
+
+        Returns:
+            The bar's row (timestamp, price, short_mavg, long_mavg, signal,
+            positions) if a crossover happened on it, None otherwise
+
+        Raises:
+            ValueError: If timestamp is before the last bar's
+        """
+        price = float(price)
+        if self.last is not None:
+            if timestamp == self.last['timestamp']:
+                self._rollback()
+            elif timestamp < self.last['timestamp']:
+                raise ValueError(f"Bar at {timestamp} is older than the last bar at {self.last['timestamp']}")
+
+        previous = self.last
+        self._undo = (previous, self.short.state(), self.long.state(),
+                      self.short.update(price), self.long.update(price))
+        # momentum_trading_strategy leaves the first short_window signals at 0
+        short_mavg, long_mavg = self.short.mean, self.long.mean
+        signal = 1.0 if self.bars >= self.short_window and short_mavg > long_mavg else 0.0
+        self.bars += 1
+
+        self.last = {
+            'timestamp': timestamp,
+            'price': price,
+            'short_mavg': short_mavg,
+            'long_mavg': long_mavg,
+            'signal': signal,
+            'positions': signal - previous['signal'] if previous is not None else math.nan
+        }
+        return self.last if self.last['positions'] in (1.0, -1.0) else None
+
+    def _rollback(self) -> None:
+        previous, short_state, long_state, short_evicted, long_evicted = self._undo
+        self.short.restore(short_state, short_evicted)
+        self.long.restore(long_state, long_evicted)
+        self.bars -= 1
+        self.last = previous
+
+    def consume(self, data: pd.DataFrame) -> List[Dict]:
+        """Feed bars in order; return the crossover events among them.
+
+        Args:
+            data: DataFrame with a 'Close' column, indexed by timestamp
+        """
+        events = []
+        for timestamp, price in zip(data.index, data['Close'].to_numpy()):
+            event = self.update(timestamp, price)
+            if event is not None:
+                events.append(event)
+        return events
@@ -1,73 +1,91 @@
 import pandas as pd
 import numpy as np
-import yfinance as yf
+from typing import Dict, List, Tuple
+from app.utils.market_data import MarketDataStore, bars_since, default_store, load_bars, load_many, yfinance_download
+from app.utils.resampling import RESAMPLE_RULES, load_resampled, read_resampled
 
-def fetch_stock_data(symbol: str, timeframe: str, interval: str = 'hour') -> pd.DataFrame:
+# Map interval parameter to yfinance interval strings
+INTERVALS = {
+    'minute': '1m',    # 1 minute
+    '5min': '5m',      # 5 minutes
+    '15min': '15m',    # 15 minutes
+    '30min': '30m',    # 30 minutes
+    'hour': '1h',      # 1 hour
+    'day': '1d',       # 1 day
+    'week': '1wk',     # 1 week
+    'month': '1mo'     # 1 month
+}
+
+# Map timeframes to days
+TIMEFRAMES = {
+    '1M': 30,
+    '3M': 90, 
+    '6M': 180,
+    '1Y': 365,
+    '2Y': 730,
+    '5Y': 1825
+}
+
+# Cryptocurrencies, quoted in USD on Yahoo Finance
+CRYPTO_SYMBOLS = ['BTC', 'ETH', 'DOGE', 'XRP', 'SOL']
+
+def yahoo_symbol(symbol: str) -> str:
+    """Return the Yahoo Finance symbol for a stock or cryptocurrency symbol."""
+    if symbol.upper() in CRYPTO_SYMBOLS:
+        return f"{symbol}-USD"
+    return symbol
+
+def download_window(timeframe: str, yf_interval: str) -> Tuple[str, str]:
+    """Return the (start, end) dates to download for a timeframe, end exclusive."""
+    end_date = pd.Timestamp.now()
+    days = TIMEFRAMES[timeframe]
+    if yf_interval in ['1m', '5m', '15m', '30m', '1h'] and days > 60:
+        days_limit = min(days, 60)  # Limit to 60 days for intraday data
+        print(f"Warning: Limiting {yf_interval} data to {days_limit} days instead of {days}")
+    else:
+        days_limit = days
+    start_date = (end_date - pd.Timedelta(days=days_limit)).strftime('%Y-%m-%d')
+    return start_date, end_date.strftime('%Y-%m-%d')
+
+def fetch_stock_data(symbol: str, timeframe: str, interval: str = 'hour',
+                     store: MarketDataStore = None, downloader=None) -> pd.DataFrame:
     """
     Fetch historical stock data with timeframe and interval selection.
     
+    Bars are read from the local market data store; only dates it has not
+    downloaded yet are fetched. Daily, weekly and monthly bars are resampled
+    from finer stored bars (hourly, else daily), so only one base interval is
+    stored per symbol and switching between them needs no download.
+    
     Parameters:
         symbol (str): Stock symbol, e.g., 'AAPL', 'MSFT'
         timeframe (str): Time period, e.g., '1M', '3M', '1Y'
         interval (str): Data frequency - 'hour', 'day', '15m', etc.
+        store (MarketDataStore): Bar store (default: market_data.default_store())
+        downloader: Function downloading missing bars (default: Yahoo Finance)
     
     Returns:
         pd.DataFrame: Historical stock data
     """
     try:
-        end_date = pd.Timestamp.now()
-        
-        # Map timeframes to days
-        timeframe_dict = {
-            '1M': 30,
-            '3M': 90, 
-            '6M': 180,
-            '1Y': 365,
-            '2Y': 730,
-            '5Y': 1825
-        }
-        
-        # Map interval parameter to yfinance interval strings
-        interval_dict = {
-            'minute': '1m',    # 1 minute
-            '5min': '5m',      # 5 minutes
-            '15min': '15m',    # 15 minutes
-            '30min': '30m',    # 30 minutes
-            'hour': '1h',      # 1 hour
-            'day': '1d',       # 1 day
-            'week': '1wk',     # 1 week
-            'month': '1mo'     # 1 month
-        }
-        
         # Set the interval (default to 1h if not specified)
-        yf_interval = interval_dict.get(interval, '1h')
-        
-
-        days = timeframe_dict[timeframe]
-        if yf_interval in ['1m', '5m', '15m', '30m', '1h'] and days > 60:
-            days_limit = min(days, 60)  # Limit to 60 days for intraday data
-            print(f"Warning: Limiting {yf_interval} data to {days_limit} days instead of {days}")
-        else:
-            days_limit = days
-            
-        # Handle cryptocurrency symbols
-        if symbol.upper() in ['BTC', 'ETH', 'DOGE', 'XRP', 'SOL']:
-            symbol = f"{symbol}-USD"
-            
-        start_date = (end_date - pd.Timedelta(days=days_limit)).strftime('%Y-%m-%d')
+        yf_interval = INTERVALS.get(interval, '1h')
+        start_date, end_date = download_window(timeframe, yf_interval)
+        symbol = yahoo_symbol(symbol)
         
-        data = yf.download(
+        load = load_resampled if yf_interval in RESAMPLE_RULES else load_bars
+        data = load(
+            store or default_store(),
+            downloader or yfinance_download,
             symbol,
+            yf_interval,
             start=start_date,
-            end=end_date.strftime('%Y-%m-%d'),
-            interval=yf_interval
+            end=end_date
         )
         
-        if data.empty:
+        if data is None or data.empty:
             raise Exception(f"No data found for symbol {symbol} with {yf_interval} interval")
         
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = data.columns.get_level_values(0)
         data = data.dropna()
 
         return data
@@ -75,6 +93,87 @@ def fetch_stock_data(symbol: str, timeframe: str, interval: str = 'hour') -> pd.
     except Exception as e:
         raise Exception(f"Error fetching {interval} data for {symbol}: {str(e)}")
     
+def fetch_many(symbols: List[str], timeframe: str, interval: str = 'hour',
+               store: MarketDataStore = None, downloader=None,
+               batch_size: int = 50, max_workers: int = 4) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical data for many symbols with batched downloads.
+    
+    Works like fetch_stock_data for every symbol, but the bars missing from
+    the store are downloaded for up to batch_size symbols per request, with
+    at most max_workers requests in flight. Weekly and monthly bars are
+    resampled from daily bars.
+    
+    Parameters:
+        symbols (list): Stock symbols, e.g., ['AAPL', 'MSFT', 'BTC']
+        timeframe (str): Time period, e.g., '1M', '3M', '1Y'
+        interval (str): Data frequency - 'hour', 'day', '15min', etc.
+        store (MarketDataStore): Bar store (default: market_data.default_store())
+        downloader: Function downloading missing bars for a list of symbols (default: Yahoo Finance)
+        batch_size (int): Maximum number of symbols per download
+        max_workers (int): Maximum number of concurrent downloads
+    
+    Returns:
+        dict: Historical data per symbol, keyed as given; symbols without data are left out
+    """
+    yf_interval = INTERVALS.get(interval, '1h')
+    start_date, end_date = download_window(timeframe, yf_interval)
+    yahoo_symbols = {symbol: yahoo_symbol(symbol) for symbol in symbols}
+    store = store or default_store()
+    base = '1d' if yf_interval in RESAMPLE_RULES else yf_interval
+    
+    bars = load_many(
+        store,
+        downloader or yfinance_download,
+        list(yahoo_symbols.values()),
+        base,
+        start=start_date,
+        end=end_date,
+        batch_size=batch_size,
+        max_workers=max_workers
+    )
+    if base != yf_interval:
+        bars = {yahoo: read_resampled(store, yahoo, base, yf_interval, start_date, end_date) for yahoo in bars}
+    return {symbol: bars[yahoo].dropna() for symbol, yahoo in yahoo_symbols.items() if yahoo in bars}
+    
+def fetch_bars_since(symbol: str, interval: str = 'hour', since=None,
+                     store: MarketDataStore = None, downloader=None) -> pd.DataFrame:
+    """
+    Fetch the bars at or after a timestamp, ingesting new bars first.
+    
+    Lets clients poll for updates: passing the timestamp of the last bar
+    already received returns that bar (in case it was revised) and every
+    newer one, and only bars newer than the stored ones are downloaded.
+    
+    Parameters:
+        symbol (str): Stock symbol, e.g., 'AAPL', 'MSFT'
+        interval (str): Data frequency - 'hour', 'day', '15min', etc.
+        since: Timestamp or date string (default: all stored bars)
+        store (MarketDataStore): Bar store (default: market_data.default_store())
+        downloader: Function downloading new bars (default: Yahoo Finance)
+    
+    Returns:
+        pd.DataFrame: Bars at or after since
+    """
+    store = store or default_store()
+    downloader = downloader or yfinance_download
+    yf_interval = INTERVALS.get(interval, '1h')
+    symbol = yahoo_symbol(symbol)
+    
+    if store.info(symbol, yf_interval) is None:
+        # Nothing to continue from yet: start with the last month
+        today = pd.Timestamp.now().normalize()
+        start = pd.Timestamp(since).strftime('%Y-%m-%d') if since is not None else \
+            (today - pd.Timedelta(days=30)).strftime('%Y-%m-%d')
+        load_bars(store, downloader, symbol, yf_interval, start, (today + pd.Timedelta(days=1)).strftime('%Y-%m-%d'))
+        data = store.read(symbol, yf_interval, start=since)
+    else:
+        data = bars_since(store, downloader, symbol, yf_interval, since=since)
+    
+    if data is None:
+        raise Exception(f"No data found for symbol {symbol} with {yf_interval} interval")
+    return data
+    
 def momentum_trading_strategy(data, short_window=5, long_window=20):
     """Generate trading signals based on moving average crossover strategy."""
     # Create a copy to avoid modifying original
@@ -87,7 +186,7 @@ def momentum_trading_strategy(data, short_window=5, long_window=20):
     
     # Create signals
     signals['signal'] = 0.0
-    signals['signal'][short_window:] = np.where(
+    signals.iloc[short_window:, signals.columns.get_loc('signal')] = np.where(
         signals['short_mavg'][short_window:] > signals['long_mavg'][short_window:], 1.0, 0.0)
     
     # Generate positions
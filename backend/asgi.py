@@ -0,0 +1,4 @@
+from app import create_asgi_app
+
+# ASGI entry point, e.g.: hypercorn asgi:app --workers 4 --bind 0.0.0.0:5000
+app = create_asgi_app()
@@ -0,0 +1,47 @@
+"""Compare momentum_trading_strategy per window pair with one CrossoverGrid for all pairs.
+
+Usage, from the backend directory:
+
+    python benchmarks/bench_crossover.py --bars 1260 --pairs 400
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.utils.crossover_engine import CrossoverGrid
+from app.utils.trading_strategy import momentum_trading_strategy
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=1260, help="Number of bars (1260 is 5Y of daily bars)")
+    parser.add_argument("--pairs", type=int, default=400)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=args.bars, freq="B")
+    data = pd.DataFrame({"Close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, args.bars)))}, index=index)
+    side = int(np.ceil(np.sqrt(2 * args.pairs)))
+    pairs = [(short, long) for short in range(2, side + 2) for long in range(short + 1, side + 2)][:args.pairs]
+
+    start = time.perf_counter()
+    for short_window, long_window in pairs:
+        momentum_trading_strategy(data, short_window, long_window)
+    per_pair = time.perf_counter() - start
+
+    start = time.perf_counter()
+    CrossoverGrid(data["Close"], pairs)
+    grid = time.perf_counter() - start
+
+    print(f"{len(pairs)} window pairs over {args.bars} bars")
+    print(f"momentum_trading_strategy per pair  {per_pair * 1000:9.1f} ms")
+    print(f"CrossoverGrid, all pairs            {grid * 1000:9.1f} ms  {per_pair / grid:6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare refreshing a watchlist symbol by symbol with batched fetch_many.
+
+The downloader is simulated with a fixed latency per request, so the result
+shows the effect of batching without depending on the network.
+
+Usage, from the backend directory:
+
+    python benchmarks/bench_fetch_many.py --symbols 200 --latency 0.5
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.utils.market_data import MarketDataStore
+from app.utils.trading_strategy import fetch_many, fetch_stock_data
+
+def make_downloader(latency):
+    """Return a downloader that sleeps for latency seconds per request."""
+    def download(symbols, start, end, interval):
+        time.sleep(latency)
+        index = pd.date_range(start, end, freq="1D", inclusive="left", name="Date")
+        close = 100 + np.arange(len(index), dtype=float)
+        bars = pd.DataFrame({"Close": close, "High": close, "Low": close, "Open": close,
+                             "Volume": np.zeros(len(index), dtype=np.int64)}, index=index)
+        if isinstance(symbols, str):
+            return bars
+        return pd.concat({symbol: bars for symbol in symbols}, axis=1, names=["Ticker", "Price"]).swaplevel(axis=1)
+    return download
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per download request")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+    downloader = make_downloader(args.latency)
+
+    root = tempfile.mkdtemp()
+    try:
+        store = MarketDataStore(os.path.join(root, "one_by_one"))
+        start = time.perf_counter()
+        for symbol in symbols:
+            fetch_stock_data(symbol, "1Y", "day", store=store, downloader=downloader)
+        one_by_one = time.perf_counter() - start
+
+        store = MarketDataStore(os.path.join(root, "batched"))
+        start = time.perf_counter()
+        fetch_many(symbols, "1Y", "day", store=store, downloader=downloader,
+                   batch_size=args.batch_size, max_workers=args.workers)
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fetch_many(symbols, "1Y", "day", store=store, downloader=downloader)
+        stored = time.perf_counter() - start
+    finally:
+        shutil.rmtree(root)
+
+    print(f"{args.symbols} symbols, {args.latency}s per download request")
+    print(f"fetch_stock_data, one by one  {one_by_one:8.2f} s")
+    print(f"fetch_many, batched           {batched:8.2f} s  {one_by_one / batched:6.1f}x")
+    print(f"fetch_many, already stored    {stored:8.2f} s")
+
+if __name__ == "__main__":
+    main()
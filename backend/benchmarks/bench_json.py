@@ -0,0 +1,75 @@
+"""Compare the bulk clean_for_json against the previous element-by-element version.
+
+Usage, from the backend directory:
+
+    python benchmarks/bench_json.py --rows 10000 --repeat 20
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.utils.json_utils import clean_for_json
+
+def clean_for_json_elementwise(obj):
+    """clean_for_json as it was before DataFrames and arrays were cleaned in bulk."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            obj[key] = clean_for_json_elementwise(value)
+        return obj
+    elif isinstance(obj, list):
+        return [clean_for_json_elementwise(item) for item in obj]
+    elif isinstance(obj, (np.ndarray, pd.Series)):
+        return clean_for_json_elementwise(obj.tolist())
+    elif isinstance(obj, (np.integer, np.int64, np.int32)):
+        return int(obj)
+    elif isinstance(obj, (np.floating, np.float64, np.float32)):
+        return None if np.isnan(obj) else float(obj)
+    elif pd.isna(obj):
+        return None
+    else:
+        return obj
+
+def make_signals(rows):
+    """Hourly momentum signals shaped like trading_strategy.momentum_trading_strategy output."""
+    rng = np.random.default_rng(0)
+    price = pd.Series(100 + rng.standard_normal(rows).cumsum(),
+                      index=pd.date_range("2024-01-01", periods=rows, freq="h"))
+    signals = pd.DataFrame({"price": price})
+    signals["short_mavg"] = price.rolling(5).mean()
+    signals["long_mavg"] = price.rolling(20).mean()
+    signals["signal"] = np.where(signals["short_mavg"] > signals["long_mavg"], 1.0, 0.0)
+    signals["positions"] = signals["signal"].diff()
+    return signals
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    signals = make_signals(args.rows)
+    columns = list(signals.columns)
+
+    # The old version cannot take a DataFrame, so it gets one Series per column
+    cases = [
+        ("element-by-element, dict of Series", lambda: clean_for_json_elementwise({c: signals[c] for c in columns})),
+        ("bulk, dict of Series", lambda: clean_for_json({c: signals[c] for c in columns})),
+        ("bulk, DataFrame (columnar)", lambda: clean_for_json(signals)),
+    ]
+
+    print(f"{args.rows} rows x {len(columns)} columns, best of {args.repeat}")
+    baseline = None
+    for name, run in cases:
+        seconds = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(f"{name:<38} {seconds * 1000:8.2f} ms  {baseline / seconds:6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Time optimize_windows on a grid of window pairs over simulated daily bars.
+
+Usage, from the backend directory:
+
+    python benchmarks/bench_optimizer.py --grid 50 --bars 1260 --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.utils.optimizer import optimize_windows, window_grid
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grid", type=int, default=50, help="Short and long windows per side of the grid")
+    parser.add_argument("--bars", type=int, default=1260, help="Number of bars (1260 is 5Y of daily bars)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=args.bars, freq="B")
+    data = pd.DataFrame({"Close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, args.bars)))}, index=index)
+    short_windows = range(2, 2 + args.grid)
+    long_windows = range(10, 10 + 4 * args.grid, 4)
+    pairs = len(window_grid(short_windows, long_windows))
+
+    print(f"{pairs} window pairs over {args.bars} bars")
+    for workers in sorted({1, args.workers}):
+        start = time.perf_counter()
+        result = optimize_windows(data, short_windows, long_windows, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{workers} worker(s)  {elapsed * 1000:9.1f} ms  best {result['best']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Compare requests/sec of the WSGI (Flask dev server) and ASGI (hypercorn) apps.
+
+Usage, from the backend directory:
+
+    python benchmarks/bench_serving.py --workers 4 --clients 32 --duration 10
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (method, path, JSON body) requests cycled by every client
+REQUESTS = [
+    ("GET", "/api/ping", None),
+    ("POST", "/api/dymension/command", {"command": "List all wallets"}),
+    ("GET", "/api/dymension/help", None),
+]
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_until_up(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/api/ping")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not start")
+
+def start_wsgi(port, workers):
+    code = f"from app import create_app; create_app({{'DEBUG': False}}).run(port={port}, threaded=True)"
+    return subprocess.Popen([sys.executable, "-c", code], cwd=BACKEND_DIR,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def start_asgi(port, workers):
+    return subprocess.Popen([sys.executable, "-m", "hypercorn", "asgi:app",
+                             "--workers", str(workers), "--bind", f"127.0.0.1:{port}"],
+                            cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def run_load(port, clients, duration):
+    """Send requests from `clients` keep-alive connections for `duration` seconds."""
+    counts = [0] * clients
+    errors = [0] * clients
+    stop = time.monotonic() + duration
+
+    def client(index):
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        i = index
+        while time.monotonic() < stop:
+            method, path, body = REQUESTS[i % len(REQUESTS)]
+            i += 1
+            try:
+                payload = json.dumps(body) if body is not None else None
+                headers = {"Content-Type": "application/json"} if body is not None else {}
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 400:
+                    errors[index] += 1
+                counts[index] += 1
+            except (OSError, http.client.HTTPException):
+                errors[index] += 1
+                connection.close()
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / duration, sum(errors)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="hypercorn worker processes")
+    parser.add_argument("--clients", type=int, default=32, help="concurrent client connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per server")
+    args = parser.parse_args()
+
+    for name, start in (("WSGI (Flask dev server)", start_wsgi), (f"ASGI (hypercorn x{args.workers})", start_asgi)):
+        port = free_port()
+        server = start(port, args.workers)
+        try:
+            wait_until_up(port)
+            rate, errors = run_load(port, args.clients, args.duration)
+            print(f"{name:32s} {rate:10.1f} req/s  ({errors} errors)")
+        finally:
+            server.terminate()
+            server.wait()
+
+if __name__ == "__main__":
+    main()
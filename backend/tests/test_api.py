@@ -0,0 +1,243 @@
+import gzip
+import json
+import sys
+import pandas as pd
+import unittest
+from unittest.mock import patch
+from app import create_app
+from app.routes import api
+from app.utils import metrics
+from app.utils.signal_format import SIGNALS_F32_MIMETYPE, decode_signals
+from tests.test_signal_format import hourly_prices
+
+class TestPing(unittest.TestCase):
+
+    def test_reports_binaries_without_running_them(self):
+        client = create_app({'TESTING': True}).test_client()
+        with patch('subprocess.run') as run, patch('subprocess.Popen') as popen:
+            response = client.get('/api/ping')
+        self.assertFalse(run.called or popen.called)
+        self.assertEqual(set(response.get_json()['binaries']), {'dymd', 'roller'})
+
+class TestDymensionHelp(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({'TESTING': True}).test_client()
+
+    def test_etag_revalidation(self):
+        response = self.client.get('/api/dymension/help')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()['commands']), 48)
+        etag = response.headers['ETag']
+        self.assertIn('max-age=300', response.headers['Cache-Control'])
+
+        cached = self.client.get('/api/dymension/help', headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+
+    def test_category_filter(self):
+        response = self.client.get('/api/dymension/help?category=wallet')
+        commands = response.get_json()['commands']
+        self.assertEqual({c['category'] for c in commands}, {'Wallet'})
+        self.assertNotEqual(response.headers['ETag'], self.client.get('/api/dymension/help').headers['ETag'])
+        self.assertEqual(self.client.get('/api/dymension/help?category=nope').status_code, 404)
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({'TESTING': True}).test_client()
+
+    def test_gzip_when_accepted(self):
+        plain = self.client.get('/api/dymension/help')
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn('Accept-Encoding', plain.headers['Vary'])
+
+        response = self.client.get('/api/dymension/help', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.data), plain.data)
+        self.assertLess(len(response.data), len(plain.data))
+
+        # The compressed representation revalidates with its weak ETag
+        etag = response.headers['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        cached = self.client.get('/api/dymension/help', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+
+    def test_small_responses_are_not_compressed(self):
+        response = self.client.get('/api/ping', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response.headers)
+
+class TestJSONEncoder(unittest.TestCase):
+
+    def test_encoders_agree(self):
+        payload = {'b': 1.5, 'a': [2, None, {'z': 'dym', 'y': True}]}
+        documents = []
+        for encoder in ('json', 'orjson'):
+            app = create_app({'TESTING': True, 'JSON_ENCODER': encoder})
+            documents.append(app.json.dumps(payload))
+        self.assertEqual(json.loads(documents[0]), json.loads(documents[1]))
+        self.assertEqual(documents[1], '{"a":[2,null,{"y":true,"z":"dym"}],"b":1.5}')
+
+    def test_orjson_encodes_numpy(self):
+        import numpy as np
+        app = create_app({'TESTING': True, 'JSON_ENCODER': 'orjson'})
+        self.assertEqual(app.json.dumps({'b': np.float64('nan'), 'a': np.int64(2)}), '{"a":2,"b":null}')
+
+class TestStrategySignals(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({'TESTING': True}).test_client()
+        prices = hourly_prices(24 * 365)
+        fetch = patch.object(api, 'fetch_stock_data', return_value=prices)
+        fetch.start()
+        self.addCleanup(fetch.stop)
+
+    def test_negotiates_float32_columns(self):
+        as_json = self.client.get('/api/strategy/signals?symbol=AAPL')
+        self.assertEqual(as_json.mimetype, 'application/json')
+        self.assertEqual(len(as_json.get_json()['signals']['index']), 24 * 365)
+
+        binary = self.client.get('/api/strategy/signals?symbol=AAPL', headers={'Accept': SIGNALS_F32_MIMETYPE})
+        self.assertEqual(binary.mimetype, SIGNALS_F32_MIMETYPE)
+        self.assertIn('Accept', binary.headers['Vary'])
+        self.assertEqual(len(decode_signals(binary.data)), 24 * 365)
+        self.assertLess(len(binary.data) * 4, len(as_json.data))
+
+    def test_requires_symbol(self):
+        self.assertEqual(self.client.get('/api/strategy/signals').status_code, 400)
+
+class TestStrategyScan(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({'TESTING': True}).test_client()
+
+    def test_scans_listed_symbols(self):
+        result = {'status': 'success', 'bar': None, 'scanned': 2, 'matches': [], 'missing': []}
+        with patch.object(api, 'scan_symbols', return_value=result) as scan:
+            response = self.client.get('/api/strategy/scan?symbols=AAPL, MSFT,&interval=day&long_window=50')
+        self.assertEqual(scan.call_args.args, (['AAPL', 'MSFT'], '1M', 'day'))
+        self.assertEqual(scan.call_args.kwargs, {'short_window': 5, 'long_window': 50})
+        self.assertEqual(response.get_json(), result)
+        self.assertEqual(self.client.get('/api/strategy/scan').status_code, 400)
+
+    def test_limits_symbols(self):
+        client = create_app({'TESTING': True, 'STRATEGY_SCAN_MAX_SYMBOLS': 2}).test_client()
+        with patch.object(api, 'scan_symbols') as scan:
+            response = client.get('/api/strategy/scan?symbols=AAPL,MSFT,NVDA')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(scan.called)
+
+class TestMarketBars(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({'TESTING': True}).test_client()
+
+    def test_since(self):
+        bars = hourly_prices(3)
+        with patch.object(api, 'fetch_bars_since', return_value=bars) as fetch:
+            response = self.client.get('/api/market/bars?symbol=AAPL&interval=hour&since=2024-01-01T01:00:00Z')
+        self.assertEqual(fetch.call_args.args, ('AAPL', 'hour', pd.Timestamp('2024-01-01 01:00', tz='UTC')))
+        self.assertEqual(response.get_json()['bars']['columns'], ['Close'])
+        self.assertEqual(self.client.get('/api/market/bars?symbol=AAPL&since=yesterday-ish').status_code, 400)
+
+class TestDymensionStream(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({
+            'TESTING': True,
+            'DYMENSION_STREAM_ENABLED': True,
+            'DYMENSION_STREAM_COMMANDS': [('dymd', '-c')]
+        }).test_client()
+        # Run "dymd" commands through the Python interpreter
+        binaries = patch.object(api.dym_cli.binaries, 'path', side_effect=lambda name: sys.executable)
+        binaries.start()
+        self.addCleanup(binaries.stop)
+
+    def test_streams_lines_then_status(self):
+        script = "import sys; print('one'); print('two', file=sys.stderr)"
+        with self.client.post('/api/dymension/stream', json={'command': ['dymd', '-c', script]}) as response:
+            self.assertEqual(response.mimetype, 'text/event-stream')
+            body = response.get_data(as_text=True)
+        self.assertIn('event: stdout\ndata: one\n\n', body)
+        self.assertIn('event: stderr\ndata: two\n\n', body)
+        last_event = body.strip().split('\n\n')[-1]
+        self.assertTrue(last_event.startswith('event: status'))
+        status = json.loads(last_event.split('data: ', 1)[1])
+        self.assertEqual(status['returncode'], 0)
+
+    def test_metrics_wait_for_the_stream_to_close(self):
+        before = metrics.REQUEST_LATENCY.count('/api/dymension/stream', 'POST')
+        response = self.client.post('/api/dymension/stream', json={'command': ['dymd', '-c', 'print(1)']},
+                                    buffered=False)
+        # The body is sent after the request hooks, so the request is still in flight
+        self.assertEqual(metrics.REQUESTS_IN_FLIGHT.value(), 1)
+        self.assertEqual(metrics.REQUEST_LATENCY.count('/api/dymension/stream', 'POST'), before)
+        response.get_data()
+        response.close()
+        self.assertEqual(metrics.REQUESTS_IN_FLIGHT.value(), 0)
+        self.assertEqual(metrics.REQUEST_LATENCY.count('/api/dymension/stream', 'POST'), before + 1)
+
+    def test_rejects_commands_outside_the_allowlist(self):
+        for command in ['rm -rf /', 'dymd keys export alice --unsafe --unarmored-hex', 'dymd tx bank send a b 1dym -y']:
+            response = self.client.post('/api/dymension/stream', json={'command': command})
+            self.assertEqual(response.status_code, 400)
+
+    def test_post_only_and_disabled_by_default(self):
+        self.assertEqual(self.client.get('/api/dymension/stream?command=dymd+-c+1').status_code, 405)
+        client = create_app({'TESTING': True}).test_client()
+        with patch('subprocess.Popen') as popen:
+            response = client.post('/api/dymension/stream', json={'command': 'roller rollapp start'})
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(popen.called)
+
+class TestDymensionBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({'TESTING': True}).test_client()
+
+    def test_results_keep_order(self):
+        commands = [
+            {'query': 'get_balance', 'params': {'address': 'dym1abc'}},
+            {'query': 'query_rollapp'},
+            'dymd tx bank send a b 1adym',
+            'dymd version',
+        ]
+        with patch.object(api.dym_cli, 'run_command_async', side_effect=fake_run):
+            response = self.client.post('/api/dymension/batch', json={'commands': commands})
+        results = response.get_json()['results']
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0]['output'], 'dymd query bank balances dym1abc --output json')
+        self.assertEqual(results[1]['status'], 'error')
+        self.assertIn('read-only', results[2]['error'])
+        self.assertEqual(results[3]['output'], 'dymd version')
+
+    def test_requires_command_list(self):
+        response = self.client.post('/api/dymension/batch', json={'commands': 'dymd version'})
+        self.assertEqual(response.status_code, 400)
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.client = create_app({'TESTING': True}).test_client()
+
+    def test_records_requests_per_route(self):
+        before = metrics.REQUESTS_TOTAL.value('/api/dymension/help', 'GET', '404')
+        self.client.get('/api/dymension/help?category=nope')
+        self.client.post('/api/dymension/command', json={'command': 'List all wallets'})
+
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain; version=0.0.4'))
+        self.assertEqual(metrics.REQUESTS_TOTAL.value('/api/dymension/help', 'GET', '404'), before + 1)
+        body = response.get_data(as_text=True)
+        self.assertIn('dymension_http_request_duration_seconds_count{route="/api/dymension/command",method="POST"}', body)
+        self.assertIn('dymension_span_duration_seconds_count{span="translate_to_cli_command"}', body)
+        self.assertIn('dymension_span_duration_seconds_count{span="json_serialization"}', body)
+        # The test client tears every request down before returning
+        self.assertEqual(metrics.REQUESTS_IN_FLIGHT.value(), 0)
+
+async def fake_run(args, parse_json=False):
+    return {"status": "success", "output": " ".join(args), "error": ""}
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import asyncio
+import gzip
+import sys
+import unittest
+from unittest.mock import patch
+from app import create_asgi_app
+from app.routes import api
+from app.utils import metrics
+
+class TestAsgiApp(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_asgi_app({'TESTING': True})
+
+    def request(self, method, path, **kwargs):
+        async def send():
+            client = self.app.test_client()
+            response = await getattr(client, method)(path, **kwargs)
+            return response, await response.get_data()
+        return asyncio.run(send())
+
+    def test_help_etag(self):
+        response, _ = self.request('get', '/api/dymension/help')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Access-Control-Allow-Origin'], '*')
+        cached, body = self.request('get', '/api/dymension/help', headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(body, b'')
+
+    def test_gzip_when_accepted(self):
+        plain, body = self.request('get', '/api/dymension/help')
+        response, compressed = self.request('get', '/api/dymension/help', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed), body)
+
+    def test_command_translation(self):
+        response, _ = self.request('post', '/api/dymension/command', json={'command': 'List all wallets'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_stream_awaits_subprocess(self):
+        self.app.config.update(DYMENSION_STREAM_ENABLED=True, DYMENSION_STREAM_COMMANDS=[('dymd', '-c')])
+        # Run "dymd" commands through the Python interpreter
+        before = metrics.REQUEST_LATENCY.count('/api/dymension/stream', 'POST')
+        with patch.object(api.dym_cli.binaries, 'path', side_effect=lambda name: sys.executable):
+            _, body = self.request('post', '/api/dymension/stream', json={'command': ['dymd', '-c', "print('hi')"]})
+        self.assertIn(b'event: stdout\ndata: hi\n\n', body)
+        self.assertIn(b'event: status', body)
+        # Recorded once the streamed body closed
+        self.assertEqual(metrics.REQUEST_LATENCY.count('/api/dymension/stream', 'POST'), before + 1)
+        self.assertEqual(metrics.REQUESTS_IN_FLIGHT.value(), 0)
+
+    def test_metrics(self):
+        self.request('get', '/api/ping')
+        response, body = self.request('get', '/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'dymension_http_requests_total{route="/api/ping",method="GET",status="200"}', body)
+
+    def test_batch(self):
+        async def fake_run(args, parse_json=False):
+            return {"status": "success", "output": " ".join(args), "error": ""}
+
+        with patch.object(api.dym_cli, 'run_command_async', side_effect=fake_run):
+            response, _ = self.request('post', '/api/dymension/batch', json={'commands': ['dymd version']})
+        self.assertEqual(response.status_code, 200)
+
+if __name__ == '__main__':
+    unittest.main()
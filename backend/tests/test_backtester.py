@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+from app.utils.backtester import backtest, backtest_signals, performance_stats
+from app.utils.crossover_engine import CrossoverGrid
+from app.utils.trading_strategy import momentum_trading_strategy
+from tests.test_crossover_engine import random_walk
+
+class TestPerformanceStats(unittest.TestCase):
+
+    def test_performance_stats(self):
+        stats = performance_stats(np.array([[0.1, -0.5, 0.2], [0.0, 0.0, 0.0]]))
+        np.testing.assert_allclose(stats['total_return'], [1.1 * 0.5 * 1.2 - 1, 0.0])
+        np.testing.assert_allclose(stats['max_drawdown'], [-0.5, 0.0])
+        self.assertEqual(stats['sharpe'][1], 0.0)
+        self.assertLess(stats['sharpe'][0], 0.0)
+
+class TestBacktest(unittest.TestCase):
+
+    def test_costs_and_sizing(self):
+        prices = np.array([100.0, 110.0, 121.0, 121.0, 100.0])
+        signals = np.array([1.0, 1.0, 0.0, 0.0, 0.0])
+        result = backtest(prices, signals, initial_capital=1000.0, commission=0.001, slippage=0.001,
+                          position_size=0.5)
+        # In at bar 0's close, out at bar 2's close: two trades of half the equity
+        np.testing.assert_allclose(result['returns'], [-0.001, 0.05, 0.05 - 0.001, 0.0, 0.0])
+        self.assertAlmostEqual(result['equity'][-1], 1000 * 0.999 * 1.05 * 1.049)
+        self.assertEqual(result['stats']['trades'], 2)
+        self.assertAlmostEqual(result['stats']['costs'], 0.002)
+        self.assertAlmostEqual(result['stats']['exposure'], 0.4)
+
+    def test_backtest_signals_matches_pandas(self):
+        data = random_walk()
+        signals = momentum_trading_strategy(data, 10, 50)
+        result = backtest_signals(signals, initial_capital=1.0)
+        equity = (1 + (signals['signal'].shift(1) * signals['price'].pct_change()).fillna(0.0)).cumprod()
+        np.testing.assert_allclose(result['curve']['equity'], equity, rtol=1e-12)
+        self.assertEqual(result['stats']['trades'], int((signals['positions'] != 0).sum()) - 1)
+        self.assertIsInstance(result['stats']['sharpe'], float)
+
+    def test_batch_matches_single_runs(self):
+        prices = random_walk()['Close'].to_numpy()
+        grid = CrossoverGrid(prices, [(5, 20), (10, 50), (20, 100)])
+        batch = backtest(prices, grid.signals, commission=0.0005, position_size=np.array([1.0, 0.5, 0.25]))
+        self.assertEqual(batch['equity'].shape, (3, len(prices)))
+        for row, size in enumerate([1.0, 0.5, 0.25]):
+            single = backtest(prices, grid.signals[row], commission=0.0005, position_size=size)
+            np.testing.assert_allclose(batch['equity'][row], single['equity'])
+            self.assertAlmostEqual(batch['stats']['sortino'][row], single['stats']['sortino'])
+
+    def test_volatility_targeting_caps_leverage(self):
+        prices = random_walk()['Close'].to_numpy()
+        result = backtest(prices, np.ones(len(prices)), target_volatility=0.5, max_leverage=2.0)
+        self.assertEqual(result['exposure'][:19].max(), 0.0)
+        self.assertEqual(result['exposure'][19:].min(), 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
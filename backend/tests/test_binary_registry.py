@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from app.utils import binary_registry
+from app.utils.binary_registry import BinaryRegistry
+
+class TestBinaryRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.binary = os.path.join(self.tmpdir.name, "dymd")
+        with open(self.binary, "w") as f:
+            f.write("#!/bin/sh\necho v1\n")
+        os.chmod(self.binary, 0o755)
+        self.calls = []
+        self.run = lambda args: self.calls.append(args) or {"status": "success", "output": "v1", "error": ""}
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_registry(self):
+        paths = {"dymd": self.binary, "roller": "roller"}
+        with patch.object(binary_registry, "find_binary", side_effect=paths.get):
+            return BinaryRegistry(("dymd", "roller"), run=self.run)
+
+    def test_version_probed_once(self):
+        registry = self.make_registry()
+        registry.info()
+        registry.version("dymd")
+        self.assertEqual(self.calls, [[self.binary, "version"]])
+        self.assertEqual(registry.info()["dymd"]["version"], "v1")
+        self.assertFalse(registry.info()["roller"]["found"])
+
+    def test_reprobes_when_mtime_changes(self):
+        registry = self.make_registry()
+        stat = os.stat(self.binary)
+        os.utime(self.binary, (stat.st_atime, stat.st_mtime + 10))
+        registry.version("dymd")
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(registry.mtime("dymd"), stat.st_mtime + 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from app.utils.chain_rest import ChainRestClient, rest_path_for
+from app.utils.dymension_cli import DymensionCLI
+
+class StubNodeHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for a node's REST gateway."""
+
+    def do_GET(self):
+        if self.path == "/cosmos/bank/v1beta1/balances/dym1abc":
+            status, body = 200, {"balances": [{"denom": "adym", "amount": "10"}]}
+        else:
+            status, body = 404, {"code": 5, "message": "not found"}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestChainRestClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubNodeHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_rest_path_for(self):
+        self.assertEqual(rest_path_for(["dymd", "query", "rollapp", "rollapp-list", "--output", "json"]),
+                         "/dymensionxyz/dymension/rollapp/rollapp")
+        self.assertEqual(rest_path_for(["dymd", "query", "sequencer", "sequencers", "myapp_1-1"]),
+                         "/dymensionxyz/dymension/sequencer/sequencers_by_rollapp/myapp_1-1")
+        self.assertIsNone(rest_path_for(["dymd", "query", "bank", "balances", "dym1abc", "--height", "5"]))
+        self.assertIsNone(rest_path_for(["dymd", "tx", "bank", "send"]))
+
+    def test_query_matches_run_command_shape(self):
+        client = ChainRestClient(self.url)
+        result = client.query(["dymd", "query", "bank", "balances", "dym1abc", "--output", "json"], parse_json=True)
+        self.assertEqual(result, {
+            "status": "success",
+            "output": {"balances": [{"denom": "adym", "amount": "10"}]},
+            "error": ""
+        })
+        error = client.query(["dymd", "query", "rollapp", "rollapp", "missing"], parse_json=True)
+        self.assertEqual(error["status"], "error")
+        self.assertEqual(error["error"], "not found")
+
+    def test_cli_uses_rest_backend(self):
+        cli = DymensionCLI(rest_url=self.url, cache_queries=False)
+        with patch.object(cli, "_run_command") as run:
+            result = cli.get_balance("dym1abc")
+        run.assert_not_called()
+        self.assertEqual(result["output"]["balances"][0]["amount"], "10")
+
+    def test_cli_falls_back_when_node_unreachable(self):
+        cli = DymensionCLI(rest_url="http://127.0.0.1:9", cache_queries=False)
+        fallback = {"status": "success", "output": {}, "error": ""}
+        with patch.object(cli, "_run_command", return_value=fallback) as run:
+            self.assertEqual(cli.get_balance("dym1abc"), fallback)
+        run.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.crossover_engine import CrossoverGrid, moving_averages
+from app.utils.trading_strategy import momentum_trading_strategy
+
+def random_walk(rows=600, seed=7):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2022-01-03', periods=rows, freq='B', name='Date')
+    return pd.DataFrame({'Close': 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))}, index=index)
+
+class TestMovingAverages(unittest.TestCase):
+
+    def test_matches_rolling_mean_including_gaps(self):
+        close = random_walk()['Close']
+        close.iloc[[30, 31, 200]] = np.nan
+        averages = moving_averages(close.to_numpy(), [1, 5, 50, 1000])
+        for row, window in enumerate([1, 5, 50, 1000]):
+            np.testing.assert_allclose(averages[row], close.rolling(window).mean().to_numpy(), rtol=1e-12)
+
+    def test_averages_every_row_of_a_matrix(self):
+        prices = np.stack([random_walk(seed=seed)['Close'].to_numpy() for seed in range(3)])
+        averages = moving_averages(prices, [5, 20])
+        self.assertEqual(averages.shape, (2, 3, 600))
+        np.testing.assert_allclose(averages[1, 2], pd.Series(prices[2]).rolling(20).mean(), rtol=1e-12)
+
+class TestCrossoverGrid(unittest.TestCase):
+
+    def test_matches_momentum_trading_strategy(self):
+        data = random_walk()
+        pairs = [(5, 20), (10, 50), (20, 100), (50, 200)]
+        grid = CrossoverGrid(data['Close'], pairs)
+        self.assertEqual(grid.signals.shape, (4, 600))
+
+        for short_window, long_window in pairs:
+            expected = momentum_trading_strategy(data, short_window, long_window)
+            frame = grid.frame(short_window, long_window)
+            pd.testing.assert_frame_equal(frame[['price', 'signal', 'positions']],
+                                          expected[['price', 'signal', 'positions']])
+            pd.testing.assert_frame_equal(frame, expected, check_exact=False, rtol=1e-12)
+
+    def test_flat_prices_give_the_same_signals(self):
+        data = random_walk(rows=1500)
+        for start, length in [(100, 40), (400, 250), (900, 5), (1100, 120)]:
+            data.iloc[start:start + length, 0] = data['Close'].iloc[start]
+        pairs = [(short, long) for short in range(2, 60, 3) for long in range(10, 260, 7) if short < long]
+        grid = CrossoverGrid(data['Close'], pairs)
+        for short_window, long_window in pairs:
+            expected = momentum_trading_strategy(data, short_window, long_window)
+            np.testing.assert_array_equal(grid.signals[grid.row(short_window, long_window)], expected['signal'])
+        np.testing.assert_array_equal(grid.long_mavg(5, 220)[649], data['Close'].iloc[649])
+
+    def test_accessors_return_views(self):
+        grid = CrossoverGrid(random_walk()['Close'], [(5, 20), (10, 20)])
+        self.assertIs(grid.signals.base, grid.values)
+        self.assertIs(grid.positions.base, grid.values)
+        self.assertTrue(np.shares_memory(grid.long_mavg(5, 20), grid.long_mavg(10, 20)))
+        self.assertTrue(np.shares_memory(grid.short_mavg(10, 20), grid.averages))
+        self.assertEqual(len(grid.windows), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from app.utils import binary_registry
+from app.utils.binary_registry import BinaryRegistry
+from app.utils.dymension_cli import DymensionCLI, TranslationCache, command_response, match_intent
+
+class TestDymensionCLI(unittest.TestCase):
+
+    def setUp(self):
+        self.cli = DymensionCLI()
+
+    def test_match_intent(self):
+        self.assertEqual(match_intent("install roller cli"), "install_roller")
+        self.assertEqual(match_intent("list all wallets"), "list_wallets")
+        self.assertIsNone(match_intent("what is the weather today"))
+
+    def test_intent_priority(self):
+        # "create a new wallet" is listed before "help" in INTENTS
+        self.assertEqual(match_intent("help me create a new wallet"), "create_wallet")
+
+    def test_translate_with_arguments(self):
+        result = self.cli.translate_to_cli_command("Check balance of dym1abc")
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["command"], ["dymd query bank balances dym1abc"])
+
+    def test_translate_unrecognized(self):
+        result = self.cli.translate_to_cli_command("what is the weather today")
+        self.assertEqual(result["status"], "error")
+        self.assertIn("Help", result["suggestions"])
+
+    def test_translate_suggests_closest_examples(self):
+        result = self.cli.translate_to_cli_command("chek balanse of my walet")
+        self.assertEqual(result["suggestions"][0], "Check balance of my wallet mywallet")
+
+    def test_parse_command_cache(self):
+        first = self.cli.parse_command("List all wallets")
+        second = self.cli.parse_command("  list   ALL wallets ")
+        self.assertEqual(first, second)
+        info = self.cli.translation_cache.info()
+        self.assertEqual((info["hits"], info["misses"]), (1, 1))
+
+class TestCommandResponse(unittest.TestCase):
+
+    def test_structured_output_is_sent_once(self):
+        output = {"rollapps": [{"rollapp_id": "myapp_1-1"}]}
+        response = command_response({"status": "success", "output": output, "error": ""})
+        self.assertEqual(response, {"status": "success", "output": output, "error": ""})
+
+    def test_translation_omits_contained_command(self):
+        response = command_response(DymensionCLI().parse_command("List all wallets"))
+        self.assertIn("dymd keys list", response["output"])
+        self.assertNotIn("raw_output", response)
+
+    def test_error_keeps_suggestions(self):
+        response = command_response(DymensionCLI().parse_command("walet balanse"))
+        self.assertTrue(response["output"].startswith("Error: "))
+        self.assertIn("Try one of these commands", response["raw_output"])
+
+class TestTranslationCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = TranslationCache(maxsize=2)
+        cache.put("a", {"status": "success"})
+        cache.put("b", {"status": "success"})
+        cache.get("a")
+        cache.put("c", {"status": "success"})
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.info()["size"], 2)
+class TestRunCommandAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.cli = DymensionCLI(command_timeout=5, max_concurrent_commands=2)
+
+    def test_parses_json_output(self):
+        args = [sys.executable, "-c", "import json; print(json.dumps({'ok': True}))"]
+        result = asyncio.run(self.cli.run_command_async(args, parse_json=True))
+        self.assertEqual(result, {"status": "success", "output": {"ok": True}, "error": ""})
+
+    def test_timeout_kills_process(self):
+        args = [sys.executable, "-c", "import time; time.sleep(10)"]
+        start = time.monotonic()
+        result = asyncio.run(self.cli.run_command_async(args, timeout=0.2))
+        self.assertEqual(result["status"], "error")
+        self.assertIn("timed out", result["error"])
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_concurrency_is_bounded(self):
+        args = [sys.executable, "-c", "import time; time.sleep(0.3)"]
+
+        async def run_all():
+            return await asyncio.gather(*(self.cli.run_command_async(args) for _ in range(4)))
+
+        start = time.monotonic()
+        results = asyncio.run(run_all())
+        self.assertTrue(all(r["status"] == "success" for r in results))
+        # Four 0.3s commands with two slots need at least two rounds
+        self.assertGreaterEqual(time.monotonic() - start, 0.6)
+
+    def test_missing_binary(self):
+        result = asyncio.run(self.cli.run_command_async(["no-such-binary-xyz"]))
+        self.assertEqual(result["status"], "error")
+
+class TestBinaryPaths(unittest.TestCase):
+
+    def test_binary_installed_after_startup_is_used(self):
+        cli = DymensionCLI()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dymd")
+            find = lambda name: path if os.path.exists(path) else name
+            with patch.object(binary_registry, "find_binary", side_effect=find):
+                cli.binaries = BinaryRegistry(run=lambda args: {"status": "success", "output": "v1", "error": ""})
+                self.assertEqual(cli._resolve_args(["dymd", "version"]), ["dymd", "version"])
+                with open(path, "w") as f:
+                    f.write("#!/bin/sh\n")
+                os.chmod(path, 0o755)
+                self.assertEqual(cli._resolve_args(["dymd", "version"]), [path, "version"])
+
+class TestRunBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.cli = DymensionCLI()
+        self.loops = []
+
+        async def fake_run(args, parse_json=False):
+            self.loops.append(asyncio.get_running_loop())
+            return {"status": "success", "output": " ".join(args), "error": ""}
+        self.cli.run_command_async = fake_run
+
+    def test_malformed_items_get_their_own_error(self):
+        results = self.cli.run_batch([5, {"command": 5}, {"query": ["get_balance"]}, None, "dymd version"])
+        self.assertEqual([r["status"] for r in results], ["error"] * 4 + ["success"])
+        self.assertIn("not int", results[0]["error"])
+
+    def test_calls_share_one_event_loop(self):
+        threads = [threading.Thread(target=self.cli.run_batch, args=(["dymd version"],)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.loops), 4)
+        self.assertEqual(len(set(self.loops)), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from app.utils.command_catalog import HELP_COMMANDS
+from app.utils.intent_suggester import IntentSuggester, char_ngrams
+
+class TestIntentSuggester(unittest.TestCase):
+
+    def setUp(self):
+        self.suggester = IntentSuggester([
+            "Create a new wallet named mywallet",
+            "List all wallets",
+            "Deploy block explorer for my RollApp",
+        ])
+
+    def test_char_ngrams_skip_stop_words(self):
+        self.assertEqual(char_ngrams("the go"), {" go": 1, "go ": 1})
+
+    def test_suggest_tolerates_typos(self):
+        self.assertEqual(self.suggester.suggest("lsit walets", k=1), ["List all wallets"])
+        self.assertEqual(self.suggester.suggest("deploy explorr", k=1), ["Deploy block explorer for my RollApp"])
+
+    def test_suggest_nothing_for_unrelated_text(self):
+        self.assertEqual(self.suggester.suggest("zzz qqq"), [])
+
+    def test_unknown_words_lower_the_score(self):
+        self.assertEqual(self.suggester.suggest("wallets", k=1), ["List all wallets"])
+        self.assertEqual(self.suggester.suggest("qwrtzp vbnmlk jjjhhh wallets"), [])
+        catalog = IntentSuggester([command["example"] for command in HELP_COMMANDS])
+        self.assertEqual(catalog.suggest("qwrtzp vbnmlk jjjhhh balance"), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.json_utils import clean_for_json
+
+class TestCleanForJson(unittest.TestCase):
+
+    def test_dataframe_is_columnar(self):
+        frame = pd.DataFrame(
+            {'price': [1.5, np.nan], 'signal': [0, 1], 'note': ['a', None]},
+            index=pd.to_datetime(['2024-01-01 09:00', None])
+        )
+        self.assertEqual(clean_for_json(frame), {
+            'index': ['2024-01-01T09:00:00', None],
+            'columns': ['price', 'signal', 'note'],
+            'data': [[1.5, None], [0, 1], ['a', None]]
+        })
+
+    def test_tz_aware_index_in_utc(self):
+        index = pd.date_range('2024-01-01', periods=2, freq='h', tz='US/Eastern')
+        self.assertEqual(clean_for_json(pd.Series([1.0, 2.0], index=index).index),
+                         ['2024-01-01T05:00:00Z', '2024-01-01T06:00:00Z'])
+
+    def test_arrays_and_scalars(self):
+        cleaned = clean_for_json({
+            'matrix': np.array([[1.0, np.nan], [2.0, 3.0]]),
+            'series': pd.Series([np.nan, 2.0]),
+            'nullable': pd.Series([1, None], dtype='Int64'),
+            'objects': np.array([np.int64(1), np.nan, 'x'], dtype=object),
+            'scalar': np.float32(0.5)
+        })
+        self.assertEqual(cleaned, {
+            'matrix': [[1.0, None], [2.0, 3.0]],
+            'series': [None, 2.0],
+            'nullable': [1, None],
+            'objects': [1, None, 'x'],
+            'scalar': 0.5
+        })
+        json.dumps(cleaned, allow_nan=False)
+
+if __name__ == '__main__':
+    unittest.main()
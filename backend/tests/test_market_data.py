@@ -0,0 +1,253 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.market_data import MarketDataStore, bars_since, ingest, load_bars, split_by_symbol
+from app.utils.trading_strategy import fetch_bars_since, fetch_many, fetch_stock_data
+
+def make_bars(start, end, freq='1D', tz=None):
+    """Deterministic OHLCV bars in [start, end)."""
+    index = pd.date_range(start, end, freq=freq, tz=tz, inclusive='left', name='Date')
+    close = 100 + np.arange(len(index), dtype=float)
+    return pd.DataFrame({
+        'Close': close, 'High': close + 1, 'Low': close - 1, 'Open': close,
+        'Volume': np.arange(len(index), dtype=np.int64) * 1000
+    }, index=index)
+
+class StubDownloader:
+    """Serves bars from a fixed frame and records every download."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = []
+
+    def __call__(self, symbols, start, end, interval):
+        self.calls.append((symbols, start, end, interval))
+        index = self.bars.index
+        bounds = [pd.Timestamp(start), pd.Timestamp(end)]
+        if index.tz is not None:
+            bounds = [b.tz_localize(index.tz) for b in bounds]
+        return self.bars[(index >= bounds[0]) & (index < bounds[1])]
+
+class StubBatchDownloader:
+    """Serves multi-symbol downloads in the yf.download layout and tracks concurrency."""
+
+    def __init__(self, bars_by_symbol, delay=0.02):
+        self.bars_by_symbol = bars_by_symbol
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, symbols, start, end, interval):
+        with self.lock:
+            self.calls.append((list(symbols), start, end))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        frames = {symbol: StubDownloader(self.bars_by_symbol[symbol])(symbol, start, end, interval)
+                  for symbol in symbols if symbol in self.bars_by_symbol}
+        return pd.concat(frames, axis=1, names=['Ticker', 'Price']).swaplevel(axis=1)
+
+class TestMarketDataStore(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.store = MarketDataStore(self.root)
+
+    def test_round_trip_and_range_reads(self):
+        bars = make_bars('2024-01-01', '2024-01-03', freq='1h', tz='America/New_York')
+        self.store.write('aapl', '1h', bars)
+        pd.testing.assert_frame_equal(self.store.read('AAPL', '1h'), bars, check_freq=False, check_index_type=False)
+
+        day = self.store.read('AAPL', '1h', start='2024-01-02', end='2024-01-03')
+        self.assertEqual(len(day), 24)
+        self.assertEqual(day.index[0], pd.Timestamp('2024-01-02', tz='America/New_York'))
+        self.assertEqual(day['Volume'].dtype, np.int64)
+        self.assertIsNone(self.store.read('MSFT', '1h'))
+
+    def test_merge_replaces_overlapping_bars(self):
+        self.store.write('AAPL', '1d', make_bars('2024-01-01', '2024-01-10'))
+        update = make_bars('2024-01-08', '2024-01-12') * 2
+        meta = self.store.merge('AAPL', '1d', update, covered_until='2024-01-12')
+        stored = self.store.read('AAPL', '1d')
+        self.assertEqual(len(stored), 11)
+        self.assertEqual(stored.loc['2024-01-09', 'Close'], update.loc['2024-01-09', 'Close'])
+        self.assertEqual((meta['covered_from'], meta['covered_until']), ('2024-01-01', '2024-01-12'))
+        # The current and previous generations stay on disk
+        meta = self.store.merge('AAPL', '1d', update, covered_until='2024-01-12')
+        files = os.listdir(os.path.join(self.root, '1d', 'AAPL'))
+        generations = {int(name.split('-')[0]) for name in files if name.endswith('.bin')}
+        self.assertEqual(generations, {meta['generation'] - 1, meta['generation']})
+
+    def test_read_survives_concurrent_writes(self):
+        bars = make_bars('2024-01-01', '2024-01-10')
+        self.store.write('AAPL', '1d', bars)
+        stale = self.store.info('AAPL', '1d')
+        self.store.write('AAPL', '1d', bars * 2)
+        # Readers of the previous meta.json still find its files
+        self.assertTrue(os.path.exists(os.path.join(self.root, '1d', 'AAPL', f"{stale['generation']}-index.bin")))
+
+        # A reader whose generation was removed meanwhile reads the current one
+        self.store.write('AAPL', '1d', bars * 3)
+        info = self.store.info
+        calls = []
+        def stale_once(symbol, interval):
+            calls.append(symbol)
+            return stale if len(calls) == 1 else info(symbol, interval)
+        self.store.info = stale_once
+        pd.testing.assert_frame_equal(self.store.read('AAPL', '1d'), bars * 3, check_freq=False, check_index_type=False)
+
+    def test_lock_serializes_processes(self):
+        lock = self.store.lock('AAPL', '1d')
+        other = MarketDataStore(self.root).lock('AAPL', '1d')
+        acquired = []
+        with lock, lock:
+            thread = threading.Thread(target=lambda: (other.acquire(), acquired.append(True), other.release()))
+            thread.start()
+            thread.join(0.2)
+            # A separate open file description (as in another process) waits for the flock
+            self.assertEqual(acquired, [])
+        thread.join(5)
+        self.assertEqual(acquired, [True])
+
+class TestIngest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.store = MarketDataStore(self.root)
+        self.store.write('BTC-USD', '1h', make_bars('2024-01-01', '2024-01-05', freq='1h', tz='UTC'))
+
+    def test_appends_and_replaces_overlap(self):
+        previous = self.store.info('BTC-USD', '1h')
+        before = self.store.read('BTC-USD', '1h')
+        update = make_bars('2024-01-04', '2024-01-06', freq='1h', tz='UTC')
+        update['Close'] += 0.5
+        added = ingest(self.store, StubDownloader(update), 'BTC-USD', '1h', end='2024-01-06')
+
+        self.assertEqual(added, 24)
+        meta = self.store.info('BTC-USD', '1h')
+        # Revised bars go to a new generation; readers of the previous one see it unchanged
+        self.assertEqual(meta['generation'], previous['generation'] + 1)
+        store = MarketDataStore(self.root)
+        store.info = lambda symbol, interval: previous
+        pd.testing.assert_frame_equal(store.read('BTC-USD', '1h'), before)
+        self.assertEqual(meta['covered_until'], '2024-01-06')
+        stored = self.store.read('BTC-USD', '1h')
+        self.assertEqual(len(stored), 5 * 24)
+        self.assertTrue(stored.index.is_unique)
+        self.assertEqual(stored.loc['2024-01-04 05:00', 'Close'], update.loc['2024-01-04 05:00', 'Close'])
+        self.assertEqual(self.store.last_timestamp('BTC-USD', '1h'), pd.Timestamp('2024-01-05 23:00', tz='UTC'))
+
+    def test_appends_new_bars_in_place(self):
+        generation = self.store.info('BTC-USD', '1h')['generation']
+        meta = self.store.append('BTC-USD', '1h', make_bars('2024-01-05', '2024-01-06', freq='1h', tz='UTC'))
+        self.assertEqual((meta['generation'], meta['rows']), (generation, 5 * 24))
+        self.assertEqual(self.store.read('BTC-USD', '1h')['Close'].iloc[-1], 100 + 23)
+
+    def test_since_returns_new_bars_including_the_last_seen_one(self):
+        downloader = StubDownloader(make_bars('2024-01-01', '2024-01-07', freq='1h', tz='UTC'))
+        since = self.store.last_timestamp('BTC-USD', '1h')
+        bars = bars_since(self.store, downloader, 'BTC-USD', '1h', since=since)
+        self.assertEqual(bars.index[0], since)
+        self.assertEqual(len(bars), 1 + 2 * 24)
+        self.assertEqual(downloader.calls[0][1], '2024-01-04')
+
+    def test_fetch_bars_since_starts_an_empty_series(self):
+        today = pd.Timestamp.now().normalize()
+        downloader = StubDownloader(make_bars(today - pd.Timedelta(days=60), today + pd.Timedelta(days=1)))
+        store = MarketDataStore(os.path.join(self.root, 'empty'))
+        bars = fetch_bars_since('AAPL', 'day', store=store, downloader=downloader)
+        self.assertEqual(len(bars), 31)
+        since = fetch_bars_since('AAPL', 'day', since=bars.index[-1], store=store, downloader=downloader)
+        self.assertEqual(len(since), 1)
+        self.assertEqual(len(downloader.calls), 2)
+
+class TestFetchMany(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.store = MarketDataStore(self.root)
+
+    def test_batches_downloads_and_splits_per_symbol(self):
+        today = pd.Timestamp.now().normalize()
+        history = make_bars(today - pd.Timedelta(days=60), today)
+        symbols = [f'SYM{i}' for i in range(120)]
+        downloader = StubBatchDownloader({symbol: history * (i + 1) for i, symbol in enumerate(symbols)})
+
+        frames = fetch_many(symbols + ['MISSING'], '1M', 'day', store=self.store, downloader=downloader,
+                            batch_size=50, max_workers=2)
+        self.assertEqual(sorted(len(call[0]) for call in downloader.calls), [21, 50, 50])
+        self.assertLessEqual(downloader.max_in_flight, 2)
+        self.assertEqual(set(frames), set(symbols))
+        self.assertEqual(len(frames['SYM3']), 30)
+        self.assertEqual(frames['SYM3']['Close'].iloc[0], history['Close'].iloc[-30] * 4)
+
+        # Everything is stored now
+        fetch_many(symbols, '1M', 'day', store=self.store, downloader=downloader)
+        self.assertEqual(len(downloader.calls), 3)
+
+    def test_split_shares_downloaded_data(self):
+        downloader = StubBatchDownloader({'A': make_bars('2024-01-01', '2024-01-10'),
+                                          'B': make_bars('2024-01-03', '2024-01-10')}, delay=0)
+        data = downloader(['A', 'B'], '2024-01-01', '2024-01-10', '1d')
+        frames = split_by_symbol(data, ['A', 'B', 'C'])
+        self.assertEqual(set(frames), {'A', 'B'})
+        self.assertTrue(np.shares_memory(frames['A']['Close'].to_numpy(), data[('Close', 'A')].to_numpy()))
+        self.assertEqual(len(frames['B']), 7)
+
+class TestLoadBars(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.store = MarketDataStore(self.root)
+        self.downloader = StubDownloader(make_bars('2023-01-01', '2025-01-01'))
+
+    def load(self, start, end):
+        return load_bars(self.store, self.downloader, 'AAPL', '1d', start, end)
+
+    def test_downloads_only_missing_tail(self):
+        self.assertEqual(len(self.load('2024-01-01', '2024-02-01')), 31)
+        self.assertEqual(len(self.load('2024-01-01', '2024-02-01')), 31)
+        self.assertEqual(len(self.load('2024-01-15', '2024-02-10')), 26)
+        self.assertEqual(self.downloader.calls, [
+            ('AAPL', '2024-01-01', '2024-02-01', '1d'),
+            ('AAPL', '2024-01-31', '2024-02-10', '1d'),
+        ])
+
+        # Reaching further back downloads the whole window again
+        self.assertEqual(len(self.load('2023-12-01', '2024-02-10')), 71)
+        self.assertEqual(self.downloader.calls[-1], ('AAPL', '2023-12-01', '2024-02-10', '1d'))
+
+    def test_seeded_store_works_offline(self):
+        seed = os.path.join(self.root, 'seed', '1d')
+        os.makedirs(seed)
+        make_bars('2024-01-01', '2024-03-01').to_csv(os.path.join(seed, 'AAPL.csv'))
+        self.assertEqual(self.store.seed(os.path.dirname(seed)), [('AAPL', '1d')])
+
+        def offline(*args):
+            raise ConnectionError('offline')
+
+        data = load_bars(self.store, offline, 'AAPL', '1d', '2024-02-01', '2024-03-10')
+        self.assertEqual(len(data), 29)
+
+    def test_fetch_stock_data_reads_from_store(self):
+        downloader = StubDownloader(make_bars('2000-01-01', pd.Timestamp.now().normalize()))
+        first = fetch_stock_data('AAPL', '1M', 'day', store=self.store, downloader=downloader)
+        second = fetch_stock_data('AAPL', '1M', 'day', store=self.store, downloader=downloader)
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+        self.assertEqual(len(downloader.calls), 1)
+
+if __name__ == '__main__':
+    unittest.main()
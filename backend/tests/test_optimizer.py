@@ -0,0 +1,44 @@
+import unittest
+import pandas as pd
+from app.utils.optimizer import optimize_windows, walk_forward_folds, window_grid
+from app.utils.trading_strategy import momentum_trading_strategy
+from tests.test_crossover_engine import random_walk
+
+class TestOptimizerHelpers(unittest.TestCase):
+
+    def test_grid_and_folds(self):
+        self.assertEqual(window_grid([5, 10, 20], [10, 20]), [(5, 10), (5, 20), (10, 20)])
+        self.assertEqual(walk_forward_folds(100, 50, 20), [(0, 50, 70), (20, 70, 90), (40, 90, 100)])
+
+class TestOptimizeWindows(unittest.TestCase):
+
+    def setUp(self):
+        self.data = random_walk(rows=800)
+
+    def test_results_match_momentum_trading_strategy(self):
+        result = optimize_windows(self.data, range(2, 30, 3), range(10, 120, 10), max_workers=1)
+        results = result['results']
+        self.assertEqual(len(results), len(window_grid(range(2, 30, 3), range(10, 120, 10))))
+        self.assertEqual(result['best'], results.index[0])
+
+        signals = momentum_trading_strategy(self.data, 5, 40)
+        returns = (signals['signal'].shift(1) * self.data['Close'].pct_change()).fillna(0.0)
+        equity = (1 + returns).cumprod()
+        self.assertAlmostEqual(results.loc[(5, 40), 'total_return'], equity.iloc[-1] - 1, places=10)
+        self.assertAlmostEqual(results.loc[(5, 40), 'max_drawdown'],
+                               (equity / equity.cummax().clip(lower=1) - 1).min(), places=10)
+
+        walk_forward = result['walk_forward']
+        self.assertEqual(len(walk_forward), 4)
+        self.assertEqual(walk_forward['test_start'].iloc[0], self.data.index[400])
+        self.assertTrue((walk_forward['short_window'] < walk_forward['long_window']).all())
+        self.assertEqual(set(result['walk_forward_stats']), {'total_return', 'sharpe', 'max_drawdown'})
+
+    def test_process_pool_matches_in_process(self):
+        serial = optimize_windows(self.data, range(2, 12), range(10, 60, 5), max_workers=1)
+        parallel = optimize_windows(self.data, range(2, 12), range(10, 60, 5), max_workers=2)
+        pd.testing.assert_frame_equal(serial['results'], parallel['results'])
+        pd.testing.assert_frame_equal(serial['walk_forward'], parallel['walk_forward'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import cProfile
+import os
+import pstats
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from app import create_app
+from app.utils import profiling
+from app.utils.profiling import profile, profiled, pstats_to_collapsed
+
+def busy_loop(seconds=0.05):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+def ping(depth):
+    return depth and pong(depth - 1) + pang(depth - 1)
+
+def pong(depth):
+    return depth and pang(depth - 1) + ping(depth - 1)
+
+def pang(depth):
+    return depth and ping(depth - 1) + pong(depth - 1) + sum(range(100))
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        env = patch.dict(os.environ, {profiling.PROFILE_DIR_ENV: self.directory})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def read_profiles(self):
+        contents = []
+        for name in sorted(os.listdir(self.directory)):
+            with open(os.path.join(self.directory, name)) as f:
+                contents.append(f.read())
+        return contents
+
+    def test_off_by_default(self):
+        profiled("busy")(busy_loop)(0.01)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_sample_mode_writes_collapsed_stacks(self):
+        with profile("busy", mode="sample"):
+            busy_loop()
+        [content] = self.read_profiles()
+        stack, count = content.splitlines()[0].rsplit(" ", 1)
+        self.assertIn("test_profiling.py:busy_loop", stack.split(";"))
+        self.assertGreater(int(count), 0)
+
+    def test_profiles_in_quick_succession_get_their_own_files(self):
+        for _ in range(3):
+            with profile("busy", mode="sample"):
+                busy_loop(0.01)
+        self.assertEqual(len(os.listdir(self.directory)), 3)
+
+    def test_cprofile_mode_rebuilds_stacks(self):
+        with patch.dict(os.environ, {profiling.PROFILE_ENV: "cprofile"}):
+            profiled("busy")(busy_loop)()
+        [content] = self.read_profiles()
+        stacks = [line.rsplit(" ", 1)[0].split(";") for line in content.splitlines()]
+        self.assertTrue(any(s[-1] == "test_profiling.py:busy_loop" for s in stacks))
+        self.assertTrue(any(s[:-1] == ["test_profiling.py:busy_loop"] and "time.perf_counter" in s[-1] for s in stacks))
+
+    def test_cprofile_conversion_of_mutual_recursion(self):
+        # Entered from outside the cycle, and from a function of the cycle itself
+        for entry in (lambda: [ping(8)], lambda: ping(8)):
+            profiler = cProfile.Profile()
+            profiler.enable()
+            entry()
+            profiler.disable()
+
+            start = time.perf_counter()
+            collapsed = pstats_to_collapsed(pstats.Stats(profiler))
+            self.assertLess(time.perf_counter() - start, 5)
+            self.assertTrue(any("test_profiling.py:pang" in stack for stack in collapsed))
+            for stack in collapsed:
+                frames = stack.split(";")
+                self.assertEqual(len(frames), len(set(frames)))
+
+    def test_request_header_needs_opt_in(self):
+        client = create_app({'TESTING': True}).test_client()
+        headers = {profiling.PROFILE_HEADER: 'cprofile'}
+        client.post('/api/dymension/command', json={'command': 'List all wallets'}, headers=headers)
+        self.assertEqual(os.listdir(self.directory), [])
+
+        with patch.dict(os.environ, {profiling.PROFILE_HEADER_ENV: '1'}):
+            client.post('/api/dymension/command', json={'command': 'List all wallets'}, headers=headers)
+            client.post('/api/dymension/command', json={'command': 'List all wallets'})
+        [name] = os.listdir(self.directory)
+        self.assertTrue(name.startswith('dymension_command-'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+import math
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from app.utils.dymension_cli import DymensionCLI
+from app.utils.query_cache import QueryResultCache
+
+SUCCESS = {"status": "success", "output": "ok", "error": ""}
+
+class TestQueryResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = QueryResultCache()
+
+    def test_ttl_for_uses_longest_prefix(self):
+        self.assertEqual(self.cache.ttl_for(["dymd", "version"]), math.inf)
+        self.assertEqual(self.cache.ttl_for(["dymd", "query", "bank", "balances", "dym1"]), 2.0)
+        self.assertEqual(self.cache.ttl_for(["dymd", "query", "other"]), self.cache.default_ttl)
+
+    def test_expired_entries_run_again(self):
+        calls = []
+        run = lambda: calls.append(1) or dict(SUCCESS)
+        self.cache.get_or_run("k", 0.05, run)
+        self.cache.get_or_run("k", 0.05, run)
+        time.sleep(0.1)
+        self.cache.get_or_run("k", 0.05, run)
+        self.assertEqual(len(calls), 2)
+
+    def test_errors_are_not_cached(self):
+        calls = []
+        run = lambda: calls.append(1) or {"status": "error", "output": "", "error": "boom"}
+        self.cache.get_or_run("k", 60, run)
+        self.cache.get_or_run("k", 60, run)
+        self.assertEqual(len(calls), 2)
+
+    def test_concurrent_threads_share_one_run(self):
+        calls = []
+
+        def run():
+            calls.append(1)
+            time.sleep(0.2)
+            return dict(SUCCESS)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get_or_run("k", 60, run)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [SUCCESS] * 5)
+
+    def test_concurrent_tasks_share_one_run(self):
+        calls = []
+
+        async def run():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return dict(SUCCESS)
+
+        async def run_all():
+            return await asyncio.gather(*(self.cache.get_or_run_async("k", 60, run) for _ in range(5)))
+
+        self.assertEqual(asyncio.run(run_all()), [SUCCESS] * 5)
+        self.assertEqual(len(calls), 1)
+
+    def test_invalidate_during_flight_skips_store(self):
+        def run():
+            self.cache.invalidate()
+            return dict(SUCCESS)
+
+        self.cache.get_or_run("k", 60, run)
+        self.assertEqual(self.cache.info()["size"], 0)
+
+class TestDymensionCLIQueryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cli = DymensionCLI()
+
+    def test_queries_cached_until_transaction(self):
+        with patch.object(self.cli, '_run_command', return_value=dict(SUCCESS)) as run:
+            self.cli.query_rollapp("myapp_1-1")
+            self.cli.query_rollapp("myapp_1-1")
+            self.assertEqual(run.call_count, 1)
+
+            self.cli.transfer_tokens("mywallet", "dym1abc", "1adym", "dymension_1100-1")
+            self.cli.query_rollapp("myapp_1-1")
+            self.assertEqual(run.call_count, 3)
+
+    def test_version_revalidated_when_binary_changes(self):
+        mtimes = iter([1.0, 1.0, 2.0])
+        with patch.object(self.cli, '_run_command', return_value=dict(SUCCESS)) as run, \
+                patch.object(self.cli.binaries, 'mtime', side_effect=lambda name: next(mtimes)):
+            self.cli.run_command(["dymd", "version"])
+            self.cli.run_command(["dymd", "version"])
+            self.assertEqual(run.call_count, 1)
+            # The binary was upgraded
+            self.cli.run_command(["dymd", "version"])
+            self.assertEqual(run.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.market_data import MarketDataStore
+from app.utils.resampling import ResampleCache, load_resampled, resample_bars
+from app.utils.trading_strategy import fetch_stock_data
+from tests.test_market_data import StubDownloader, make_bars
+
+def offline(*args):
+    raise AssertionError('unexpected download')
+
+class TestResampleBars(unittest.TestCase):
+
+    def test_aggregates_ohlcv(self):
+        bars = make_bars('2024-01-01', '2024-01-03', freq='1h', tz='UTC')
+        bars['Adj Close'] = bars['Close'] * 0.9
+        daily = resample_bars(bars, '1d')
+
+        self.assertEqual(list(daily.index), list(pd.date_range('2024-01-01', periods=2, tz='UTC')))
+        second_day = bars.loc['2024-01-02']
+        self.assertEqual(daily['Open'].iloc[1], second_day['Open'].iloc[0])
+        self.assertEqual(daily['High'].iloc[1], second_day['High'].max())
+        self.assertEqual(daily['Low'].iloc[1], second_day['Low'].min())
+        self.assertEqual(daily['Close'].iloc[1], second_day['Close'].iloc[-1])
+        self.assertEqual(daily['Adj Close'].iloc[1], second_day['Adj Close'].iloc[-1])
+        self.assertEqual(daily['Volume'].iloc[1], second_day['Volume'].sum())
+        self.assertEqual(daily['Volume'].dtype, np.int64)
+
+    def test_weeks_start_on_monday_and_skip_empty_bins(self):
+        business_days = make_bars('2024-01-01', '2024-02-01', freq='B')
+        business_days = business_days.drop(pd.date_range('2024-01-08', '2024-01-12'))
+        weekly = resample_bars(business_days, '1wk')
+        self.assertEqual([day.strftime('%Y-%m-%d') for day in weekly.index],
+                         ['2024-01-01', '2024-01-15', '2024-01-22', '2024-01-29'])
+        self.assertTrue((weekly.index.dayofweek == 0).all())
+
+        monthly = resample_bars(business_days, '1mo')
+        self.assertEqual(monthly.index[0], pd.Timestamp('2024-01-01'))
+        self.assertEqual(monthly['Close'].iloc[0], business_days['Close'].iloc[-1])
+
+class TestLoadResampled(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.store = MarketDataStore(self.root)
+        self.cache = ResampleCache()
+
+    def test_derives_from_stored_hourly_bars_without_downloading(self):
+        self.store.write('BTC-USD', '1h', make_bars('2024-01-01', '2024-03-01', freq='1h', tz='UTC'))
+        daily = load_resampled(self.store, offline, 'BTC-USD', '1d', '2024-01-10', '2024-02-10', cache=self.cache)
+        self.assertEqual(len(daily), 31)
+        weekly = load_resampled(self.store, offline, 'BTC-USD', '1wk', '2024-01-10', '2024-02-10', cache=self.cache)
+        self.assertEqual(weekly.index[0], pd.Timestamp('2024-01-15', tz='UTC'))
+
+        load_resampled(self.store, offline, 'BTC-USD', '1d', '2024-01-01', '2024-02-01', cache=self.cache)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_cache_follows_appends(self):
+        self.store.write('BTC-USD', '1h', make_bars('2024-01-01', '2024-01-05', freq='1h', tz='UTC'))
+        before = self.cache.get(self.store, 'BTC-USD', '1h', '1d')
+        self.store.append('BTC-USD', '1h', make_bars('2024-01-05', '2024-01-06', freq='1h', tz='UTC') + 1000)
+        after = self.cache.get(self.store, 'BTC-USD', '1h', '1d')
+        self.assertEqual((len(before), len(after)), (4, 5))
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_weekly_bars_come_from_daily_bars(self):
+        downloader = StubDownloader(make_bars('2023-01-01', '2025-01-01'))
+        weekly = load_resampled(self.store, downloader, 'AAPL', '1wk', '2024-01-01', '2024-07-01', cache=self.cache)
+        monthly = load_resampled(self.store, downloader, 'AAPL', '1mo', '2024-01-01', '2024-07-01', cache=self.cache)
+        self.assertEqual(len(weekly), 26)
+        self.assertEqual(len(monthly), 6)
+        self.assertEqual(downloader.calls, [('AAPL', '2024-01-01', '2024-07-01', '1d')])
+        self.assertIsNone(self.store.info('AAPL', '1wk'))
+
+    def test_fetch_stock_data_switches_interval_without_downloading(self):
+        today = pd.Timestamp.now().normalize()
+        downloader = StubDownloader(make_bars(today - pd.Timedelta(days=90), today, freq='1h', tz='UTC'))
+        hourly = fetch_stock_data('BTC', '1M', 'hour', store=self.store, downloader=downloader)
+        daily = fetch_stock_data('BTC', '1M', 'day', store=self.store, downloader=downloader)
+        fetch_stock_data('BTC', '1M', 'week', store=self.store, downloader=downloader)
+        self.assertEqual(len(downloader.calls), 1)
+        self.assertEqual(daily['Volume'].sum(), hourly['Volume'].sum())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import shutil
+import tempfile
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.market_data import MarketDataStore
+from app.utils.query_cache import QueryResultCache
+from app.utils.scanner import align_closes, last_bar_crossovers, scan_crossovers, scan_symbols, seconds_to_next_bar
+from app.utils.trading_strategy import momentum_trading_strategy
+from tests.test_crossover_engine import random_walk
+from tests.test_market_data import StubBatchDownloader, make_bars
+
+class TestScanCrossovers(unittest.TestCase):
+
+    def test_matches_momentum_trading_strategy_per_symbol(self):
+        frames = {}
+        for seed in range(200):
+            data = random_walk(rows=120, seed=seed)
+            # Symbols with missing bars and shorter histories
+            frames[f'SYM{seed}'] = data.iloc[seed % 7:].drop(data.index[50:50 + seed % 3])
+        frames['SHORT'] = random_walk(rows=6)
+
+        result = scan_crossovers(frames, 5, 20)
+        self.assertEqual(result['scanned'], 201)
+        matches = {match['symbol']: match for match in result['matches']}
+
+        for symbol, data in frames.items():
+            last = momentum_trading_strategy(data, 5, 20).iloc[-1]
+            if symbol in matches:
+                self.assertEqual(matches[symbol]['positions'], last['positions'])
+                self.assertEqual(matches[symbol]['timestamp'], data.index[-1].isoformat())
+                self.assertAlmostEqual(matches[symbol]['short_mavg'], last['short_mavg'])
+            else:
+                self.assertNotIn(last['positions'], (1.0, -1.0))
+        self.assertTrue(matches)
+
+    def test_no_crossovers_on_flat_prices(self):
+        frames = {}
+        for seed in range(50):
+            data = random_walk(rows=300, seed=seed)
+            # Stale quotes: the last price repeated for the last bars
+            data.iloc[-40:, 0] = round(data['Close'].iloc[-41], 2)
+            frames[f'SYM{seed}'] = data
+
+        _, _, closes = align_closes(frames)
+        state = last_bar_crossovers(closes, 5, 20)
+        np.testing.assert_array_equal(state['short_mavg'], closes[:, -1])
+        np.testing.assert_array_equal(state['long_mavg'], closes[:, -1])
+        self.assertEqual(scan_crossovers(frames, 5, 20)['matches'], [])
+
+        # A price far above the current ones does not leak rounding errors into later averages
+        close = random_walk(rows=300)['Close']
+        close.iloc[-21] = 1e12
+        state = last_bar_crossovers(close.to_numpy()[None, :], 5, 20)
+        for window, average in [(5, 'short_mavg'), (20, 'long_mavg')]:
+            np.testing.assert_allclose(state[average], close.rolling(window).mean().iloc[-1], rtol=1e-14)
+
+    def test_state_of_short_histories(self):
+        closes = np.array([[1.0, 2.0, np.nan], [np.nan, np.nan, np.nan]])
+        state = last_bar_crossovers(closes, 1, 2)
+        self.assertEqual(list(state['last']), [1, -1])
+        self.assertEqual(state['positions'][0], 1.0)
+        self.assertTrue(np.isnan(state['positions'][1]))
+
+class TestScanSymbols(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.store = MarketDataStore(self.root)
+
+    def test_cached_for_the_current_bar(self):
+        today = pd.Timestamp.now().normalize()
+        history = make_bars(today - pd.Timedelta(days=60), today)
+        history['Close'] = random_walk(rows=60)['Close'].to_numpy()
+        symbols = [f'SYM{i}' for i in range(30)]
+        downloader = StubBatchDownloader({symbol: history * (1 + i / 100) for i, symbol in enumerate(symbols)}, delay=0)
+        cache = QueryResultCache()
+
+        first = scan_symbols(symbols + ['MISSING'], '1M', 'day', store=self.store, downloader=downloader, cache=cache)
+        second = scan_symbols(symbols + ['MISSING'], '1M', 'day', store=self.store, downloader=downloader, cache=cache)
+        self.assertEqual(first, second)
+        self.assertEqual(first['missing'], ['MISSING'])
+        self.assertEqual(first['scanned'], 30)
+        self.assertEqual((cache.hits, len(downloader.calls)), (1, 1))
+
+        # A new stored bar is a new scan
+        bar = history.iloc[-1:] * 2
+        bar.index = bar.index + pd.Timedelta(days=1)
+        self.store.append('SYM0', '1d', bar)
+        scan_symbols(symbols + ['MISSING'], '1M', 'day', store=self.store, downloader=downloader, cache=cache)
+        self.assertEqual((cache.hits, len(downloader.calls)), (1, 2))
+
+    def test_next_bar_is_due_one_bar_after_the_last_stored_one(self):
+        now = time.time()
+        # Hourly equity bars start at :30
+        last = pd.Timestamp(now - 600, unit='s').floor('h') + pd.Timedelta(minutes=30)
+        if last.timestamp() > now:
+            last -= pd.Timedelta(hours=1)
+        self.assertAlmostEqual(seconds_to_next_bar([None, last.value], '1h'), last.timestamp() + 3600 - now, delta=5)
+        # Overdue (e.g. over a weekend): check again after one bar
+        self.assertEqual(seconds_to_next_bar([last.value - 86400 * 10**9], '1h'), 3600)
+        self.assertEqual(seconds_to_next_bar([None], '1d'), 86400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.signal_format import decode_signals, encode_signals
+from app.utils.trading_strategy import momentum_trading_strategy
+
+def hourly_prices(rows):
+    index = pd.date_range('2024-01-01', periods=rows, freq='h', tz='UTC')
+    return pd.DataFrame({'Close': 100 + np.random.default_rng(0).standard_normal(rows).cumsum()}, index=index)
+
+class TestSignalFormat(unittest.TestCase):
+
+    def test_round_trip(self):
+        signals = momentum_trading_strategy(hourly_prices(100))
+        decoded = decode_signals(encode_signals(signals))
+        self.assertEqual(list(decoded.columns), list(signals.columns))
+        self.assertTrue((decoded.index == signals.index.tz_localize(None)).all())
+        np.testing.assert_allclose(decoded.to_numpy(), signals.to_numpy(), rtol=1e-6)
+        # Warm-up NaNs of the moving averages survive
+        self.assertTrue(np.isnan(decoded['long_mavg'].iloc[0]))
+
+    def test_arrays_are_aligned(self):
+        body = encode_signals(momentum_trading_strategy(hourly_prices(10)))
+        header_end = 8 + int.from_bytes(body[4:8], 'little')
+        self.assertEqual(header_end % 8, 0)
+        self.assertEqual(len(body), header_end + 10 * 8 + 10 * 5 * 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.streaming_crossover import RollingMean, StreamingCrossover
+from app.utils.trading_strategy import momentum_trading_strategy
+from tests.test_crossover_engine import random_walk
+
+def stream_frame(data, short_window, long_window):
+    stream = StreamingCrossover(short_window, long_window)
+    rows = []
+    for timestamp, price in zip(data.index, data['Close']):
+        stream.update(timestamp, price)
+        rows.append(stream.last)
+    frame = pd.DataFrame(rows).set_index('timestamp')
+    frame.index.name = data.index.name
+    return frame
+
+class TestRollingMean(unittest.TestCase):
+
+    def test_bit_for_bit_equal_to_pandas(self):
+        rng = np.random.default_rng(3)
+        values = np.concatenate([rng.normal(0, 1e6, 300), np.full(30, 0.1), [np.nan], rng.normal(0, 1, 50)])
+        for window in [1, 2, 7, 50]:
+            rolling = RollingMean(window)
+            means = []
+            for value in values:
+                rolling.update(value)
+                means.append(rolling.mean)
+            expected = pd.Series(values).rolling(window).mean().to_numpy()
+            np.testing.assert_array_equal(np.array(means), expected)
+
+class TestStreamingCrossover(unittest.TestCase):
+
+    def test_equal_to_momentum_trading_strategy(self):
+        data = random_walk(rows=2000)
+        data.iloc[100:140, 0] = data['Close'].iloc[100]
+        for short_window, long_window in [(5, 20), (1, 3), (20, 100)]:
+            expected = momentum_trading_strategy(data, short_window, long_window)
+            pd.testing.assert_frame_equal(stream_frame(data, short_window, long_window), expected,
+                                          check_exact=True, check_freq=False)
+
+    def test_events_and_replaced_bars(self):
+        data = random_walk(rows=400)
+        stream = StreamingCrossover(5, 20)
+        events = stream.consume(data)
+        expected = momentum_trading_strategy(data, 5, 20)
+        crossovers = expected[expected['positions'].isin([1.0, -1.0])]
+        self.assertEqual([event['timestamp'] for event in events], list(crossovers.index))
+        self.assertEqual([event['positions'] for event in events], list(crossovers['positions']))
+
+        # A forming bar sent several times counts once, with its last price
+        last = data.index[-1] + pd.Timedelta(days=1)
+        for price in [1.0, 1e6, data['Close'].iloc[-1] * 1.01]:
+            stream.update(last, price)
+        extended = pd.concat([data, pd.DataFrame({'Close': [data['Close'].iloc[-1] * 1.01]}, index=[last])])
+        row = momentum_trading_strategy(extended, 5, 20).iloc[-1]
+        self.assertEqual(stream.bars, 401)
+        self.assertEqual((stream.last['short_mavg'], stream.last['long_mavg']), (row['short_mavg'], row['long_mavg']))
+
+        with self.assertRaises(ValueError):
+            stream.update(data.index[0], 100.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,17 +4,36 @@ const BACKEND_URL = 'https://eclipse-511z.onrender.com';
 
 export async function GET(req: NextRequest) {
   try {
-    const response = await fetch(`${BACKEND_URL}/api/dymension/help`);
+    // Forward the category filter and the client's cached ETag so the backend can answer 304
+    const category = req.nextUrl.searchParams.get('category');
+    const url = category
+      ? `${BACKEND_URL}/api/dymension/help?category=${encodeURIComponent(category)}`
+      : `${BACKEND_URL}/api/dymension/help`;
+    const ifNoneMatch = req.headers.get('if-none-match');
+    const response = await fetch(url, {
+      headers: ifNoneMatch ? { 'If-None-Match': ifNoneMatch } : {},
+    });
+
+    const cacheHeaders: Record<string, string> = {};
+    for (const name of ['etag', 'cache-control']) {
+      const value = response.headers.get(name);
+      if (value) cacheHeaders[name] = value;
+    }
+
+    if (response.status === 304) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
+
     const data = await response.json();
-    return NextResponse.json(data);
+    return NextResponse.json(data, { status: response.status, headers: cacheHeaders });
   } catch (error) {
     console.error('Error fetching help from backend:', error);
     return NextResponse.json(
-      { 
-        status: 'error', 
-        error: 'Failed to connect to backend server. Please ensure the backend is running.' 
+      {
+        status: 'error',
+        error: 'Failed to connect to backend server. Please ensure the backend is running.'
       },
       { status: 500 }
     );
   }
-} 
\ No newline at end of file
+}
@@ -7,7 +7,7 @@ export interface CommandParams {
 
 export interface CommandResult {
   status: string;
-  output: string;
+  output: string | Record<string, unknown>;
   raw_output?: string;
   error?: string;
 }
@@ -35,3 +35,86 @@ export const ping = async () => {
   }
 };
 
+
+// Strategy signals, one typed array per column (views into the response body, no copies)
+export interface Signals {
+  index: Float64Array; // milliseconds since the epoch
+  columns: Record<string, Float32Array>;
+}
+
+const SIGNALS_F32_MIMETYPE = 'application/x-float32-columns';
+
+// Decode the backend's float32 columns format (see backend/app/utils/signal_format.py)
+export const decodeSignals = (buffer: ArrayBuffer): Signals => {
+  const view = new DataView(buffer);
+  const magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 4));
+  if (magic !== 'F32C') {
+    throw new Error('Not a float32 columns payload');
+  }
+  const headerLength = view.getUint32(4, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+  const rows: number = header.rows;
+
+  let offset = 8 + headerLength;
+  const index = new Float64Array(buffer, offset, rows);
+  offset += rows * 8;
+  const columns: Record<string, Float32Array> = {};
+  for (const name of header.columns as string[]) {
+    columns[name] = new Float32Array(buffer, offset, rows);
+    offset += rows * 4;
+  }
+  return { index, columns };
+};
+
+// Momentum strategy signals, requested in the compact binary format
+export const getSignals = async (symbol: string, timeframe = '1M', interval = 'hour'): Promise<Signals> => {
+  try {
+    const params = new URLSearchParams({ symbol, timeframe, interval });
+    const response = await fetch(`${API_BASE_URL}/strategy/signals?${params}`, {
+      headers: { Accept: `${SIGNALS_F32_MIMETYPE}, application/json;q=0.5` },
+    });
+
+    if (!response.ok) {
+      throw new Error(`Error ${response.status}: ${response.statusText}`);
+    }
+
+    return decodeSignals(await response.arrayBuffer());
+  } catch (error) {
+    console.error('API Error:', error);
+    throw error;
+  }
+};
+
+export interface ScanMatch {
+  symbol: string;
+  timestamp: string;
+  price: number;
+  short_mavg: number;
+  long_mavg: number;
+  positions: number; // 1 buy, -1 sell
+}
+
+export interface ScanResult {
+  status: string;
+  bar: string | null;
+  scanned: number;
+  missing: string[];
+  matches: ScanMatch[];
+}
+
+// Symbols whose last bar is a momentum strategy crossover
+export const scanStrategy = async (symbols: string[], timeframe = '1M', interval = 'hour'): Promise<ScanResult> => {
+  try {
+    const params = new URLSearchParams({ symbols: symbols.join(','), timeframe, interval });
+    const response = await fetch(`${API_BASE_URL}/strategy/scan?${params}`);
+
+    if (!response.ok) {
+      throw new Error(`Error ${response.status}: ${response.statusText}`);
+    }
+
+    return await response.json();
+  } catch (error) {
+    console.error('API Error:', error);
+    throw error;
+  }
+};
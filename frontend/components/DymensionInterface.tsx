@@ -31,7 +31,7 @@ export interface Command {
 
 interface CommandResult {
   status: string;
-  output: string;
+  output: string | Record<string, unknown>;
   raw_output?: any;
   error?: string;
 }